@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tools.fs_walk import sorted_files
+
+
+@pytest.mark.parametrize("suffix", ["", ".mimo"])
+def test_sorted_files_matches_sorted_rglob(tmp_path: Path, suffix: str):
+    for name in ["b.mimo", "a-b.mimo", "a/b.mimo", "a/c/z.mimo", "x.txt", "d.mimo/y"]:
+        p = tmp_path / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x", encoding="utf-8")
+
+    expected = [str(p) for p in sorted(tmp_path.rglob("*" + suffix)) if p.is_file()]
+    assert sorted_files(tmp_path, suffix) == expected
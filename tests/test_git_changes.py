@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pygit2")
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def test_changed_files_pygit2_matches_git_cli(tmp_path: Path, monkeypatch):
+    from tools.git_changes import changed_files_pygit2
+    from tools.require_journal import changed_files
+
+    repo = tmp_path / "repo"
+    (repo / "tools").mkdir(parents=True)
+    _git(repo, "init", "-q")
+    body = "".join(f"line {i}\n" for i in range(50))
+    (repo / "tools" / "old.py").write_text(body, encoding="utf-8")
+    (repo / "tools" / "gone.py").write_text("x = 1\n", encoding="utf-8")
+    (repo / "README.md").write_text("a\n", encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+
+    _git(repo, "mv", "tools/old.py", "tools/new.py")  # rename
+    (repo / "tools" / "gone.py").unlink()  # delete
+    (repo / "README.md").write_text("b\n", encoding="utf-8")  # modify
+    (repo / "docs").mkdir()
+    (repo / "docs" / "LOG.md").write_text("- x\n", encoding="utf-8")  # add
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "head")
+
+    monkeypatch.chdir(repo)
+    cli = changed_files("HEAD~1", "HEAD")
+    assert "tools/old.py" not in cli  # the CLI reports a rename by its new path
+    assert sorted(changed_files_pygit2("HEAD~1", "HEAD")) == sorted(cli)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+
+from tools.json_io import dumps_bytes, dumps_sorted, dumps_text, loads_bytes
+
+
+def test_dumps_bytes_indent_matches_stdlib_layout():
+    obj = {"b": [1, 2.5, None, True], "a": {"k": "é"}, "e": [], "d": {}}
+    assert dumps_bytes(obj, indent=True) == (
+        json.dumps(obj, ensure_ascii=False, indent=2) + "\n"
+    ).encode("utf-8")
+
+
+def test_dumps_bytes_compact_lines_round_trip():
+    obj = {"task_id": "t_1", "n": 2**70, "params": {1: "x"}}
+    data = dumps_bytes(obj)
+    assert data.endswith(b"\n") and data.count(b"\n") == 1
+    assert json.loads(data) == {"task_id": "t_1", "n": 2**70, "params": {"1": "x"}}
+
+
+def test_dumps_sorted_matches_stdlib_compact_sorted():
+    obj = {"b": [1, None], "a": {"z": "é", "y": True}, "n": 2**70}
+    assert dumps_sorted(obj) == json.dumps(
+        obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+
+
+def test_dumps_text_keeps_key_order_compact():
+    obj = {"z": 1, "a": ["é", None]}
+    assert dumps_text(obj) == '{"z":1,"a":["é",null]}'
+
+
+def test_loads_bytes_accepts_what_stdlib_accepts():
+    assert loads_bytes(b'{"a": [1, "\\u00e9"]}') == {"a": [1, "é"]}
+    assert loads_bytes(b'{"n": NaN, "big": 100000000000000000000}')["big"] == 10**20
+
+
+def test_stream_jsonl_returns_digest_of_written_file(tmp_path, monkeypatch):
+    import hashlib
+
+    import tools.json_io as jio
+
+    monkeypatch.setattr(jio, "WRITE_CHUNK_BYTES", 64)
+    objs = [{"i": i, "s": "x" * i} for i in range(40)]
+    p = tmp_path / "out.jsonl"
+    sha = jio.stream_jsonl(p, objs)
+    data = p.read_bytes()
+    assert data == b"".join(dumps_bytes(o) for o in objs)
+    assert sha == "sha256:" + hashlib.sha256(data).hexdigest()
+    assert jio.stream_jsonl(p, []) == "sha256:" + hashlib.sha256(b"").hexdigest()
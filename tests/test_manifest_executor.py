@@ -78,3 +78,8 @@ def test_executor_runs_sync_manifest_apply_dry_run(tmp_path: Path):
         line for line in base.read_text(encoding="utf-8").splitlines() if line.strip()
     ]
     assert len(lines) == 1
+
+    results = [
+        json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [r["status"] for r in results] == ["OK"]
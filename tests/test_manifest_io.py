@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.manifest_io import append_jsonl, index_uri_by_sha256
+
+
+def test_index_uri_by_sha256_first_record_wins(tmp_path: Path):
+    p = tmp_path / "raw_manifest.jsonl"
+    append_jsonl(p, {"sha256": "sha256:aa", "uri": "vault://default/raw/a1"})
+    append_jsonl(p, {"sha256": "sha256:bb"})  # no uri
+    append_jsonl(p, {"sha256": "sha256:aa", "uri": "vault://default/raw/a2"})
+    append_jsonl(p, {"sha256": "sha256:bb", "uri": "vault://default/raw/b"})
+
+    assert dict(index_uri_by_sha256(p)) == {
+        "sha256:aa": "vault://default/raw/a1",
+        "sha256:bb": "vault://default/raw/b",
+    }
+    assert dict(index_uri_by_sha256(tmp_path / "missing.jsonl")) == {}
+
+
+def test_index_uri_by_sha256_skips_undecodable_lines(tmp_path: Path):
+    from tools.manifest_io import index_vault_uri_by_sha256
+
+    p = tmp_path / "raw_manifest.jsonl"
+    append_jsonl(p, {"sha256": "sha256:aa", "uri": "vault://default/raw/a"})
+    with p.open("ab") as f:
+        f.write(b'{"sha256": "sha256:xx", "uri": "vau\n')  # torn line
+        f.write(b"\xff\xfe not utf-8\n")
+    append_jsonl(p, {"sha256": "sha256:bb", "uri": "vault://default/raw/b"})
+
+    expected = {
+        "sha256:aa": "vault://default/raw/a",
+        "sha256:bb": "vault://default/raw/b",
+    }
+    assert dict(index_uri_by_sha256(p)) == expected
+    assert dict(index_vault_uri_by_sha256(p)) == expected
+
+
+def test_index_uri_by_sha256_cached_until_manifest_changes(tmp_path: Path):
+    p = tmp_path / "raw_manifest.jsonl"
+    append_jsonl(p, {"sha256": "sha256:aa", "uri": "vault://default/raw/a"})
+
+    idx1 = index_uri_by_sha256(p)
+    assert index_uri_by_sha256(p) is idx1
+
+    append_jsonl(p, {"sha256": "sha256:bb", "uri": "vault://default/raw/b"})
+    idx2 = index_uri_by_sha256(p)
+    assert idx2 is not idx1
+    assert idx2["sha256:bb"] == "vault://default/raw/b"
+
+
+def test_index_vault_uri_by_sha256_keeps_first_vault_targets_only(tmp_path: Path):
+    from tools.manifest_io import index_vault_uri_by_sha256
+
+    p = tmp_path / "raw_manifest.jsonl"
+    append_jsonl(p, {"sha256": "sha256:aa", "uri": "vault://default/raw/a"})
+    append_jsonl(p, {"sha256": "sha256:bb", "uri": "file:///tmp/b"})
+    append_jsonl(p, {"sha256": "sha256:bb", "uri": "vault://default/raw/b"})
+
+    assert dict(index_vault_uri_by_sha256(p)) == {"sha256:aa": "vault://default/raw/a"}
+    assert index_vault_uri_by_sha256(p) is index_vault_uri_by_sha256(p)
+
+
+def test_manifest_writer_matches_append_jsonl(tmp_path: Path):
+    from tools.manifest_io import ManifestWriter
+
+    recs = [
+        {"sha256": f"sha256:{i}", "uri": f"vault://default/raw/é{i}"} for i in range(3)
+    ]
+    a = tmp_path / "a.jsonl"
+    append_jsonl(a, {"sha256": "sha256:x"})
+    for r in recs:
+        append_jsonl(a, r)
+
+    b = tmp_path / "sub" / "b.jsonl"
+    append_jsonl(b, {"sha256": "sha256:x"})
+    with ManifestWriter(b) as w:
+        for r in recs:
+            w.write(r)
+    assert a.read_bytes() == b.read_bytes()
@@ -40,3 +40,30 @@ def test_manifest_schema_validation_if_jsonschema_available(repo_root: Path):
             "ingested_at": "2026-02-21T00:00:00Z",
         }
     )
+
+
+def test_doctor_manifest_reports_line_numbers(repo_root: Path, tmp_path: Path):
+    pytest.importorskip("jsonschema")
+    from tools.vault_doctor import doctor_manifest
+
+    good = {
+        "raw_id": "sha256:" + "0" * 64,
+        "uri": "vault://default/raw/2026/02/21/foo.md",
+        "sha256": "sha256:" + "0" * 64,
+        "size_bytes": 1,
+        "mtime": None,
+        "mime": "text/plain",
+        "ingested_at": "2026-02-21T00:00:00Z",
+    }
+    manifest = tmp_path / "raw_manifest.jsonl"
+    manifest.write_text(
+        json.dumps(good) + "\n\n{not json\n" + json.dumps({"raw_id": 1}) + "\n",
+        encoding="utf-8",
+    )
+    errors = doctor_manifest(
+        manifest,
+        repo_root / "docs" / "contracts" / "raw_manifest_line_v0_1.schema.json",
+    )
+    assert len(errors) == 2
+    assert errors[0].startswith("line 3: invalid json")
+    assert errors[1].startswith("line 4: schema error")
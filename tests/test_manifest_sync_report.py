@@ -112,3 +112,48 @@ def test_sync_detects_id_collision_different_sha(tmp_manifests):
     r = analyze_sync(kind="mu", base_path=base, incoming_path=inc)
     types = {c["type"] for c in r["conflicts"]}
     assert "ID_COLLISION_DIFFERENT_SHA" in types
+
+
+def test_manifest_sync_tasks_cli_writes_jsonl(tmp_path: Path):
+    from tools.manifest_sync_tasks import main
+
+    report = tmp_path / "report.json"
+    report.write_text(
+        json.dumps(
+            {
+                "kind": "raw",
+                "base": {"path": "b.jsonl"},
+                "incoming": {"path": "i.jsonl"},
+                "conflicts": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    out = tmp_path / "out" / "tasks.jsonl"
+    assert main(["--report", str(report), "--out", str(out)]) == 0
+    types = [json.loads(line)["type"] for line in out.read_text("utf-8").splitlines()]
+    assert types == ["VERIFY_MANIFEST", "VERIFY_MANIFEST", "SYNC_MANIFEST_APPLY"]
+
+
+def test_iter_tasks_from_report_matches_list():
+    from tools.manifest_sync_tasks import iter_tasks_from_report, tasks_from_report
+
+    report = {
+        "kind": "raw",
+        "base": {"path": "b.jsonl"},
+        "incoming": {"path": "i.jsonl"},
+        "conflicts": [
+            {"type": "SHA_COLLISION_DIFFERENT_URI", "key": "sha256:x"},
+            {"type": "SCHEMA_ERROR", "line": 3},
+        ],
+    }
+
+    def strip(ts):  # task_id/created_at differ per call
+        return [(t["type"], t["idempotency_key"], t["params"]) for t in ts]
+
+    it = iter_tasks_from_report(report)
+    assert next(it)["type"] == "VERIFY_MANIFEST"
+    assert strip(iter_tasks_from_report(report)) == strip(tasks_from_report(report))
+    assert tasks_from_report(report)[-1]["params"]["manual_conflicts"] == [
+        {"type": "SCHEMA_ERROR", "line": 3}
+    ]
@@ -87,3 +87,76 @@ def test_canonicalize_converges_multi_hop(tmp_path: Path):
     assert out == {"mu_C"}
     assert diag["folded_by_supersedes"] == 1
     assert diag["folded_by_corrects"] == 1
+
+
+def test_canonicalize_ignores_malformed_and_non_array_edges(tmp_path: Path):
+    db = tmp_path / "meta.sqlite"
+    init_db(db)
+    with connect(db) as conn:
+        conn.execute(
+            "INSERT INTO mu(mu_id, supersedes_json, corrects_json) VALUES (?, ?, ?)",
+            ("mu_bad", "[not json", '"mu_x"'),
+        )
+        conn.commit()
+    _ins_mu(db, mu_id="mu_dup", duplicate_of=[7, "mu_can"])
+
+    out, diag = canonicalize_mu_ids_single_hop(
+        db_path=db, mu_ids={"mu_x", "mu_dup", "mu_bad"}
+    )
+    assert out == {"mu_x", "7", "mu_bad"}
+    assert diag["malformed_edge_rows"] == 1
+
+
+def test_canonicalize_first_edge_wins(tmp_path: Path):
+    db = tmp_path / "meta.sqlite"
+    _ins_mu(db, mu_id="mu_first", supersedes=["mu_old"])
+    _ins_mu(db, mu_id="mu_second", supersedes=["mu_old"])
+
+    out, _ = canonicalize_mu_ids_single_hop(db_path=db, mu_ids={"mu_old"})
+    assert out == {"mu_first"}
+
+
+def test_canonicalize_loads_only_reachable_edges(tmp_path: Path):
+    db = tmp_path / "meta.sqlite"
+    _ins_mu(db, mu_id="mu_B", supersedes=["mu_A"])
+    _ins_mu(db, mu_id="mu_C", corrects=["mu_B"])
+    _ins_mu(db, mu_id="mu_Y", supersedes=["mu_X"])  # unrelated chain
+
+    out, diag = canonicalize_mu_ids_single_hop(db_path=db, mu_ids={"mu_A"})
+    assert out == {"mu_C"}
+    assert diag["traversed_supersedes_edges"] == 1
+    assert diag["traversed_corrects_edges"] == 1
+    assert diag["reverse_supersedes_size"] == diag["traversed_supersedes_edges"]
+    assert diag["reverse_corrects_size"] == diag["traversed_corrects_edges"]
+    assert diag["forward_duplicate_of_size"] == diag["traversed_duplicate_of_edges"]
+
+
+def test_canonicalize_follows_replaced_edges(tmp_path: Path):
+    db = tmp_path / "meta.sqlite"
+    _ins_mu(db, mu_id="mu_new", supersedes=["mu_old"])
+    _ins_mu(db, mu_id="mu_new", supersedes=["mu_other"])  # re-indexed row
+
+    out, _ = canonicalize_mu_ids_single_hop(db_path=db, mu_ids={"mu_old", "mu_other"})
+    assert out == {"mu_old", "mu_new"}
+
+
+def test_canonicalize_shared_chain_counts_per_start(tmp_path: Path):
+    db = tmp_path / "meta.sqlite"
+    # A -> B -> C (supersedes), D duplicate_of A, E tombstoned, F <-> G cycle
+    _ins_mu(db, mu_id="mu_B", supersedes=["mu_A"])
+    _ins_mu(db, mu_id="mu_C", supersedes=["mu_B"])
+    _ins_mu(db, mu_id="mu_D", duplicate_of=["mu_A"])
+    _ins_mu(db, mu_id="mu_E", tombstone=True)
+    _ins_mu(db, mu_id="mu_F", duplicate_of=["mu_G"])
+    _ins_mu(db, mu_id="mu_G", duplicate_of=["mu_F"])
+
+    out, diag = canonicalize_mu_ids_single_hop(
+        db_path=db, mu_ids={"mu_A", "mu_B", "mu_D", "mu_E", "mu_F"}
+    )
+    assert out == {"mu_C", "mu_F"}
+    # A: 2 hops, B: 1 hop, D: dup + 2 hops (memoized suffix still counted)
+    assert diag["folded_by_supersedes"] == 5
+    # D: 1, F: F->G->F (2 hops before the cycle is detected)
+    assert diag["folded_by_duplicate_of"] == 3
+    assert diag["tombstoned_excluded"] == 1
+    assert diag["cycles_detected"] == 1
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from tools.membership import load_effective_membership
+
+
+def _write_events(data_root: Path, lines: list[str], *, bom: bool = False) -> Path:
+    ws_dir = data_root / "workspaces"
+    ws_dir.mkdir(parents=True, exist_ok=True)
+    p = ws_dir / "membership.jsonl"
+    text = "\n".join(lines) + "\n"
+    p.write_bytes((b"\xef\xbb\xbf" if bom else b"") + text.encode("utf-8"))
+    return p
+
+
+def _ev(event: str, ws: str, mu_id: str) -> str:
+    return json.dumps({"event": event, "workspace_id": ws, "mu_id": mu_id})
+
+
+def test_load_effective_membership_add_remove_and_bom(tmp_path: Path):
+    data_root = tmp_path / "data"
+    _write_events(
+        data_root,
+        [
+            _ev("add", "ws_a", "mu_1"),
+            _ev("add", "ws_a", "mu_2"),
+            "",
+            "{not json",
+            _ev("add", "ws_b", "mu_3"),
+            _ev("remove", "ws_a", "mu_1"),
+        ],
+        bom=True,
+    )
+
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_2"}
+    assert diag.events_total == 5
+    assert diag.adds == 2
+    assert diag.removes == 1
+    assert diag.effective_count == 1
+
+
+def test_load_effective_membership_prefilter_tolerates_spacing(tmp_path: Path):
+    data_root = tmp_path / "data"
+    _write_events(
+        data_root,
+        [
+            '{"event":"add","workspace_id":"ws_a","mu_id":"mu_1"}',
+            '{"event": "add", "workspace_id" : "ws_a", "mu_id": "mu_2"}',
+            '{"event":"add","workspace_id":"ws_ab","mu_id":"mu_3"}',
+        ],
+    )
+
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_1", "mu_2"}
+    assert diag.events_total == 3
+
+
+def test_load_effective_membership_decodes_escaped_and_nested_events(tmp_path: Path):
+    data_root = tmp_path / "data"
+    _write_events(
+        data_root,
+        [
+            # escaped value
+            '{"event":"add","workspace_id":"ws_a","mu_id":"mu_\\u00e9"}',
+            # nested object (top-level keys win)
+            '{"event":"add","workspace_id":"ws_a","mu_id":"mu_2","meta":{"mu_id":"x"}}',
+            # non-string mu_id -> ignored
+            '{"event":"add","workspace_id":"ws_a","mu_id":5}',
+            # non-ASCII literal value
+            '{"event":"add","workspace_id":"ws_a","mu_id":"mu_中"}',
+        ],
+    )
+
+    eff, _ = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_é", "mu_2", "mu_中"}
+
+
+def test_load_effective_membership_skips_malformed_lines(tmp_path: Path):
+    data_root = tmp_path / "data"
+    _write_events(
+        data_root,
+        [
+            '{"event":"add","workspace_id":"ws_a","mu_id":"mu_1"}',
+            # not valid JSON: trailing comma, missing comma
+            '{"event":"add","workspace_id":"ws_a","mu_id":"mu_2",}',
+            '{"event":"add" "workspace_id":"ws_a","mu_id":"mu_3"}',
+            '{"event":"remove","workspace_id":"ws_a","mu_id":"mu_1",}',
+        ],
+    )
+
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_1"}
+    assert diag.events_total == 4
+    assert diag.adds == 1
+    assert diag.removes == 0
+
+
+def test_load_effective_membership_replays_appended_tail(tmp_path: Path):
+    data_root = tmp_path / "data"
+    p = _write_events(data_root, [_ev("add", "ws_a", "mu_1")], bom=True)
+
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_1"}
+
+    # caller-side mutation must not leak into the cache
+    eff.add("mu_bogus")
+
+    with p.open("ab") as f:
+        f.write((_ev("add", "ws_a", "mu_2") + "\n").encode("utf-8"))
+        # partial line (no newline yet) is applied but not committed
+        f.write(_ev("remove", "ws_a", "mu_1").encode("utf-8"))
+
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_2"}
+    assert diag.events_total == 3
+
+    with p.open("ab") as f:
+        f.write(b"\n" + (_ev("add", "ws_a", "mu_3") + "\n").encode("utf-8"))
+
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_2", "mu_3"}
+    assert (diag.events_total, diag.adds, diag.removes) == (4, 3, 1)
+
+
+def test_load_effective_membership_detects_rewrite(tmp_path: Path):
+    data_root = tmp_path / "data"
+    _write_events(data_root, [_ev("add", "ws_a", "mu_1"), _ev("add", "ws_a", "mu_2")])
+    eff, _ = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_1", "mu_2"}
+
+    # truncated/rewritten log -> full replay
+    _write_events(data_root, [_ev("add", "ws_a", "mu_9")])
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_9"}
+    assert diag.events_total == 1
+
+
+def test_load_effective_membership_ignores_unknown_events(tmp_path: Path):
+    data_root = tmp_path / "data"
+    _write_events(
+        data_root,
+        [
+            _ev("add", "ws_a", "mu_1"),
+            '{"event":["add"],"workspace_id":"ws_a","mu_id":"mu_2"}',
+            _ev("rename", "ws_a", "mu_3"),
+        ],
+    )
+
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_1"}
+    assert (diag.events_total, diag.adds, diag.removes) == (3, 1, 0)
+
+
+def test_load_effective_membership_latest_event_wins(tmp_path: Path):
+    data_root = tmp_path / "data"
+    _write_events(
+        data_root,
+        [
+            _ev("add", "ws_a", "mu_1"),
+            _ev("remove", "ws_a", "mu_1"),
+            _ev("add", "ws_a", "mu_1"),
+            _ev("remove", "ws_a", "mu_2"),
+            _ev("add", "ws_a", "mu_3"),
+            _ev("remove", "ws_a", "mu_3"),
+        ],
+    )
+
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_1"}
+    assert (diag.adds, diag.removes) == (3, 3)
+
+
+def test_load_effective_membership_snapshot_then_tail(tmp_path: Path, monkeypatch):
+    from tools import membership
+
+    monkeypatch.setattr(membership, "_SNAPSHOT_MIN_BYTES", 0)
+    data_root = tmp_path / "data"
+    p = _write_events(
+        data_root, [_ev("add", "ws_a", "mu_1"), _ev("add", "ws_a", "mu_2")]
+    )
+
+    load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    snap = membership.snapshot_path(data_root, "ws_a")
+    assert snap.exists()
+
+    with p.open("ab") as f:
+        f.write((_ev("remove", "ws_a", "mu_1") + "\n").encode("utf-8"))
+
+    # new process: no in-memory state, snapshot + tail replay
+    membership._REPLAY_CACHE.clear()
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_2"}
+    assert (diag.events_total, diag.adds, diag.removes) == (3, 2, 1)
+
+    # rewritten log invalidates the snapshot
+    _write_events(data_root, [_ev("add", "ws_a", "mu_9"), _ev("add", "ws_a", "mu_8")])
+    membership._REPLAY_CACHE.clear()
+    eff, diag = load_effective_membership(data_root=data_root, workspace_id="ws_a")
+    assert eff == {"mu_8", "mu_9"}
+    assert diag.events_total == 2
+
+
+def test_write_snapshot_concurrent_writers_use_own_tmp_files(tmp_path: Path):
+    import json
+    import threading
+
+    from tools import membership
+
+    snap = tmp_path / "membership.ws_a.snapshot.json"
+    errors: list[BaseException] = []
+
+    def writer(n: int) -> None:
+        state = membership._ReplayState(offset=n, effective={f"mu_{n}"})
+        try:
+            for _ in range(50):
+                membership.write_snapshot(snap, workspace_id="ws_a", state=state)
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    obj = json.loads(snap.read_text(encoding="utf-8"))
+    assert obj["effective"] == [f"mu_{obj['offset']}"]
+    assert [p.name for p in tmp_path.iterdir()] == [snap.name]
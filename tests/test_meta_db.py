@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from tools.meta_db import connect, init_db
+
+
+def test_connect_reuses_connection_with_wal(tmp_path: Path):
+    db = tmp_path / "index" / "meta.sqlite"
+    init_db(db)
+
+    c1 = connect(db)
+    c2 = connect(db)
+    assert c1 is c2
+    assert c1.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+    assert c1.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_connect_is_per_thread(tmp_path: Path):
+    import threading
+
+    db = tmp_path / "meta.sqlite"
+    init_db(db)
+    main = connect(db)
+
+    seen: dict[str, object] = {}
+
+    def worker() -> None:
+        seen["a"] = connect(db)
+        seen["b"] = connect(db)
+        init_db(db)
+        seen["rows"] = seen["a"].execute("SELECT count(*) FROM mu").fetchone()[0]
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+    assert seen["a"] is seen["b"]
+    assert seen["a"] is not main
+    assert seen["rows"] == 0
+
+
+def test_connect_closes_evicted_connections(tmp_path: Path):
+    import sqlite3
+
+    import tools.meta_db as m
+
+    first = connect(tmp_path / "db0.sqlite")
+    for i in range(1, m._CONN_CACHE_MAX + 1):
+        connect(tmp_path / f"db{i}.sqlite")
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="open sqlite files cannot be unlinked on Windows"
+)
+def test_connect_reopens_when_db_file_recreated(tmp_path: Path):
+    db = tmp_path / "meta.sqlite"
+    init_db(db)
+    c1 = connect(db)
+
+    for p in tmp_path.glob("meta.sqlite*"):
+        p.unlink()
+    init_db(db)
+
+    c2 = connect(db)
+    assert c2 is not c1
+    assert c2.execute("SELECT count(*) FROM mu").fetchone()[0] == 0
+
+
+def test_init_db_adds_missing_migration_columns(tmp_path: Path):
+    db = tmp_path / "meta.sqlite"
+    conn = connect(db)
+    # pre-migration mu table (no supersedes_json / duplicate_of_json)
+    conn.execute(
+        """
+        CREATE TABLE mu (
+          mu_id TEXT PRIMARY KEY, time TEXT, summary TEXT, content_hash TEXT,
+          mu_key TEXT, privacy_level TEXT, corrects_json TEXT, tombstone_json TEXT,
+          source_kind TEXT, source_note TEXT, path TEXT, mtime REAL
+        )
+        """
+    )
+    conn.commit()
+
+    init_db(db)
+    cols = {r[1] for r in connect(db).execute("PRAGMA table_info(mu)")}
+    assert {"supersedes_json", "duplicate_of_json"} <= cols
+
+
+def test_init_db_backfills_mu_edge_for_existing_rows(tmp_path: Path):
+    db = tmp_path / "meta.sqlite"
+    conn = connect(db)
+    # DB indexed before mu_edge existed
+    conn.execute(
+        """
+        CREATE TABLE mu (
+          mu_id TEXT PRIMARY KEY, time TEXT, summary TEXT, content_hash TEXT,
+          mu_key TEXT, privacy_level TEXT, corrects_json TEXT, tombstone_json TEXT,
+          source_kind TEXT, source_note TEXT, path TEXT, mtime REAL
+        )
+        """
+    )
+    conn.execute(
+        "INSERT INTO mu(mu_id, corrects_json) VALUES ('mu_b', '[\"mu_a\", 7, {}]')"
+    )
+    conn.execute("INSERT INTO mu(mu_id, corrects_json) VALUES ('mu_c', 'not json')")
+    conn.commit()
+
+    init_db(db)
+    rows = connect(db).execute(
+        "SELECT dst, kind, owner, head FROM mu_edge ORDER BY dst"
+    )
+    assert [tuple(r) for r in rows] == [
+        ("7", "corrects", "mu_b", "mu_b"),
+        ("mu_a", "corrects", "mu_b", "mu_b"),
+    ]
+
+
+def test_init_db_runs_once_per_connection_and_reset_rebuilds(tmp_path: Path):
+    import tools.meta_db as m
+
+    db = tmp_path / "meta.sqlite"
+    init_db(db)
+    conn = connect(db)
+    assert m._LOCAL.inited.get(id(conn)) is conn
+    conn.execute("INSERT INTO mu(mu_id) VALUES ('mu_a')")
+    conn.commit()
+
+    init_db(db)  # no-op
+    m.reset_db(db)
+    assert conn.execute("SELECT count(*) FROM mu").fetchone()[0] == 0
+    assert m._LOCAL.inited.get(id(conn)) is conn
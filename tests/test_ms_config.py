@@ -20,3 +20,21 @@ def test_ms_config_defaults_paths(tmp_path: Path):
         "raw_manifest_path"
     ].endswith("manifests/raw_manifest.jsonl")
     assert cfg["mu_root"].endswith("\\mu") or cfg["mu_root"].endswith("/mu")
+
+
+def test_ms_config_reload_on_change_and_isolated_copies(tmp_path: Path):
+    from tools.ms_config import load_config
+
+    cfg_path = tmp_path / "ms_config.json"
+    cfg_path.write_text(
+        json.dumps({"vault_roots": {"default": "v1"}}), encoding="utf-8"
+    )
+
+    cfg = load_config(cfg_path)
+    cfg["vault_roots"]["default"] = "mutated"
+    assert load_config(cfg_path)["vault_roots"]["default"] == "v1"
+
+    cfg_path.write_text(
+        json.dumps({"vault_roots": {"default": "v2_longer"}}), encoding="utf-8"
+    )
+    assert load_config(cfg_path)["vault_roots"]["default"] == "v2_longer"
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+
+def test_new_mu_ids_are_unique_within_a_second():
+    from tools.mu_rewrite import new_mu_id
+
+    ids = {new_mu_id() for _ in range(50)}
+    assert len(ids) == 50
+    assert all(re.fullmatch(r"mu_migr_\d{14}_[0-9a-f]{10}", i) for i in ids)
+
+
+def test_rewrite_mu_pointer_writes_superseding_copy(tmp_path: Path):
+    from tools.mu_rewrite import rewrite_mu_pointer, yaml_load
+
+    src = tmp_path / "mu_A.mimo"
+    src.write_text(
+        "mu_id: mu_A\nsummary: keep\npointer:\n"
+        "  - uri: file:///a\n    sha256: s1\n  - uri: file:///b\n    sha256: s2\n"
+        "links:\n  supersedes: mu_0\n",
+        encoding="utf-8",
+    )
+    before = src.read_bytes()
+
+    new_id, new_path, changed = rewrite_mu_pointer(
+        src,
+        sha256="s1",
+        new_uri="vault://default/raw/a",
+        supersedes_id="mu_A",
+        out_dir=tmp_path / "out",
+    )
+    assert changed == 1
+    assert src.read_bytes() == before
+    assert new_path == tmp_path / "out" / f"{new_id}.mimo"
+    assert yaml_load(new_path.read_bytes()) == {
+        "mu_id": new_id,
+        "summary": "keep",
+        "pointer": [
+            {"uri": "vault://default/raw/a", "sha256": "s1"},
+            {"uri": "file:///b", "sha256": "s2"},
+        ],
+        "links": {"supersedes": ["mu_0", "mu_A"]},
+    }
+
+    src.write_text("- not a mapping\n", encoding="utf-8")
+    assert (
+        rewrite_mu_pointer(
+            src, sha256="s1", new_uri="x", supersedes_id="mu_A", out_dir=tmp_path
+        )
+        is None
+    )
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def test_write_helpers_create_missing_parents(tmp_path: Path):
+    import hashlib
+
+    from tools.pipeline_io import write_json, write_jsonl
+
+    j = tmp_path / "a" / "b" / "x.json"
+    jl = tmp_path / "c" / "x.jsonl"
+    sha_j = write_json(j, {"k": 1})
+    sha_jl = write_jsonl(jl, [{"k": 1}, {"k": 2}])
+
+    assert sha_j == "sha256:" + hashlib.sha256(j.read_bytes()).hexdigest()
+    assert sha_jl == "sha256:" + hashlib.sha256(jl.read_bytes()).hexdigest()
+    assert len(jl.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_input_sha256s_async_matches_serial(tmp_path: Path):
+    from tools.pipeline_io import input_sha256s, input_sha256s_async
+
+    a = tmp_path / "a.jsonl"
+    a.write_text('{"x": 1}\n', encoding="utf-8")
+    paths = (str(a), str(tmp_path / "missing.jsonl"), str(a))
+
+    collect = input_sha256s_async(*paths)
+    assert collect() == input_sha256s(*paths)
+    assert collect()[str(tmp_path / "missing.jsonl")] is None
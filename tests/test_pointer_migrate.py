@@ -49,3 +49,102 @@ def test_pointer_migrate_creates_superseding_mu(tmp_path: Path):
     assert "vault://default/raw/2026/02/hello.txt" in new_text
     assert "supersedes" in new_text
     assert "mu_OLD" in new_text
+
+
+def test_migrate_many_parallel_keeps_input_order(tmp_path: Path):
+    from tools.manifest_io import append_jsonl
+    from tools.pointer_migrate import migrate_many
+
+    sha = "a" * 64
+    manifest_p = tmp_path / "raw_manifest.jsonl"
+    append_jsonl(manifest_p, {"sha256": sha, "uri": "vault://default/raw/a.txt"})
+
+    mu_dir = tmp_path / "mu"
+    mu_dir.mkdir()
+    paths = []
+    for i in range(3):
+        p = mu_dir / f"mu_{i}.mimo"
+        p.write_text(
+            f"mu_id: mu_{i}\npointer:\n  - uri: file:///tmp/a.txt\n    sha256: {sha}\n",
+            encoding="utf-8",
+        )
+        paths.append(p)
+
+    results = migrate_many(
+        paths, raw_manifest_path=manifest_p, out_dir=tmp_path / "out", workers=2
+    )
+    assert [r.source_mu_id for r in results] == ["mu_0", "mu_1", "mu_2"]
+    assert all(
+        r.changed_pointers[0].new_uri == "vault://default/raw/a.txt" for r in results
+    )
+
+
+def test_parse_mu_keys_reads_only_requested_blocks():
+    from tools.pointer_migrate import _parse_mu_keys
+
+    keys = frozenset({b"mu_id", b"pointer"})
+    text = (
+        b"# header\nmu_id: mu_A\nsummary: |\n  long\n  body\npointer:\n"
+        b"- uri: file:///a\n  sha256: abc\nlinks:\n  supersedes: []\n"
+    )
+    assert _parse_mu_keys(text, keys) == {
+        "mu_id": "mu_A",
+        "pointer": [{"uri": "file:///a", "sha256": "abc"}],
+    }
+    # anything but a plain block mapping falls back to a full parse
+    assert _parse_mu_keys(b"---\n" + text, keys) is None
+    assert _parse_mu_keys(b'"mu_id": mu_A\n', keys) is None
+    assert _parse_mu_keys(b"summary: x\n", keys) is None
+    assert _parse_mu_keys(b"mu_id: x\npointer: *ref\n", keys) is None
+
+
+def test_pointer_migrate_skips_mu_without_legacy_pointers(tmp_path: Path):
+    from tools.pointer_migrate import migrate_mu_pointers
+
+    mu_path = tmp_path / "mu_V.mimo"
+    mu_path.write_text(
+        "mu_id: mu_V\npointer:\n  - uri: vault://default/raw/a.txt\n    sha256: x\n"
+        "snapshot:\n  payload:\n    text: " + "x" * 100_000 + "\n",
+        encoding="utf-8",
+    )
+    manifest_p = tmp_path / "raw_manifest.jsonl"
+    manifest_p.write_text("", encoding="utf-8")
+    out_dir = tmp_path / "out"
+    assert (
+        migrate_mu_pointers(mu_path, raw_manifest_path=manifest_p, out_dir=out_dir)
+        is None
+    )
+
+
+def test_legacy_uri_prescan():
+    from tools.pointer_migrate import _LEGACY_URI_RE
+
+    assert _LEGACY_URI_RE.search(b"pointer:\n  - uri: vault://d/raw/a\n") is None
+    assert _LEGACY_URI_RE.search(b"pointer:\n  - uri: 'vault://d/raw/a'\n") is None
+    assert _LEGACY_URI_RE.search(b"pointer:\n  - uri: file:///a\n")
+    assert _LEGACY_URI_RE.search(b'pointer: [{uri: "C:/a", sha256: x}]\n')
+    assert _LEGACY_URI_RE.search(b"pointer:\n  - uri:\n      /abs/a\n")
+
+
+def test_pointer_migrate_mmaps_large_mu(tmp_path: Path, monkeypatch):
+    import tools.pointer_migrate as pm
+
+    monkeypatch.setattr(pm, "_MMAP_MIN_BYTES", 1)
+    sha = "b" * 64
+    manifest_p = tmp_path / "raw_manifest.jsonl"
+    manifest_p.write_text(
+        f'{{"sha256": "{sha}", "uri": "vault://default/raw/b.txt"}}\n',
+        encoding="utf-8",
+    )
+    mu_path = tmp_path / "mu_L.mimo"
+    mu_path.write_text(
+        "mu_id: mu_L\nsummary: 'héllo'\npointer:\n"
+        f"  - uri: file:///tmp/b.txt\n    sha256: {sha}\n",
+        encoding="utf-8",
+    )
+    res = pm.migrate_mu_pointers(
+        mu_path, raw_manifest_path=manifest_p, out_dir=tmp_path / "out"
+    )
+    assert res is not None
+    new_text = res.new_mu_path.read_text(encoding="utf-8")
+    assert "vault://default/raw/b.txt" in new_text and "héllo" in new_text
@@ -65,3 +65,79 @@ def test_pointer_resolve_legacy_uri_via_manifest(tmp_path: Path):
     assert out.uri == "vault://default/raw/2026/02/b.txt"
     assert out.snippet == "hello"
     assert out.diagnostics.get("resolved_via_manifest") is True
+
+
+def test_read_line_range_streams_lines(tmp_path: Path):
+    from tools.pointer_resolve import _read_line_range
+
+    p = tmp_path / "a.txt"
+    p.write_bytes(b"l1\r\nl2\n\nl4\rl5")
+    assert _read_line_range(p, start=2, end=3) == "l2\n"
+    assert _read_line_range(p, start=4, end=9) == "l4\nl5"
+    assert _read_line_range(p, start=7, end=9) == ""
+
+
+_SPLITLINES_TEXT = "a\nb\x0cc\u2028d\ne\x85f\x1cg\x1dh\x1ei\u2029j\x0bk\r\nl\rm"
+
+
+def test_read_line_range_uses_splitlines_boundaries(tmp_path: Path):
+    from tools.pointer_resolve import _read_line_range
+
+    p = tmp_path / "a.txt"
+    p.write_text(_SPLITLINES_TEXT, encoding="utf-8", newline="")
+    lines = p.read_text(encoding="utf-8").splitlines()
+    assert _read_line_range(p, start=2, end=3) == "b\nc"
+    for start in range(1, len(lines) + 2):
+        for end in range(start, len(lines) + 2):
+            expected = "\n".join(lines[start - 1 : end])
+            assert _read_line_range(p, start=start, end=end) == expected
+
+
+def test_hash_and_read_line_range_matches_separate_reads(tmp_path: Path, monkeypatch):
+    import tools.pointer_resolve as pr
+    from tools.vault_ops import sha256_file
+
+    monkeypatch.setattr(pr, "_HASH_CHUNK", 7)
+    p = tmp_path / "a.txt"
+    p.write_bytes(
+        "l1\r\nl2 é\n\nl4\rl5\n".encode() + b"x\n" * 50 + _SPLITLINES_TEXT.encode()
+    )
+    for start, end in [(1, 1), (2, 4), (4, 6), (50, 60), (54, 70), (99, 100)]:
+        assert pr._hash_and_read_line_range(p, start=start, end=end) == (
+            sha256_file(p),
+            pr._read_line_range(p, start=start, end=end),
+        )
+
+
+def test_pointer_resolve_caches_sha256_by_file_identity(tmp_path: Path, monkeypatch):
+    import os
+
+    import tools.pointer_resolve as pr
+    from tools.vault_ops import sha256_file
+
+    vault_root = tmp_path / "vault"
+    p = vault_root / "raw" / "c.txt"
+    p.parent.mkdir(parents=True)
+    p.write_text("a\nb\n", encoding="utf-8")
+    pointer = {
+        "uri": "vault://default/raw/c.txt",
+        "sha256": sha256_file(p),
+        "locator": {"kind": "line_range", "start": 2, "end": 2},
+    }
+    roots = {"default": str(vault_root)}
+    assert pr.resolve_pointer(pointer, vault_roots=roots).snippet == "b"
+
+    def _no_rehash(*a, **k):
+        raise AssertionError("re-hashed an unchanged file")
+
+    monkeypatch.setattr(pr, "_hash_and_read_line_range", _no_rehash)
+    monkeypatch.setattr(pr, "sha256_file", _no_rehash)
+    out = pr.resolve_pointer(pointer, vault_roots=roots)
+    assert out.ok is True and out.snippet == "b"
+    monkeypatch.undo()
+
+    st = p.stat()
+    p.write_text("a\nB\n", encoding="utf-8")
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    out = pr.resolve_pointer(pointer, vault_roots=roots)
+    assert out.ok is False and out.diagnostics["error"] == "sha256 mismatch"
@@ -37,3 +37,28 @@ def test_export_share_policy_allows_when_explicit_true():
         "allow_pointer": True,
         "allow_snapshot": True,
     }
+
+
+def test_ensure_privacy_defaults_returns_independent_copy():
+    mu = {"mu_id": "mu_x", "snapshot": {"payload": {"text": "hi"}}, "links": {1: "a"}}
+    out = ensure_privacy_defaults(mu)
+    out["snapshot"]["payload"] = {}
+    out["privacy"]["pii"].append("email")
+    assert mu["snapshot"]["payload"] == {"text": "hi"}
+    assert "privacy" not in mu
+    assert out["links"] == {1: "a"}
+    assert ensure_privacy_defaults({"mu_id": "mu_y"})["privacy"]["pii"] == []
+
+
+def test_ensure_privacy_defaults_keeps_yaml_datetimes():
+    from datetime import UTC, datetime
+
+    t = datetime(2026, 2, 20, tzinfo=UTC)
+    out = ensure_privacy_defaults({"mu_id": "mu_x", "meta": {"time": t}})
+    assert out["meta"]["time"] == t
+
+
+def test_ensure_privacy_defaults_keeps_big_ints():
+    big = 2**70
+    out = ensure_privacy_defaults({"mu_id": "mu_x", "meta": {"n": big}})
+    assert out["meta"]["n"] == big
@@ -105,3 +105,16 @@ snapshot:
     assert (runs[0] / "bundle.json").exists()
     assert (runs[0] / "tasks").exists()
     assert (runs[0] / "task_results.jsonl").exists()
+
+
+def test_iter_task_specs_sorted_and_skips_bad(tmp_path: Path):
+    from tools.run_bundle_repair_pipeline import iter_task_specs
+
+    (tmp_path / "b.task_spec.json").write_text('{"task_id": "b"}', encoding="utf-8")
+    (tmp_path / "a.task_spec.json").write_text('{"task_id": "a"}', encoding="utf-8")
+    (tmp_path / "c.task_spec.json").write_text("{not json", encoding="utf-8")
+    (tmp_path / "d.task_spec.json").write_text("[1]", encoding="utf-8")
+    (tmp_path / "e.json").write_text('{"task_id": "e"}', encoding="utf-8")
+    (tmp_path / "f.task_spec.json").write_bytes(b"")
+
+    assert [t["task_id"] for t in iter_task_specs(tmp_path)] == ["a", "b"]
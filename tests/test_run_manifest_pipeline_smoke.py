@@ -78,3 +78,21 @@ def test_pipeline_smoke(tmp_path: Path):
     patch_dir = run_dir / "patch_plans"
     assert patch_dir.exists()
     assert list(patch_dir.glob("*.patch_plan.json"))
+
+    # fingerprints are computed from the bytes written / inputs read once
+    import hashlib
+
+    def _sha(p: Path) -> str:
+        return "sha256:" + hashlib.sha256(p.read_bytes()).hexdigest()
+
+    rm = json.loads((run_dir / "run_manifest.json").read_text(encoding="utf-8"))
+    assert rm["inputs"]["base_sha256"] == _sha(base)
+    assert rm["inputs"]["incoming_sha256"] == _sha(inc)
+    assert rm["outputs"]["tasks_sha256"] == _sha(run_dir / "tasks.raw.jsonl")
+    assert rm["outputs"]["results_sha256"] == _sha(run_dir / "task_results.raw.jsonl")
+
+    # run_id and created_at come from the same clock read
+    from datetime import datetime
+
+    created = datetime.fromisoformat(rm["created_at"])
+    assert rm["run_id"] == created.strftime("RUN-%Y%m%d-%H%M%S") == run_dir.name
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.run_meta import _git_head_from_files
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+def _git_dir(root: Path, head: str) -> Path:
+    g = root / ".git"
+    g.mkdir()
+    (g / "HEAD").write_text(head + "\n", encoding="utf-8")
+    return g
+
+
+def test_git_head_from_loose_ref(tmp_path: Path):
+    g = _git_dir(tmp_path, "ref: refs/heads/main")
+    (g / "refs" / "heads").mkdir(parents=True)
+    (g / "refs" / "heads" / "main").write_text(SHA_A + "\n", encoding="utf-8")
+    assert _git_head_from_files(tmp_path) == SHA_A
+
+
+def test_git_head_from_packed_refs_and_detached(tmp_path: Path):
+    g = _git_dir(tmp_path, "ref: refs/heads/main")
+    (g / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        f"{SHA_B} refs/heads/dev\n{SHA_A} refs/heads/main\n^{SHA_B}\n",
+        encoding="utf-8",
+    )
+    assert _git_head_from_files(tmp_path) == SHA_A
+
+    (g / "HEAD").write_text(SHA_B + "\n", encoding="utf-8")
+    assert _git_head_from_files(tmp_path) == SHA_B
+
+
+def test_git_head_from_files_unknown_layouts(tmp_path: Path):
+    assert _git_head_from_files(tmp_path) is None  # no .git
+    _git_dir(tmp_path, "ref: refs/heads/unborn")
+    assert _git_head_from_files(tmp_path) is None
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from tools.schema_cache import validator_for
+
+
+def _write_schema(p: Path, required: list[str]) -> None:
+    p.write_text(json.dumps({"type": "object", "required": required}), encoding="utf-8")
+
+
+def test_validator_reused_until_schema_changes(tmp_path: Path):
+    p = tmp_path / "s.schema.json"
+    _write_schema(p, ["a"])
+    v1 = validator_for(p)
+    assert validator_for(str(p)) is v1
+    assert not v1.is_valid({})
+
+    _write_schema(p, [])
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    v2 = validator_for(p)
+    assert v2 is not v1
+    assert v2.is_valid({})
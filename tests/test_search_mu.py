@@ -69,3 +69,151 @@ def test_search_mu_fts_and_filters(tmp_path: Path):
 
     res4 = search_mu(db, privacy="public")
     assert [r.mu_id for r in res4] == ["mu_b"]
+
+
+def test_search_mu_main_prints_indented_json(tmp_path: Path, capsys):
+    import json
+
+    mu_root = tmp_path / "mu"
+    mu_root.mkdir()
+    _write_mu(mu_root / "a.mimo", "mu_a", "hello travel", "2026-01-01T00:00:00Z")
+
+    from tools.assign_membership import append_membership_events
+    from tools.index_mu import index_mu_dir
+    from tools.search_mu import main
+
+    db = tmp_path / "meta.sqlite"
+    index_mu_dir(mu_root, db, reset=True)
+    append_membership_events(
+        data_root=tmp_path, workspace="ws", mu_ids=["mu_a"], source="test"
+    )
+
+    argv = ["--db", str(db), "--data-root", str(tmp_path), "--workspace", "ws"]
+    assert main(argv + ["--query", "travel"]) == 0
+    out = capsys.readouterr().out
+    obj = json.loads(out)
+    assert [r["mu_id"] for r in obj["results"]] == ["mu_a"]
+    assert out.startswith('{\n  "db": ') and out.endswith("}\n")
+
+
+def test_search_mu_allow_list_fence_with_many_ids(tmp_path: Path):
+    mu_root = tmp_path / "mu"
+    mu_root.mkdir()
+    for mid, summary in [("mu_a", "hello travel"), ("mu_b", "travel plans")]:
+        _write_mu(mu_root / f"{mid}.mimo", mid, summary, "2026-01-01T00:00:00Z")
+
+    from tools.index_mu import index_mu_dir
+    from tools.search_mu import search_mu
+
+    db = tmp_path / "meta.sqlite"
+    index_mu_dir(mu_root, db, reset=True)
+
+    # well past the classic 999 bound on SQL variables
+    allow = {f"mu_other_{i}" for i in range(5000)} | {"mu_b"}
+    assert [r.mu_id for r in search_mu(db, query="travel", allow_mu_ids=allow)] == [
+        "mu_b"
+    ]
+    assert [r.mu_id for r in search_mu(db, query=None, allow_mu_ids=allow)] == ["mu_b"]
+    assert search_mu(db, query="travel", allow_mu_ids=set()) == []
+
+
+def test_search_mu_target_level_filter_fills_limit(tmp_path: Path):
+    mu_root = tmp_path / "mu"
+    mu_root.mkdir()
+    for i in range(3):  # newest rows are private
+        _write_mu(
+            mu_root / f"p{i}.mimo", f"mu_p{i}", "note", f"2026-02-0{i + 1}T00:00:00Z"
+        )
+    for i in range(2):
+        _write_mu(
+            mu_root / f"o{i}.mimo",
+            f"mu_o{i}",
+            "note",
+            f"2026-01-0{i + 1}T00:00:00Z",
+            privacy="public",
+        )
+
+    from tools.index_mu import index_mu_dir
+    from tools.search_mu import search_mu
+
+    db = tmp_path / "meta.sqlite"
+    index_mu_dir(mu_root, db, reset=True)
+
+    res = search_mu(db, target_level="public", limit=2)
+    assert [r.mu_id for r in res] == ["mu_o1", "mu_o0"]
+    assert len(search_mu(db, query="note", target_level="org", limit=10)) == 2
+    assert len(search_mu(db, query="note", target_level="private", limit=10)) == 5
+
+
+def test_search_mu_sql_text_is_stable_per_shape():
+    from tools.search_mu import _build_sql
+
+    a = _build_sql(True, False, True, False, False, 0, True, True)
+    b = _build_sql(True, False, True, False, False, 0, True, True)
+    assert a is b
+    assert ":q" in a and ":since" in a and ":allow_ids" in a
+    assert _build_sql(False, False, False, False, False, 2, False, False) != a
+
+
+def test_search_mu_punctuated_query_uses_fts_phrase(tmp_path: Path):
+    mu_root = tmp_path / "mu"
+    mu_root.mkdir()
+    _write_mu(mu_root / "a.mimo", "mu_a", "fix the e-mail parser", "2026-01-01")
+    _write_mu(mu_root / "b.mimo", "mu_b", "mail the parser e", "2026-01-02")
+    _write_mu(mu_root / "c.mimo", "mu_c", "去东京旅行", "2026-01-03")
+
+    from tools.index_mu import index_mu_dir
+    from tools.search_mu import search_mu
+
+    db = tmp_path / "meta.sqlite"
+    index_mu_dir(mu_root, db, reset=True)
+
+    # one phrase: tokens must be adjacent and in order; '"' is not syntax
+    res = search_mu(db, query='e-mail "parser')
+    assert [r.mu_id for r in res] == ["mu_a"]
+    res = search_mu(db, query="e-mail")
+    assert [r.mu_id for r in res] == ["mu_a"]
+    assert res[0].score is not None  # bm25, not the LIKE fallback
+    assert [r.mu_id for r in search_mu(db, query="东京")] == ["mu_c"]
+    assert search_mu(db, query="--") == []
+
+
+def test_make_snippet_with_precomputed_query_lower():
+    from tools.search_mu import _make_snippet
+
+    s = "x" * 300 + " Travel plans " + "y" * 300
+    a = _make_snippet(s, " TRAVEL ")
+    assert a == _make_snippet(s, " TRAVEL ", q_lower="travel")
+    assert a.startswith("…") and "Travel plans" in a and a.endswith("…")
+
+
+def test_search_mu_small_allow_list_drives_lookup(tmp_path: Path):
+    mu_root = tmp_path / "mu"
+    mu_root.mkdir()
+    for i in range(6):
+        _write_mu(
+            mu_root / f"m{i}.mimo",
+            f"mu_{i}",
+            f"note {i}",
+            f"2026-01-0{i + 1}T00:00:00Z",
+            tags=["t"] if i % 2 else [],
+            privacy="public" if i < 4 else "private",
+        )
+
+    from tools.index_mu import index_mu_dir
+    from tools.search_mu import search_mu
+
+    db = tmp_path / "meta.sqlite"
+    index_mu_dir(mu_root, db, reset=True)
+
+    allow = {"mu_1", "mu_2", "mu_3", "mu_5", "mu_missing"}
+    assert [r.mu_id for r in search_mu(db, allow_mu_ids=allow)] == [
+        "mu_5",
+        "mu_3",
+        "mu_2",
+        "mu_1",
+    ]
+    res = search_mu(db, allow_mu_ids=allow, tag="t", target_level="public", limit=1)
+    assert [r.mu_id for r in res] == ["mu_3"]
+    res = search_mu(db, query="note", allow_mu_ids=allow, since="2026-01-03")
+    assert sorted(r.mu_id for r in res) == ["mu_2", "mu_3", "mu_5"]
@@ -3,14 +3,14 @@ from pathlib import Path
 import yaml
 
 
-def test_search_mu_cjk_falls_back_to_like(tmp_path: Path):
+def _index_summary(tmp_path: Path, summary: str) -> Path:
     mu_root = tmp_path / "mu"
     mu_root.mkdir()
 
     mu = {
         "schema_version": "1.1",
         "mu_id": "mu_cjk",
-        "summary": "决策: 去旅行\n证据",
+        "summary": summary,
         "content_hash": "sha256:" + "0" * 64,
         "idempotency": {"mu_key": "sha256:" + "1" * 64},
         "meta": {
@@ -29,12 +29,15 @@ def test_search_mu_cjk_falls_back_to_like(tmp_path: Path):
 
     db = tmp_path / "meta.sqlite"
     index_mu_dir(mu_root, db, reset=True)
+    return db
+
 
+def _search(db: Path, query: str) -> list[str]:
     from tools.search_mu import search_mu
 
     res = search_mu(
         db,
-        query="决策",
+        query=query,
         since=None,
         until=None,
         tag=None,
@@ -43,4 +46,15 @@ def test_search_mu_cjk_falls_back_to_like(tmp_path: Path):
         include_snippet=False,
         limit=10,
     )
-    assert [r.mu_id for r in res] == ["mu_cjk"]
+    return [r.mu_id for r in res]
+
+
+def test_search_mu_cjk_falls_back_to_like(tmp_path: Path):
+    db = _index_summary(tmp_path, "决策: 去旅行\n证据")
+    assert _search(db, "决策") == ["mu_cjk"]
+
+
+def test_search_mu_kana_and_hangul_fall_back_to_like(tmp_path: Path):
+    db = _index_summary(tmp_path, "とても良いテスト、반갑습니다")
+    for q in ("とても", "テスト", "반갑"):
+        assert _search(db, q) == ["mu_cjk"], q
@@ -15,6 +15,21 @@ def test_task_journal_append_and_query(tmp_path: Path):
     assert rows[0]["task_id"] == "t1"
 
 
+def test_task_journal_append_tasks_batch(tmp_path: Path):
+    from tools.task_journal import append_tasks, load_task, query_tasks
+
+    db = tmp_path / "j.sqlite"
+    append_tasks(
+        db,
+        [
+            ({"task_id": f"t{i}", "type": "X"}, {"status": "OK"}, {"i": i})
+            for i in range(3)
+        ],
+    )
+    assert len(query_tasks(db, type="X")) == 3
+    assert load_task(db, "t2")[2] == {"i": 2}
+
+
 def test_task_journal_load_and_replay_smoke(tmp_path: Path):
     from tools.task_journal import append_task, load_task
 
@@ -37,3 +52,28 @@ def test_task_journal_load_and_replay_smoke(tmp_path: Path):
     assert s2["type"] == "VERIFY_MANIFEST"
     assert r2["status"] == "OK"
     assert ctx == {"vault_roots": {"default": "X"}, "run_id": "RUN-1", "run_dir": "D"}
+
+
+def test_journal_buffer_flushes_in_batches(tmp_path: Path, monkeypatch):
+    import tools.task_journal as tj
+
+    db = tmp_path / "j.sqlite"
+    batches: list[int] = []
+    real_append = tj.append_task_rows
+
+    def counting_append(db_path: Path, rows: list[dict]) -> None:
+        batches.append(len(rows))
+        real_append(db_path, rows)
+
+    monkeypatch.setattr(tj, "append_task_rows", counting_append)
+
+    buf = tj.JournalBuffer(db, context={"run_id": "RUN-1"}, batch_size=2)
+    for i in range(5):
+        buf.add({"task_id": f"t{i}", "type": "X"}, {"status": "OK", "elapsed_ms": i})
+    buf.flush()
+
+    assert batches == [2, 2, 1]
+    rows = tj.query_tasks(db, type="X", limit=10)
+    assert sorted(r["task_id"] for r in rows) == [f"t{i}" for i in range(5)]
+    _, _, ctx = tj.load_task(db, "t3")
+    assert ctx == {"run_id": "RUN-1"}
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from tools.task_pool import exec_in_order
+
+
+def test_exec_in_order_keeps_input_order_with_threads():
+    tasks = [{"task_id": f"t{i}", "delay": (5 - i) * 0.01} for i in range(6)]
+
+    def run(t: dict) -> dict:
+        time.sleep(t["delay"])
+        return {"task_id": t["task_id"]}
+
+    pairs = list(exec_in_order(tasks, run, workers=4))
+    assert [t["task_id"] for t, _ in pairs] == [t["task_id"] for t in tasks]
+    assert [r["task_id"] for _, r in pairs] == [t["task_id"] for t in tasks]
+
+
+def test_exec_in_order_serial_task_waits_for_earlier_tasks():
+    lock = threading.Lock()
+    done: list[str] = []
+
+    def run(t: dict) -> dict:
+        if t["type"] == "APPLY":
+            with lock:
+                return {"task_id": t["task_id"], "seen": sorted(done)}
+        time.sleep(0.02)
+        with lock:
+            done.append(t["task_id"])
+        return {"task_id": t["task_id"]}
+
+    tasks = [{"task_id": f"v{i}", "type": "VERIFY"} for i in range(3)]
+    tasks.append({"task_id": "apply", "type": "APPLY"})
+    results = [
+        r
+        for _, r in exec_in_order(
+            tasks, run, workers=3, serial=lambda t: t["type"] == "APPLY"
+        )
+    ]
+    assert results[-1] == {"task_id": "apply", "seen": ["v0", "v1", "v2"]}
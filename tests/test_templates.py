@@ -38,3 +38,29 @@ def test_granularity_merge_overrides_scope_and_evidence():
     assert spec.scope_days == 14
     assert spec.granularity["evidence_depth"] == "mu_snippets"
     assert spec.budget["max_tokens"] == 800
+
+
+def test_load_and_validate_template_caches_and_sees_edits(tmp_path, monkeypatch):
+    import os
+    import shutil
+
+    import pytest
+
+    import tools.templates as t
+
+    src = next(t.templates_dir().glob("*.yaml"))
+    shutil.copy(src, tmp_path / src.name)
+    monkeypatch.setattr(t, "templates_dir", lambda: tmp_path)
+
+    a = t.load_and_validate_template(src.stem)
+    b = t.load_and_validate_template(src.stem)
+    assert a == b and a is not b
+    a.clear()  # mutating a result must not poison the cache
+    assert t.load_and_validate_template(src.stem) == b
+
+    p = tmp_path / src.name
+    p.write_text("template_id: 1\n", encoding="utf-8")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    with pytest.raises(ValueError):
+        t.load_and_validate_template(src.stem)
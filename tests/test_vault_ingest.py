@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 
@@ -34,3 +35,52 @@ def test_vault_ingest_writes_manifest_and_copies_file(tmp_path: Path):
     )
     errors = doctor_manifest(res.manifest_path, schema_path)
     assert errors == []
+
+
+def test_vault_ingest_main_parallel_keeps_input_order(tmp_path: Path, capsys):
+    import pytest
+
+    from tools.vault_ingest import ingest_files, main
+
+    inp = tmp_path / "in"
+    inp.mkdir()
+    for i in range(6):  # two files share content (same raw_id / destination)
+        (inp / f"f{i}.txt").write_text(f"data {i % 5}\n", encoding="utf-8")
+
+    manifest = tmp_path / "raw_manifest.jsonl"
+    vault = tmp_path / "vault"
+    assert (
+        main(
+            ["--in", str(inp), "--vault-root", str(vault), "--manifest", str(manifest)]
+            + ["--workers", "4"]
+        )
+        == 0
+    )
+    assert capsys.readouterr().out.strip() == "ingested_files=6"
+
+    lines = [json.loads(x) for x in manifest.read_text(encoding="utf-8").splitlines()]
+    expected = [
+        "sha256:" + hashlib.sha256(f"data {i % 5}\n".encode()).hexdigest()
+        for i in range(6)
+    ]
+    assert [rec["raw_id"] for rec in lines] == expected
+    assert len(list((vault / "raw").rglob("*.txt"))) == 5
+
+    with pytest.raises(FileNotFoundError):
+        ingest_files([inp / "f0.txt", inp / "nope.txt"], vault_root=vault, workers=2)
+
+
+def test_ingest_file_now_picks_month_dir(tmp_path: Path):
+    from datetime import UTC, datetime
+
+    from tools.vault_ingest import ingest_file
+
+    src = tmp_path / "a.TXT"
+    src.write_text("x", encoding="utf-8")
+    res = ingest_file(
+        src,
+        vault_root=tmp_path / "vault",
+        now=datetime(2025, 3, 31, 23, 59, tzinfo=UTC),
+    )
+    assert res.uri.startswith("vault://default/raw/2025/03/")
+    assert res.uri.endswith(".txt")
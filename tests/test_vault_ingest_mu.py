@@ -48,3 +48,29 @@ pointer:
     )
     errors = doctor_manifest(res.manifest_path, schema_path)
     assert errors == []
+
+
+def test_ingest_mu_files_parallel_matches_serial_order(tmp_path: Path):
+    from tools.vault_ingest_mu import ingest_mu_files
+
+    srcs = []
+    for i in range(4):
+        p = tmp_path / "in" / f"mu_{i}.mimo"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(
+            f"schema_version: '1.1'\nmu_id: mu_{i}\ncontent_hash: sha256:{'a' * 64}\n"
+            f"idempotency:\n  mu_key: sha256:{'b' * 64}\n",
+            encoding="utf-8",
+        )
+        srcs.append(str(p))
+
+    def manifest_ids(vault_root: Path) -> list[str]:
+        text = (vault_root / "manifests" / "mu_manifest.jsonl").read_text("utf-8")
+        return [json.loads(line)["mu_id"] for line in text.splitlines()]
+
+    serial = ingest_mu_files(srcs, vault_root=tmp_path / "v1")
+    parallel = ingest_mu_files(srcs, vault_root=tmp_path / "v2", workers=2)
+
+    assert [r.mu_id for r in parallel] == [r.mu_id for r in serial]
+    assert manifest_ids(tmp_path / "v2") == manifest_ids(tmp_path / "v1")
+    assert all(r.dest_path.exists() for r in parallel)
@@ -29,3 +29,25 @@ def test_invalid_kind_rejected():
 def test_format_rejects_kind():
     with pytest.raises(ValueError):
         format_vault_uri(vault_id="default", kind="nope", path="x")
+
+
+@pytest.mark.parametrize(
+    "uri, expected",
+    [
+        ("vault://default/raw/a.md", ("default", "raw", "a.md")),
+        ("vault://default/mu/2026/02/x.mimo", ("default", "mu", "2026/02/x.mimo")),
+        ("vault://default//raw/a//b/", ("default", "raw", "a/b")),
+        ("vault:///v/logs/x", ("v", "logs", "x")),
+    ],
+)
+def test_parse_normalizes_empty_segments(uri, expected):
+    v = parse_vault_uri(uri)
+    assert (v.vault_id, v.kind, v.path) == expected
+
+
+@pytest.mark.parametrize(
+    "uri", ["vault://default/raw", "vault://default/raw/", "file:///x", None]
+)
+def test_parse_rejects_incomplete(uri):
+    with pytest.raises(ValueError):
+        parse_vault_uri(uri)
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -65,3 +66,64 @@ def test_verify_reports_missing_file(tmp_path: Path):
         mani, vault_roots={"default": str(tmp_path / "vaults" / "default")}
     )
     assert errs
+
+
+def test_sha256_file_mmap_and_buffered_paths_agree(tmp_path: Path, monkeypatch):
+    import hashlib
+
+    import tools.vault_ops as vo
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    data = bytes(range(256)) * 5000
+    p = tmp_path / "data.bin"
+    p.write_bytes(data)
+    expected = "sha256:" + hashlib.sha256(data).hexdigest()
+
+    assert vo.sha256_file(empty) == "sha256:" + hashlib.sha256(b"").hexdigest()
+    assert vo.sha256_file(p) == expected  # mmap
+    small = tmp_path / "small.bin"
+    small.write_bytes(data[:1000])
+    assert vo.sha256_file(small) == "sha256:" + hashlib.sha256(data[:1000]).hexdigest()
+    monkeypatch.setattr(vo, "_MMAP_HASH_MAX_BYTES", 0)
+    monkeypatch.setattr(vo, "_HASH_BUF_BYTES", 4096)
+    assert vo.sha256_file(p) == expected  # readinto with a short final chunk
+
+
+def test_repair_uri_by_sha256_accepts_prebuilt_index():
+    from tools.vault_ops import build_sha256_index, repair_uri_by_sha256
+
+    recs = [
+        {"sha256": "sha256:a", "uri": None},
+        {"sha256": "sha256:a", "uri": "vault://default/raw/a1"},
+        {"sha256": "sha256:a", "uri": "vault://default/raw/a2"},
+        {"sha256": "sha256:b", "uri": "vault://default/raw/b"},
+    ]
+    index = build_sha256_index(recs)
+    assert index == {
+        "sha256:a": "vault://default/raw/a1",
+        "sha256:b": "vault://default/raw/b",
+    }
+    for sha in ("sha256:a", "sha256:b", "sha256:c"):
+        assert repair_uri_by_sha256(
+            sha256=sha, manifest_records=index
+        ) == repair_uri_by_sha256(sha256=sha, manifest_records=iter(recs))
+
+
+@pytest.mark.parametrize("copy_stat", [True, False])
+def test_copy_file_matches_shutil(tmp_path: Path, copy_stat: bool):
+    from tools.vault_ops import copy_file
+
+    for name, data in (
+        ("empty", b""),
+        ("small", b"hello"),
+        ("big", os.urandom(3 << 20)),
+    ):
+        src = tmp_path / f"{name}.bin"
+        src.write_bytes(data)
+        os.utime(src, (1_700_000_000, 1_700_000_000))
+        dst = tmp_path / f"{name}.copy"
+        dst.write_bytes(b"stale content that must be replaced")
+        copy_file(src, dst, copy_stat=copy_stat)
+        assert dst.read_bytes() == data
+        assert (int(dst.stat().st_mtime) == 1_700_000_000) is copy_stat
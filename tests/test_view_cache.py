@@ -31,3 +31,95 @@ def test_view_cache_put_get_invalidate(tmp_path: Path):
     v2 = get_view(db, "v1")
     assert v2 is not None
     assert v2.stale is True
+
+
+def test_view_cache_invalidate_follows_replaced_deps(tmp_path: Path):
+    from tools.view_cache import get_view, invalidate_by_mu_ids, put_view
+
+    db = tmp_path / "meta.sqlite"
+    for vid, deps in (("v1", ["mu_a", "mu_b"]), ("v2", ["mu_b", "mu_c"])):
+        put_view(
+            db,
+            view_id=vid,
+            template="t",
+            scope={},
+            source_mu_ids=deps,
+            content={},
+        )
+    # re-put drops the old deps of v1
+    put_view(
+        db, view_id="v1", template="t", scope={}, source_mu_ids=["mu_d"], content={}
+    )
+
+    assert invalidate_by_mu_ids(db, ["mu_a"]) == 0
+    assert invalidate_by_mu_ids(db, ["mu_b", "mu_d"]) == 2
+    assert invalidate_by_mu_ids(db, ["mu_b"]) == 0  # already stale
+    assert get_view(db, "v1").stale and get_view(db, "v2").stale
+
+
+def test_view_deps_backfilled_for_existing_db(tmp_path: Path):
+    from tools.meta_db import _LOCAL, connect
+    from tools.view_cache import invalidate_by_mu_ids, put_view
+
+    db = tmp_path / "meta.sqlite"
+    put_view(
+        db, view_id="v1", template="t", scope={}, source_mu_ids=["mu_a"], content={}
+    )
+    with connect(db) as conn:
+        conn.execute("DROP TABLE view_deps")
+        _LOCAL.inited.pop(id(conn), None)
+
+    assert invalidate_by_mu_ids(db, ["mu_a"]) == 1
+
+
+def test_view_cache_large_content_roundtrips_compressed(tmp_path: Path):
+    from tools.meta_db import connect
+    from tools.view_cache import COMPRESS_MIN_BYTES, get_view, put_view
+
+    db = tmp_path / "meta.sqlite"
+    small = {"text": "hello"}
+    large = {"text": "line\n" * COMPRESS_MIN_BYTES, "n": 1}
+    # under the threshold in characters, over it in UTF-8 bytes
+    wide = {"text": "决" * (COMPRESS_MIN_BYTES // 2)}
+    for view_id, content in (("small", small), ("large", large), ("wide", wide)):
+        put_view(
+            db,
+            view_id=view_id,
+            template="t",
+            scope={},
+            source_mu_ids=[],
+            content=content,
+        )
+
+    assert get_view(db, "small").content == small
+    assert get_view(db, "large").content == large
+    assert get_view(db, "wide").content == wide
+    with connect(db) as conn:
+        codecs = dict(conn.execute("SELECT view_id, content_codec FROM view_cache"))
+    assert codecs == {"small": None, "large": "zlib+json", "wide": "zlib+json"}
+
+
+def test_put_views_batch_matches_put_view(tmp_path: Path):
+    from tools.view_cache import get_view, invalidate_by_mu_ids, put_views
+
+    db = tmp_path / "meta.sqlite"
+    put_views(
+        db,
+        (
+            {
+                "view_id": f"v{i}",
+                "template": "t",
+                "scope": {"i": i},
+                "source_mu_ids": [f"mu_{i}", "mu_shared"],
+                "content": {"text": str(i)},
+            }
+            for i in range(3)
+        ),
+    )
+    assert [get_view(db, f"v{i}").content for i in range(3)] == [
+        {"text": "0"},
+        {"text": "1"},
+        {"text": "2"},
+    ]
+    assert invalidate_by_mu_ids(db, ["mu_1"]) == 1
+    assert invalidate_by_mu_ids(db, ["mu_shared"]) == 2
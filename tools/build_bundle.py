@@ -15,10 +15,10 @@ Usage:
 
 from __future__ import annotations
 
-import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from tools.json_io import dumps_bytes
 from tools.search_mu import search_mu
 
 
@@ -349,9 +349,7 @@ def main(argv: list[str] | None = None) -> int:
 
     out_path = Path(ns.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(out, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
+    out_path.write_bytes(dumps_bytes(out, indent=True))
     print(str(out_path))
     return 0
 
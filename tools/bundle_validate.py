@@ -5,22 +5,22 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from jsonschema import Draft202012Validator
+from tools.schema_cache import validator_for
+
+_SCHEMA_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "docs"
+    / "contracts"
+    / "bundle_v0_1.schema.json"
+)
 
 
 def load_schema() -> dict:
-    schema_path = (
-        Path(__file__).resolve().parents[1]
-        / "docs"
-        / "contracts"
-        / "bundle_v0_1.schema.json"
-    )
-    return json.loads(schema_path.read_text(encoding="utf-8"))
+    return json.loads(_SCHEMA_PATH.read_text(encoding="utf-8"))
 
 
 def validate_bundle(bundle: dict) -> list[str]:
-    schema = load_schema()
-    v = Draft202012Validator(schema)
+    v = validator_for(_SCHEMA_PATH)
     errors = sorted(v.iter_errors(bundle), key=lambda e: e.path)
     return [f"{list(e.path)}: {e.message}" for e in errors]
 
@@ -0,0 +1,32 @@
+"""Recursive file listing shared by the ingest tools and pipelines.
+
+sorted_files() returns what `sorted(Path(root).rglob("*" + suffix))` filtered to
+files would, as path strings. os.scandir reuses each DirEntry's cached type, so
+there is no per-entry stat or Path object.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def sorted_files(root: str | Path, suffix: str = "") -> list[str]:
+    """Files under root whose name ends with suffix, in sorted(rglob()) order.
+
+    Like rglob, symlinked directories are not descended into, while symlinks to
+    files are listed.
+    """
+    found: list[str] = []
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    found.append(entry.path)
+    # Same order as comparing path components, on flat strings: NUL sorts below
+    # every character that can appear in a file name.
+    found.sort(key=lambda p: p.replace(os.sep, "\0"))
+    return found
@@ -0,0 +1,34 @@
+"""Changed paths between two revisions, in-process via libgit2 (pygit2).
+
+Shared by the require_* CI gates. Paths match `git diff --name-only
+base..head`: renames are detected (diff.renames config, as the CLI does) and
+reported by their new path only.
+"""
+
+from __future__ import annotations
+
+try:  # optional: in-process diff via libgit2 (no git fork/exec)
+    import pygit2
+except ImportError:  # pragma: no cover
+    pygit2 = None
+
+
+def changed_files_pygit2(base: str, head: str) -> list[str] | None:
+    """Tree diff in-process via libgit2; None if unavailable or unresolvable.
+
+    On None the caller uses the git CLI, which also reports the error.
+    """
+    if pygit2 is None:
+        return None
+    try:
+        repo_path = pygit2.discover_repository(".")
+        if repo_path is None:
+            return None
+        repo = pygit2.Repository(repo_path)
+        a = repo.revparse_single(base).peel(pygit2.Tree)
+        b = repo.revparse_single(head).peel(pygit2.Tree)
+        diff = repo.diff(a, b)
+        diff.find_similar()  # pair delete+add into renames, like the CLI
+        return [d.new_file.path for d in diff.deltas]
+    except (KeyError, ValueError, pygit2.GitError):
+        return None
@@ -5,14 +5,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from jsonschema import Draft202012Validator
+from tools.schema_cache import validator_for
 
 
 def validate_report(report: dict) -> list[str]:
-    schema = json.loads(
-        (Path("golden") / "report.schema.json").read_text(encoding="utf-8")
-    )
-    v = Draft202012Validator(schema)
+    v = validator_for(Path("golden") / "report.schema.json")
     errors = sorted(v.iter_errors(report), key=lambda e: (list(e.path), e.message))
     return [f"{list(e.path)}: {e.message}" for e in errors]
 
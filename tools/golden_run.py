@@ -317,10 +317,9 @@ def validate_report(report: dict, schema_path: Path) -> list[str]:
     Returns a list of human-friendly error strings.
     """
 
-    from jsonschema import Draft202012Validator
+    from tools.schema_cache import validator_for
 
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    v = Draft202012Validator(schema)
+    v = validator_for(schema_path)
     errors = sorted(v.iter_errors(report), key=lambda e: (list(e.path), e.message))
     return [f"{list(e.path)}: {e.message}" for e in errors]
 
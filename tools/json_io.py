@@ -0,0 +1,86 @@
+"""JSON serialization for run outputs (reports, task lists, task results).
+
+Uses orjson when installed. Indented output matches
+`json.dumps(obj, ensure_ascii=False, indent=2)` except for the spelling of
+exponent floats (1e-6 vs 1e-06); compact lines also differ from the stdlib in
+whitespace after separators. Parsed values are identical either way.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+try:  # optional speedup; serializes straight to UTF-8 bytes
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Encoded records are gathered up to this size, then hashed and written at once.
+WRITE_CHUNK_BYTES = 128 * 1024
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize obj as UTF-8 JSON followed by a newline."""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:  # e.g. ints beyond 64 bits; the stdlib handles them
+            pass
+    text = json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+    return (text + "\n").encode("utf-8")
+
+
+def dumps_text(obj: Any) -> str:
+    """Compact JSON text, keys in insertion order (for stored blobs)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_sorted(obj: Any) -> str:
+    """Compact JSON text with sorted keys (stable for storage/comparison)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def loads_bytes(data: bytes | str) -> Any:
+    """Parse UTF-8 JSON bytes (orjson when installed, stdlib otherwise)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:  # NaN/Infinity, huge ints: stdlib accepts
+            pass
+    return json.loads(data)
+
+
+def stream_jsonl(path: str | Path, objs: Iterable[Any]) -> str:
+    """Write objs as JSONL in bounded chunks; return "sha256:<hex>" of the file.
+
+    The digest is computed while writing, so callers need not re-read the file.
+    """
+    h = hashlib.sha256()
+    buf = bytearray()
+    with open(path, "wb") as f:
+        for o in objs:
+            buf += dumps_bytes(o)
+            if len(buf) >= WRITE_CHUNK_BYTES:
+                h.update(buf)
+                f.write(buf)
+                buf.clear()
+        h.update(buf)
+        f.write(buf)
+    return "sha256:" + h.hexdigest()
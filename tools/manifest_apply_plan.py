@@ -24,7 +24,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from tools.manifest_io import append_jsonl, iter_jsonl
+from tools.manifest_io import ManifestWriter, iter_jsonl
 from tools.manifest_sync import KIND_ID_KEY, analyze_sync, record_fingerprint
 
 
@@ -164,14 +164,18 @@ def plan_patch(*, kind: str, base_path: Path, incoming_path: Path) -> dict[str,
 
 def apply_plan(plan: dict[str, Any]) -> None:
     base_path = Path(plan["base_path"])
-    for a in plan.get("actions", []):
-        if not isinstance(a, dict):
-            continue
-        if a.get("type") != "APPEND_RECORD":
-            continue
-        rec = a.get("record")
-        if isinstance(rec, dict):
-            append_jsonl(base_path, rec)
+    records = [
+        a["record"]
+        for a in plan.get("actions", [])
+        if isinstance(a, dict)
+        and a.get("type") == "APPEND_RECORD"
+        and isinstance(a.get("record"), dict)
+    ]
+    if not records:
+        return
+    with ManifestWriter(base_path) as w:
+        for rec in records:
+            w.write(rec)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -17,11 +17,11 @@ Note: execution outputs are TaskResult v0.1 compatible JSON.
 
 from __future__ import annotations
 
-import json
 import time
 from dataclasses import dataclass
 from pathlib import Path
 
+from tools.json_io import dumps_bytes, stream_jsonl
 from tools.manifest_apply_plan import apply_plan, plan_patch
 from tools.manifest_io import iter_jsonl
 from tools.vault_doctor import verify_manifest
@@ -194,9 +194,7 @@ def exec_sync_manifest_apply(task: dict, ctx: ExecContext) -> dict:
         out_path = Path(base_path).with_suffix(".patch_plan.json")
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        json.dumps(plan, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
+    out_path.write_bytes(dumps_bytes(plan, indent=True))
 
     return task_result(
         task_id=task_id,
@@ -259,12 +257,11 @@ def main(argv: list[str] | None = None) -> int:
     out_path = Path(ns.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with out_path.open("w", encoding="utf-8") as out_f:
-        for t in iter_jsonl(tasks_path):
-            if not isinstance(t, dict):
-                continue
-            res = exec_task(t, ctx)
-            out_f.write(json.dumps(res, ensure_ascii=False) + "\n")
+    # results are encoded and written in bounded chunks as tasks complete
+    stream_jsonl(
+        out_path,
+        (exec_task(t, ctx) for t in iter_jsonl(tasks_path) if isinstance(t, dict)),
+    )
 
     return 0
 
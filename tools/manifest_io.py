@@ -9,15 +9,60 @@ This module is intentionally small and deterministic.
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from types import MappingProxyType
+from typing import Self
+
+from tools.json_io import loads_bytes
+from tools.vault_uri import VAULT_URI_PREFIX
+
+try:  # optional speedup; orjson parses bytes directly
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
+
+def _jsonl_line(record: dict) -> bytes:
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def append_jsonl(path: str | Path, record: dict) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    with p.open("ab") as f:
+        f.write(_jsonl_line(record))
+
+
+class ManifestWriter:
+    """Append records to a jsonl manifest through one open handle.
+
+    Same lines as repeated append_jsonl() calls, without an open/close per
+    record. Use as `with ManifestWriter(path) as w: w.write(rec)`; buffered
+    lines are written out when the block exits (also on error).
+
+    Durability is the same as append_jsonl(): __exit__ flushes and closes the
+    file but does not fsync, so lines may still be in the OS cache after the
+    block returns.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._f = None
+
+    def __enter__(self) -> Self:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = self.path.open("ab")
+        return self
+
+    def write(self, record: dict) -> None:
+        self._f.write(_jsonl_line(record))
+
+    def __exit__(self, *exc: object) -> None:
+        self._f.close()
+        self._f = None
 
 
 def iter_jsonl(path: str | Path) -> Iterable[dict]:
@@ -29,4 +74,72 @@ def iter_jsonl(path: str | Path) -> Iterable[dict]:
             line = line.strip()
             if not line:
                 continue
-            yield json.loads(line)
+            yield loads_bytes(line)
+
+
+def index_uri_by_sha256(path: str | Path) -> Mapping[str, str]:
+    """Map sha256 -> uri (first record wins) for a jsonl manifest.
+
+    Cached by (path, mtime_ns, size), so repeated lookups during one run (many MU
+    files / pointers) parse the manifest once. The mapping is shared: read-only.
+    """
+    ident = _manifest_identity(path)
+    if ident is None:
+        return MappingProxyType({})
+    return _index_uri_by_sha256_cached(*ident)
+
+
+def index_vault_uri_by_sha256(path: str | Path) -> Mapping[str, str]:
+    """index_uri_by_sha256 restricted to vault:// targets (what migration uses).
+
+    Filtered once per manifest version, so callers need no per-lookup scheme
+    check. A sha whose first record is not a vault uri stays absent.
+    """
+    ident = _manifest_identity(path)
+    if ident is None:
+        return MappingProxyType({})
+    return _index_vault_uri_cached(*ident)
+
+
+def _manifest_identity(path: str | Path) -> tuple[str, int, int] | None:
+    # abspath is a string op; Path.resolve() would cost a syscall per component
+    # on every pointer lookup.
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        return None
+    return key, st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=8)
+def _index_uri_by_sha256_cached(
+    path: str, mtime_ns: int, size: int
+) -> Mapping[str, str]:
+    # Streamed from a binary handle; only the two string fields are kept.
+    # Undecodable lines (e.g. a torn append) are skipped so one bad line does
+    # not block every lookup.
+    idx: dict[str, str] = {}
+    with open(path, "rb") as f:
+        for raw in f:
+            if not raw.strip():
+                continue
+            try:
+                rec = _json_loads(raw)
+            except ValueError:  # JSONDecodeError / UnicodeDecodeError
+                continue
+            if not isinstance(rec, dict):
+                continue
+            s = rec.get("sha256")
+            u = rec.get("uri")
+            if isinstance(s, str) and isinstance(u, str) and s not in idx:
+                idx[s] = u
+    return MappingProxyType(idx)
+
+
+@lru_cache(maxsize=8)
+def _index_vault_uri_cached(path: str, mtime_ns: int, size: int) -> Mapping[str, str]:
+    idx = _index_uri_by_sha256_cached(path, mtime_ns, size)
+    return MappingProxyType(
+        {s: u for s, u in idx.items() if u.startswith(VAULT_URI_PREFIX)}
+    )
@@ -30,6 +30,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+from tools.json_io import dumps_sorted, loads_bytes
+
 
 KIND_ID_KEY = {"raw": "raw_id", "mu": "mu_id", "asset": "asset_id"}
 
@@ -66,43 +68,46 @@ def read_jsonl_lines(path: Path) -> tuple[list[dict], list[Conflict], int]:
         )
         return records, conflicts, 0
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-    for i, line in enumerate(lines, start=1):
-        if not line.strip():
-            continue
-        try:
-            obj = json.loads(line)
-        except Exception as e:
-            conflicts.append(
-                Conflict(
-                    type="SCHEMA_ERROR",
-                    severity="ERROR",
-                    key=f"{path}:{i}",
-                    message=f"invalid json: {e}",
-                    base_records=[],
-                    incoming_records=[],
+    # streamed as raw bytes: memory stays O(longest line) and loads_bytes decodes
+    i = 0  # also the line count returned below
+    with path.open("rb") as f:
+        for i, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                obj = loads_bytes(line)
+            except Exception as e:
+                conflicts.append(
+                    Conflict(
+                        type="SCHEMA_ERROR",
+                        severity="ERROR",
+                        key=f"{path}:{i}",
+                        message=f"invalid json: {e}",
+                        base_records=[],
+                        incoming_records=[],
+                    )
                 )
-            )
-            continue
-        if not isinstance(obj, dict):
-            conflicts.append(
-                Conflict(
-                    type="SCHEMA_ERROR",
-                    severity="ERROR",
-                    key=f"{path}:{i}",
-                    message="manifest line must be an object",
-                    base_records=[],
-                    incoming_records=[],
+                continue
+            if not isinstance(obj, dict):
+                conflicts.append(
+                    Conflict(
+                        type="SCHEMA_ERROR",
+                        severity="ERROR",
+                        key=f"{path}:{i}",
+                        message="manifest line must be an object",
+                        base_records=[],
+                        incoming_records=[],
+                    )
                 )
-            )
-            continue
-        records.append(obj)
+                continue
+            records.append(obj)
 
-    return records, conflicts, len(lines)
+    return records, conflicts, i
 
 
 def record_fingerprint(rec: dict) -> str:
-    return json.dumps(rec, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    # canonical text (sorted keys, compact); compared in memory only
+    return dumps_sorted(rec)
 
 
 def index_records(records: Iterable[dict], *, id_key: str) -> dict[str, list[dict]]:
@@ -13,8 +13,8 @@ This is a planning layer only; execution is a separate component.
 
 from __future__ import annotations
 
-import json
 import uuid
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -46,31 +46,29 @@ def task(
     }
 
 
-def tasks_from_report(report: dict) -> list[dict[str, Any]]:
+def iter_tasks_from_report(report: dict) -> Iterator[dict[str, Any]]:
+    """Yield the tasks of tasks_from_report() one at a time (same order).
+
+    Lets writers stream tasks to disk without holding the whole list.
+    """
     kind = report.get("kind")
     base_path = (report.get("base") or {}).get("path")
     incoming_path = (report.get("incoming") or {}).get("path")
 
-    tasks: list[dict[str, Any]] = []
-
     # Always verify both manifests (dry-run planning; actual executor supplies vault_roots).
     if isinstance(base_path, str):
-        tasks.append(
-            task(
-                type="VERIFY_MANIFEST",
-                idempotency_key=f"verify:{kind}:base:{base_path}",
-                inputs=[{"kind": "TEXT", "ids": [base_path]}],
-                params={"kind": kind, "manifest_path": base_path},
-            )
+        yield task(
+            type="VERIFY_MANIFEST",
+            idempotency_key=f"verify:{kind}:base:{base_path}",
+            inputs=[{"kind": "TEXT", "ids": [base_path]}],
+            params={"kind": kind, "manifest_path": base_path},
         )
     if isinstance(incoming_path, str):
-        tasks.append(
-            task(
-                type="VERIFY_MANIFEST",
-                idempotency_key=f"verify:{kind}:incoming:{incoming_path}",
-                inputs=[{"kind": "TEXT", "ids": [incoming_path]}],
-                params={"kind": kind, "manifest_path": incoming_path},
-            )
+        yield task(
+            type="VERIFY_MANIFEST",
+            idempotency_key=f"verify:{kind}:incoming:{incoming_path}",
+            inputs=[{"kind": "TEXT", "ids": [incoming_path]}],
+            params={"kind": kind, "manifest_path": incoming_path},
         )
 
     conflicts = report.get("conflicts") or []
@@ -87,20 +85,18 @@ def tasks_from_report(report: dict) -> list[dict[str, Any]]:
         if ctype == "SHA_COLLISION_DIFFERENT_URI":
             # Suggest a manifest uri repair mapping (planning only)
             key = c.get("key")
-            tasks.append(
-                task(
-                    type="REPAIR_MANIFEST_URI",
-                    idempotency_key=f"repair_uri:{kind}:{key}",
-                    inputs=[],
-                    params={
-                        "kind": kind,
-                        "sha256": key,
-                        "base_records": c.get("base_records") or [],
-                        "incoming_records": c.get("incoming_records") or [],
-                        "policy": "prefer_base_uri",
-                        "dry_run": True,
-                    },
-                )
+            yield task(
+                type="REPAIR_MANIFEST_URI",
+                idempotency_key=f"repair_uri:{kind}:{key}",
+                inputs=[],
+                params={
+                    "kind": kind,
+                    "sha256": key,
+                    "base_records": c.get("base_records") or [],
+                    "incoming_records": c.get("incoming_records") or [],
+                    "policy": "prefer_base_uri",
+                    "dry_run": True,
+                },
             )
         elif ctype in {
             "SCHEMA_ERROR",
@@ -111,23 +107,23 @@ def tasks_from_report(report: dict) -> list[dict[str, Any]]:
 
     # Always include a conservative apply planning task, even when there are no manual conflicts.
     # This lets the system append brand-new ids and produce a patch plan artifact under the run_dir.
-    tasks.append(
-        task(
-            type="SYNC_MANIFEST_APPLY",
-            idempotency_key=f"sync_apply:{kind}:{base_path}:{incoming_path}",
-            inputs=[],
-            params={
-                "kind": kind,
-                "base_path": base_path,
-                "incoming_path": incoming_path,
-                "dry_run": True,
-                "manual_conflicts": manual,
-                "policy": "conservative_no_overwrite",
-            },
-        )
+    yield task(
+        type="SYNC_MANIFEST_APPLY",
+        idempotency_key=f"sync_apply:{kind}:{base_path}:{incoming_path}",
+        inputs=[],
+        params={
+            "kind": kind,
+            "base_path": base_path,
+            "incoming_path": incoming_path,
+            "dry_run": True,
+            "manual_conflicts": manual,
+            "policy": "conservative_no_overwrite",
+        },
     )
 
-    return tasks
+
+def tasks_from_report(report: dict) -> list[dict[str, Any]]:
+    return list(iter_tasks_from_report(report))
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -140,14 +136,14 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("--out", required=True, help="Output tasks path (jsonl)")
     ns = p.parse_args(argv)
 
-    report = json.loads(Path(ns.report).read_text(encoding="utf-8"))
+    from tools.json_io import loads_bytes, stream_jsonl
+
+    report = loads_bytes(Path(ns.report).read_bytes())
     out_p = Path(ns.out)
     out_p.parent.mkdir(parents=True, exist_ok=True)
 
-    tasks = tasks_from_report(report)
-    with out_p.open("w", encoding="utf-8") as f:
-        for t in tasks:
-            f.write(json.dumps(t, ensure_ascii=False) + "\n")
+    # orjson lines, written in bounded chunks instead of one write per task
+    stream_jsonl(out_p, iter_tasks_from_report(report))
 
     return 0
 
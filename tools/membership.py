@@ -10,16 +10,29 @@ This module provides:
 Notes:
 - MU must remain pure; no workspace_id fields or ws:* tags are used.
 - Membership is local state under DATA_ROOT/workspaces/.
+- membership.<workspace>.snapshot.json files are rebuildable replay caches
+  (effective set + byte offset); the event log stays the source of truth.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass
+import os
+import re
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from typing import BinaryIO
 
 from tools.meta_db import connect, init_db
 
+try:  # optional speedup; orjson parses bytes directly
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
 
 @dataclass(frozen=True)
 class MembershipDiagnostics:
@@ -47,67 +60,312 @@ def membership_paths(data_root: Path) -> tuple[Path, Path]:
     return ws_dir / "workspaces.json", ws_dir / "membership.jsonl"
 
 
-def load_effective_membership(
-    *, data_root: Path, workspace_id: str
-) -> tuple[set[str], MembershipDiagnostics]:
-    _, membership_path = membership_paths(data_root)
+def _workspace_probe(workspace_id: str) -> bytes | None:
+    """Quoted workspace id as it must appear verbatim in a matching event line.
+
+    Lines lacking the probe can be skipped without a JSON decode. Returns None when
+    the id contains characters JSON may escape (every line is decoded then).
+    """
+    if not workspace_id.isascii() or not workspace_id.isprintable():
+        return None
+    if any(c in workspace_id for c in '"\\/'):
+        return None
+    return f'"{workspace_id}"'.encode("ascii")
+
+
+@dataclass
+class _ReplayState:
+    """Replayed membership state for one (membership_path, workspace_id)."""
+
+    offset: int = 0  # bytes consumed (always just after a newline)
+    mtime_ns: int = 0
+    tail: bytes = b""  # last bytes before offset; detects non-append rewrites
+    effective: set[str] = field(default_factory=set)
+    events_total: int = 0
+    adds: int = 0
+    removes: int = 0
+
+    def copy(self) -> _ReplayState:
+        return replace(self, effective=set(self.effective))
 
-    if not membership_path.exists():
-        raise FileNotFoundError(
-            f"membership.jsonl not found: {membership_path} (workspace={workspace_id})"
-        )
 
-    effective: set[str] = set()
-    events_total = 0
-    adds = 0
-    removes = 0
+# membership.jsonl is append-only: keep replayed state per (path, workspace) and only
+# replay bytes appended since the previous call.
+_REPLAY_CACHE: dict[tuple[str, str], _ReplayState] = {}
+_TAIL_SIG_BYTES = 64
 
-    for line in membership_path.read_text(encoding="utf-8").splitlines():
-        s = line.strip().lstrip("\ufeff")
+_EVENT_INDEX = {"add": 0, "remove": 1}
+
+# Cold replays that consume at least this many bytes persist a snapshot, so the
+# next process only replays the tail appended after it.
+_SNAPSHOT_MIN_BYTES = 4 * 1024 * 1024
+_SNAPSHOT_VERSION = 1
+
+
+def snapshot_path(data_root: Path, workspace_id: str) -> Path:
+    ws_dir = Path(data_root) / "workspaces"
+    if re.fullmatch(r"[A-Za-z0-9_.-]+", workspace_id):
+        safe = workspace_id
+    else:
+        safe = "sha256_" + hashlib.sha256(workspace_id.encode("utf-8")).hexdigest()[:16]
+    return ws_dir / f"membership.{safe}.snapshot.json"
+
+
+def write_snapshot(path: Path, *, workspace_id: str, state: _ReplayState) -> None:
+    """Atomically persist replayed state (tmp file + os.replace)."""
+    obj = {
+        "version": _SNAPSHOT_VERSION,
+        "workspace_id": workspace_id,
+        "offset": state.offset,
+        "tail_hex": state.tail.hex(),
+        "events_total": state.events_total,
+        "adds": state.adds,
+        "removes": state.removes,
+        "effective": sorted(state.effective),
+    }
+    # unique tmp name per writer: concurrent writers never share a tmp file
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=path.parent,
+        prefix=path.name + ".",
+        suffix=".tmp",
+        delete=False,
+    ) as f:
+        f.write(json.dumps(obj, ensure_ascii=False))
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
+
+def _load_snapshot(
+    path: Path, *, workspace_id: str, f: BinaryIO, size: int
+) -> _ReplayState | None:
+    """Return snapshot state if it still matches the log prefix (else None)."""
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+        if obj.get("version") != _SNAPSHOT_VERSION:
+            return None
+        if obj.get("workspace_id") != workspace_id:
+            return None
+        offset = int(obj["offset"])
+        tail = bytes.fromhex(obj["tail_hex"])
+        state = _ReplayState(
+            offset=offset,
+            tail=tail,
+            effective={str(x) for x in obj["effective"]},
+            events_total=int(obj["events_total"]),
+            adds=int(obj["adds"]),
+            removes=int(obj["removes"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    if offset > size or len(tail) > offset:
+        return None
+    f.seek(offset - len(tail))
+    if f.read(len(tail)) != tail:
+        return None
+    return state
+
+
+def _replay_lines(
+    lines: Iterable[bytes],
+    *,
+    workspace_id: str,
+    needle: bytes | None,
+    state: _ReplayState,
+) -> None:
+    # Only the latest event per mu_id matters for the final set: record it with one
+    # dict store per event and apply the batch with two bulk set operations.
+    counts = [0, 0]
+    last: dict[str, int] = {}
+    for line in lines:
+        # bytes rstrip only (drops the newline / CRLF); the JSON decode accepts
+        # leading whitespace.
+        s = line.rstrip()
         if not s:
             continue
-        events_total += 1
+        state.events_total += 1
+        if needle is not None and needle not in s:
+            continue
         try:
-            obj = json.loads(s)
+            obj = _json_loads(s)
         except Exception:
             # Ignore malformed lines (but keep deterministic semantics for valid lines)
             continue
         if not isinstance(obj, dict):
             continue
-        if obj.get("workspace_id") != workspace_id:
+        ws, ev, mu_id = obj.get("workspace_id"), obj.get("event"), obj.get("mu_id")
+        if ws != workspace_id:
             continue
-        ev = obj.get("event")
-        mu_id = obj.get("mu_id")
         if not isinstance(mu_id, str) or not mu_id:
             continue
-        if ev == "add":
-            adds += 1
-            effective.add(mu_id)
-        elif ev == "remove":
-            removes += 1
-            effective.discard(mu_id)
+        idx = _EVENT_INDEX.get(ev) if isinstance(ev, str) else None
+        if idx is None:
+            continue
+        last[mu_id] = idx
+        counts[idx] += 1
+    state.adds += counts[0]
+    state.removes += counts[1]
+    state.effective.difference_update([k for k, v in last.items() if v == 1])
+    state.effective.update([k for k, v in last.items() if v == 0])
+
+
+def load_effective_membership(
+    *, data_root: Path, workspace_id: str
+) -> tuple[set[str], MembershipDiagnostics]:
+    _, membership_path = membership_paths(data_root)
+
+    if not membership_path.exists():
+        raise FileNotFoundError(
+            f"membership.jsonl not found: {membership_path} (workspace={workspace_id})"
+        )
+
+    key = (str(membership_path), workspace_id)
+    st = membership_path.stat()
+    state = _REPLAY_CACHE.get(key)
+    if state is not None and (
+        st.st_size < state.offset
+        or (st.st_size == state.offset and st.st_mtime_ns != state.mtime_ns)
+    ):
+        state = None  # truncated or rewritten in place
+
+    needle = _workspace_probe(workspace_id)
+    snap_path = snapshot_path(data_root, workspace_id)
+    pending: list[bytes] = []  # trailing partial line (writer mid-append)
+
+    with membership_path.open("rb") as f:
+        if state is not None and st.st_size > state.offset:
+            f.seek(state.offset - len(state.tail))
+            if f.read(len(state.tail)) != state.tail:
+                state = None
+        if state is None:
+            state = _load_snapshot(
+                snap_path, workspace_id=workspace_id, f=f, size=st.st_size
+            )
+            if state is not None:
+                f.seek(state.offset)
+        if state is None:
+            f.seek(0)
+            state = _ReplayState()
+            if f.read(3) == b"\xef\xbb\xbf":
+                state.offset = 3  # BOM handled once, not per line
+            else:
+                f.seek(0)
+
+        def complete_lines() -> Iterator[bytes]:
+            # Only complete lines advance the cached state; a trailing partial line
+            # is applied to a copy below so it is re-read on the next call.
+            for line in f:
+                if not line.endswith(b"\n"):
+                    pending.append(line)
+                    return
+                state.offset += len(line)
+                yield line
+
+        replay_from = state.offset
+        if st.st_size > state.offset:
+            _replay_lines(
+                complete_lines(), workspace_id=workspace_id, needle=needle, state=state
+            )
+        sig_start = max(0, state.offset - _TAIL_SIG_BYTES)
+        f.seek(sig_start)
+        state.tail = f.read(state.offset - sig_start)
+
+    state.mtime_ns = st.st_mtime_ns
+    _REPLAY_CACHE[key] = state
+    if state.offset - replay_from >= _SNAPSHOT_MIN_BYTES:
+        try:
+            write_snapshot(snap_path, workspace_id=workspace_id, state=state)
+        except OSError:
+            pass  # best-effort cache (e.g. read-only data root)
+
+    result = state.copy()
+    if pending:
+        _replay_lines(pending, workspace_id=workspace_id, needle=needle, state=result)
 
     diag = MembershipDiagnostics(
         workspace_id=workspace_id,
         membership_path=str(membership_path),
-        events_total=events_total,
-        adds=adds,
-        removes=removes,
-        effective_count=len(effective),
+        events_total=result.events_total,
+        adds=result.adds,
+        removes=result.removes,
+        effective_count=len(result.effective),
+    )
+    return result.effective, diag
+
+
+_MAX_FOLD_HOPS = 16
+
+# Canonical resolution runs entirely inside SQLite (one recursive query per call).
+#
+# Edges come from mu_edge (maintained by triggers in meta_db), looked up per
+# walked id, so a call only touches the edges reachable from its inputs. Guards
+# mirror the old Python parsing (only valid JSON arrays; only scalar
+# string/number items become ids). Each id follows one edge: priority
+# supersedes > corrects > duplicate_of, then the first edge in table order
+# (owner rowid, array index).
+#
+# walk: one row per hop per start. A hop is taken from `cur` only if it is not
+# tombstoned, has not been seen earlier on this start's trail (cycle-safe), has a
+# non-self edge, and the hop bound is not reached. Trails are char(31)-delimited.
+_CANON_WALK_SQL = f"""
+WITH RECURSIVE
+walk(start_id, src, cur, depth, kind, trail) AS (
+  SELECT mu_id, NULL, mu_id, 0, NULL, char(31) || mu_id || char(31) FROM canon_q
+  UNION ALL
+  SELECT w.start_id, w.cur, e.head, w.depth + 1, e.kind,
+         w.trail || e.head || char(31)
+  FROM walk AS w JOIN mu_edge AS e ON e.rowid = (
+    SELECT g.rowid FROM mu_edge AS g JOIN mu AS m ON m.mu_id = g.owner
+    WHERE g.dst = w.cur
+    ORDER BY g.prio, m.rowid, g.k
+    LIMIT 1
+  )
+  WHERE w.depth < {_MAX_FOLD_HOPS}
+    AND e.head <> w.cur
+    AND NOT EXISTS (
+      SELECT 1 FROM mu AS t
+      WHERE t.mu_id = w.cur
+        AND t.tombstone_json IS NOT NULL AND t.tombstone_json NOT IN ('', 'null')
     )
-    return effective, diag
+    AND instr(w.trail, char(31) || w.cur || char(31))
+        = length(w.trail) - length(w.cur) - 1
+)
+INSERT INTO canon_walk(start_id, src, cur, depth, kind, trail)
+SELECT start_id, src, cur, depth, kind, trail FROM walk
+"""
 
+# Final node per start (SQLite returns bare columns from the max(depth) row).
+_CANON_FINAL_SQL = """
+SELECT start_id, cur, max(depth), trail FROM canon_walk GROUP BY start_id
+"""
 
-def _parse_json_list(maybe_json: str | None) -> list[str]:
-    if not maybe_json:
-        return []
-    try:
-        x = json.loads(maybe_json)
-    except Exception:
-        return []
-    if isinstance(x, list):
-        return [str(i) for i in x if isinstance(i, (str, int, float))]
-    return []
+# Fold counts and distinct edges traversed, per edge kind.
+_CANON_FOLDS_SQL = """
+SELECT kind, count(*), count(DISTINCT src) FROM canon_walk
+WHERE depth > 0 GROUP BY kind
+"""
+
+_CANON_TOMBSTONED_SQL = """
+SELECT mu_id FROM mu
+WHERE mu_id IN (SELECT cur FROM canon_walk)
+  AND tombstone_json IS NOT NULL AND tombstone_json NOT IN ('', 'null')
+"""
+
+# Visited rows whose edge columns are not valid JSON (ignored by the walk;
+# surfaced in diagnostics so doctor-style checks can spot them).
+_MALFORMED_EDGE_SQL = """
+SELECT count(*) FROM mu
+WHERE mu_id IN (SELECT cur FROM canon_walk)
+  AND (
+    (corrects_json IS NOT NULL AND NOT json_valid(corrects_json))
+    OR (supersedes_json IS NOT NULL AND NOT json_valid(supersedes_json))
+    OR (duplicate_of_json IS NOT NULL AND NOT json_valid(duplicate_of_json))
+  )
+"""
 
 
 def canonicalize_mu_ids_single_hop(
@@ -127,6 +385,10 @@ def canonicalize_mu_ids_single_hop(
     - Apply the above single-hop rewrites repeatedly until stable (bounded; cycle-safe).
 
     Returns: (canonical_set, diagnostics)
+
+    traversed_{corrects,supersedes,duplicate_of}_edges count the distinct edges
+    the walk followed. reverse_corrects_size, reverse_supersedes_size and
+    forward_duplicate_of_size are kept as aliases with the same values.
     """
 
     init_db(db_path)
@@ -134,98 +396,55 @@ def canonicalize_mu_ids_single_hop(
     if not mu_ids:
         return set(), {"input": 0, "output": 0}
 
-    reverse_corrects: dict[str, str] = {}
-    reverse_supersedes: dict[str, str] = {}
-    forward_duplicate_of: dict[str, str] = {}
-    tombstoned: set[str] = set()
-
     with connect(db_path) as conn:
-        rows = conn.execute(
-            """
-            SELECT mu_id, corrects_json, supersedes_json, duplicate_of_json, tombstone_json
-            FROM mu
-            WHERE corrects_json IS NOT NULL
-               OR supersedes_json IS NOT NULL
-               OR duplicate_of_json IS NOT NULL
-               OR tombstone_json IS NOT NULL
-            """
-        ).fetchall()
-
-    for r in rows:
-        mu_id = str(r["mu_id"])
-        if r["tombstone_json"] not in (None, "null", ""):
-            tombstoned.add(mu_id)
-
-        # reverse edges: old -> new
-        for old in _parse_json_list(r["corrects_json"]):
-            if old not in reverse_corrects:
-                reverse_corrects[old] = mu_id
-        for old in _parse_json_list(r["supersedes_json"]):
-            if old not in reverse_supersedes:
-                reverse_supersedes[old] = mu_id
-
-        # forward edge: dup -> canonical
-        dups = _parse_json_list(r["duplicate_of_json"])
-        if dups:
-            # single-hop: take first target only (stable)
-            if mu_id not in forward_duplicate_of:
-                forward_duplicate_of[mu_id] = dups[0]
-
-    folded_by_corrects = 0
-    folded_by_supersedes = 0
-    folded_by_duplicate_of = 0
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS canon_q(mu_id TEXT PRIMARY KEY)")
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS canon_walk("
+            "start_id TEXT, src TEXT, cur TEXT, depth INTEGER, kind TEXT, trail TEXT)"
+        )
+        conn.execute("DELETE FROM canon_q")
+        conn.execute("DELETE FROM canon_walk")
+        conn.executemany(
+            "INSERT OR IGNORE INTO canon_q(mu_id) VALUES (?)", [(m,) for m in mu_ids]
+        )
+        conn.execute(_CANON_WALK_SQL)
+        finals = conn.execute(_CANON_FINAL_SQL).fetchall()
+        folds = {r[0]: (r[1], r[2]) for r in conn.execute(_CANON_FOLDS_SQL)}
+        tombstoned = {str(r[0]) for r in conn.execute(_CANON_TOMBSTONED_SQL)}
+        malformed_edge_rows = conn.execute(_MALFORMED_EDGE_SQL).fetchone()[0]
+        conn.execute("DELETE FROM canon_q")
+        conn.execute("DELETE FROM canon_walk")
+
     tombstoned_excluded = 0
     cycles_detected = 0
-
-    def step(mid: str) -> tuple[str, str | None]:
-        """Return (new_mid, edge_type_used)."""
-        if mid in reverse_supersedes:
-            return reverse_supersedes[mid], "supersedes"
-        if mid in reverse_corrects:
-            return reverse_corrects[mid], "corrects"
-        if mid in forward_duplicate_of:
-            return forward_duplicate_of[mid], "duplicate_of"
-        return mid, None
-
     out: set[str] = set()
 
-    for start in mu_ids:
-        cur = start
-        seen: set[str] = set()
-        # bounded convergence: still "single-hop" per iteration
-        for _ in range(16):
+    for _start, cur, depth, trail in finals:
+        if depth < _MAX_FOLD_HOPS:
+            # the walk stopped on its own: tombstone, cycle, or no further edge
             if cur in tombstoned:
                 tombstoned_excluded += 1
-                cur = ""
-                break
-            if cur in seen:
+                continue
+            if trail.find(f"\x1f{cur}\x1f") != len(trail) - len(cur) - 2:
                 cycles_detected += 1
-                break
-            seen.add(cur)
-            nxt, edge = step(cur)
-            if edge is None or nxt == cur:
-                break
-            if edge == "corrects":
-                folded_by_corrects += 1
-            elif edge == "supersedes":
-                folded_by_supersedes += 1
-            elif edge == "duplicate_of":
-                folded_by_duplicate_of += 1
-            cur = nxt
-
-        if cur and (cur not in tombstoned):
+        if cur not in tombstoned:
             out.add(cur)
 
     diag = {
         "input": len(mu_ids),
         "output": len(out),
-        "folded_by_corrects": folded_by_corrects,
-        "folded_by_supersedes": folded_by_supersedes,
-        "folded_by_duplicate_of": folded_by_duplicate_of,
+        "folded_by_corrects": folds.get("corrects", (0, 0))[0],
+        "folded_by_supersedes": folds.get("supersedes", (0, 0))[0],
+        "folded_by_duplicate_of": folds.get("duplicate_of", (0, 0))[0],
         "tombstoned_excluded": tombstoned_excluded,
         "cycles_detected": cycles_detected,
-        "reverse_corrects_size": len(reverse_corrects),
-        "reverse_supersedes_size": len(reverse_supersedes),
-        "forward_duplicate_of_size": len(forward_duplicate_of),
+        "malformed_edge_rows": malformed_edge_rows,
+        "traversed_corrects_edges": folds.get("corrects", (0, 0))[1],
+        "traversed_supersedes_edges": folds.get("supersedes", (0, 0))[1],
+        "traversed_duplicate_of_edges": folds.get("duplicate_of", (0, 0))[1],
     }
+    # pre-rename keys, still read by consumers of search_mu output
+    diag["reverse_corrects_size"] = diag["traversed_corrects_edges"]
+    diag["reverse_supersedes_size"] = diag["traversed_supersedes_edges"]
+    diag["forward_duplicate_of_size"] = diag["traversed_duplicate_of_edges"]
     return out, diag
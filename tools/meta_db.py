@@ -7,13 +7,17 @@ Tables:
 - tag: tag dictionary
 - mu_tag: many-to-many
 - mu_fts: FTS5 over summary (and optional extra text)
+- mu_edge: fold edges (supersedes/corrects/duplicate_of) keyed by the folded id
+- view_cache / view_deps: cached views and their MU dependencies (by mu_id)
 
 We keep the schema intentionally small and migration-friendly.
 """
 
 from __future__ import annotations
 
+import os
 import sqlite3
+import threading
 from pathlib import Path
 
 
@@ -69,8 +73,85 @@ CREATE TRIGGER IF NOT EXISTS mu_au AFTER UPDATE ON mu BEGIN
   INSERT INTO mu_fts(rowid, mu_id, summary) VALUES (new.rowid, new.mu_id, coalesce(new.summary,''));
 END;
 
+-- Fold edges for canonicalization, one row per edge, keyed by the id being
+-- folded (dst) so the walk looks up only edges reachable from the query.
+-- Only valid JSON arrays and scalar string/number items count;
+-- duplicate_of keeps its first target only. Maintained by the triggers below
+-- (the insert trigger also clears rows left by INSERT OR REPLACE).
+CREATE TABLE IF NOT EXISTS mu_edge (
+  dst TEXT NOT NULL,
+  prio INTEGER NOT NULL,
+  kind TEXT NOT NULL,
+  owner TEXT NOT NULL,
+  k INTEGER NOT NULL,
+  head TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_mu_edge_dst ON mu_edge(dst, prio);
+CREATE INDEX IF NOT EXISTS idx_mu_edge_owner ON mu_edge(owner);
+
+CREATE TRIGGER IF NOT EXISTS mu_edge_ai AFTER INSERT ON mu BEGIN
+  DELETE FROM mu_edge WHERE owner = new.mu_id;
+  INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+    SELECT CAST(e.value AS TEXT), 1, 'supersedes', new.mu_id, e.key, new.mu_id
+    FROM json_each(new.supersedes_json) AS e
+    WHERE new.supersedes_json IS NOT NULL
+      AND json_valid(new.supersedes_json) AND json_type(new.supersedes_json) = 'array'
+      AND e.type IN ('text', 'integer', 'real');
+  INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+    SELECT CAST(e.value AS TEXT), 2, 'corrects', new.mu_id, e.key, new.mu_id
+    FROM json_each(new.corrects_json) AS e
+    WHERE new.corrects_json IS NOT NULL
+      AND json_valid(new.corrects_json) AND json_type(new.corrects_json) = 'array'
+      AND e.type IN ('text', 'integer', 'real');
+  INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+    SELECT new.mu_id, 3, 'duplicate_of', new.mu_id, e.key, CAST(e.value AS TEXT)
+    FROM json_each(new.duplicate_of_json) AS e
+    WHERE new.duplicate_of_json IS NOT NULL
+      AND json_valid(new.duplicate_of_json)
+      AND json_type(new.duplicate_of_json) = 'array'
+      AND e.type IN ('text', 'integer', 'real')
+    ORDER BY e.key
+    LIMIT 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS mu_edge_ad AFTER DELETE ON mu BEGIN
+  DELETE FROM mu_edge WHERE owner = old.mu_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS mu_edge_au
+AFTER UPDATE OF mu_id, supersedes_json, corrects_json, duplicate_of_json ON mu BEGIN
+  DELETE FROM mu_edge WHERE owner = old.mu_id;
+  DELETE FROM mu_edge WHERE owner = new.mu_id;
+  INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+    SELECT CAST(e.value AS TEXT), 1, 'supersedes', new.mu_id, e.key, new.mu_id
+    FROM json_each(new.supersedes_json) AS e
+    WHERE new.supersedes_json IS NOT NULL
+      AND json_valid(new.supersedes_json) AND json_type(new.supersedes_json) = 'array'
+      AND e.type IN ('text', 'integer', 'real');
+  INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+    SELECT CAST(e.value AS TEXT), 2, 'corrects', new.mu_id, e.key, new.mu_id
+    FROM json_each(new.corrects_json) AS e
+    WHERE new.corrects_json IS NOT NULL
+      AND json_valid(new.corrects_json) AND json_type(new.corrects_json) = 'array'
+      AND e.type IN ('text', 'integer', 'real');
+  INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+    SELECT new.mu_id, 3, 'duplicate_of', new.mu_id, e.key, CAST(e.value AS TEXT)
+    FROM json_each(new.duplicate_of_json) AS e
+    WHERE new.duplicate_of_json IS NOT NULL
+      AND json_valid(new.duplicate_of_json)
+      AND json_type(new.duplicate_of_json) = 'array'
+      AND e.type IN ('text', 'integer', 'real')
+    ORDER BY e.key
+    LIMIT 1;
+END;
+
 CREATE INDEX IF NOT EXISTS idx_mu_time ON mu(time);
 CREATE INDEX IF NOT EXISTS idx_mu_privacy ON mu(privacy_level);
+-- search_mu: target-level filter + newest-first listing
+CREATE INDEX IF NOT EXISTS idx_mu_priv_time ON mu(privacy_level, time DESC);
+-- search_mu --tag: find tagged MUs without scanning mu (PK is (mu_id, tag))
+CREATE INDEX IF NOT EXISTS idx_mu_tag_tag ON mu_tag(tag, mu_id);
 
 -- view cache (P1-D)
 CREATE TABLE IF NOT EXISTS view_cache (
@@ -87,36 +168,165 @@ CREATE TABLE IF NOT EXISTS view_cache (
 
 CREATE INDEX IF NOT EXISTS idx_view_template ON view_cache(template);
 CREATE INDEX IF NOT EXISTS idx_view_stale ON view_cache(stale);
+
+-- reverse index view -> source mu_ids, so invalidation probes by mu_id
+CREATE TABLE IF NOT EXISTS view_deps (
+  view_id TEXT NOT NULL,
+  mu_id TEXT NOT NULL,
+  PRIMARY KEY (view_id, mu_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_view_deps_mu ON view_deps(mu_id);
+"""
+
+
+# mu_edge for rows indexed before the table existed (same rules as mu_edge_ai).
+MU_EDGE_BACKFILL_SQL = """
+INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+  SELECT CAST(e.value AS TEXT), 1, 'supersedes', mu.mu_id, e.key, mu.mu_id
+  FROM mu, json_each(mu.supersedes_json) AS e
+  WHERE mu.supersedes_json IS NOT NULL
+    AND json_valid(mu.supersedes_json) AND json_type(mu.supersedes_json) = 'array'
+    AND e.type IN ('text', 'integer', 'real');
+INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+  SELECT CAST(e.value AS TEXT), 2, 'corrects', mu.mu_id, e.key, mu.mu_id
+  FROM mu, json_each(mu.corrects_json) AS e
+  WHERE mu.corrects_json IS NOT NULL
+    AND json_valid(mu.corrects_json) AND json_type(mu.corrects_json) = 'array'
+    AND e.type IN ('text', 'integer', 'real');
+INSERT INTO mu_edge (dst, prio, kind, owner, k, head)
+  SELECT mu.mu_id, 3, 'duplicate_of', mu.mu_id, e.key, CAST(e.value AS TEXT)
+  FROM mu, json_each(mu.duplicate_of_json) AS e
+  WHERE mu.duplicate_of_json IS NOT NULL
+    AND json_valid(mu.duplicate_of_json)
+    AND json_type(mu.duplicate_of_json) = 'array'
+    AND e.key = (
+      SELECT min(f.key) FROM json_each(mu.duplicate_of_json) AS f
+      WHERE f.type IN ('text', 'integer', 'real')
+    );
 """
 
+# Applied once per opened connection.
+CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+class _ThreadConns(threading.local):
+    """Per-thread connection cache.
+
+    A sqlite3 connection carries one transaction and its own TEMP tables
+    (canon_q/canon_walk), so threads (task pools) never share one.
+    """
+
+    def __init__(self) -> None:
+        # resolved db path -> (inode, connection). The inode check drops a
+        # cached connection when the file was deleted/recreated.
+        self.conns: dict[str, tuple[int, sqlite3.Connection]] = {}
+        # id(conn) -> conn for cached connections whose DB already ran
+        # init_db; dropped with the connection, so a deleted/recreated file is
+        # initialized again.
+        self.inited: dict[int, sqlite3.Connection] = {}
+
+
+_LOCAL = _ThreadConns()
+_CONN_CACHE_MAX = 8
+
+
+def _drop(key: str) -> None:
+    _, conn = _LOCAL.conns.pop(key)
+    _LOCAL.inited.pop(id(conn), None)
+    conn.close()
+
 
 def connect(db_path: Path) -> sqlite3.Connection:
+    """Return this thread's connection for db_path (opened once, tuned PRAGMAs).
+
+    Use as `with connect(p) as conn:` -- the context manager only commits/rolls
+    back; the connection stays open for reuse by later calls in the same thread.
+    """
+    db_path = Path(db_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
+    key = str(db_path.resolve())
+    hit = _LOCAL.conns.get(key)
+    if hit is not None:
+        try:
+            if os.stat(key).st_ino == hit[0]:
+                return hit[1]
+        except FileNotFoundError:
+            pass
+        _drop(key)
+
+    # search_mu et al. reuse a few fixed SQL shapes; keep their plans prepared
+    conn = sqlite3.connect(key, cached_statements=128)
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECT_PRAGMAS:
+        conn.execute(pragma)
+
+    if len(_LOCAL.conns) >= _CONN_CACHE_MAX:
+        _drop(next(iter(_LOCAL.conns)))  # evict oldest
+    _LOCAL.conns[key] = (os.stat(key).st_ino, conn)
     return conn
 
 
-def _ensure_column(
-    conn: sqlite3.Connection, table: str, col: str, coltype: str
+# lightweight migrations (non-destructive): columns added after the first schema
+MU_MIGRATION_COLUMNS = {
+    "supersedes_json": "TEXT",
+    "duplicate_of_json": "TEXT",
+}
+VIEW_CACHE_MIGRATION_COLUMNS = {
+    # large content is stored compressed here; content_json is then ""
+    "content_blob": "BLOB",
+    "content_codec": "TEXT",
+}
+
+
+def _ensure_columns(
+    conn: sqlite3.Connection, table: str, wanted: dict[str, str]
 ) -> None:
-    rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-    have = {r[1] for r in rows}
-    if col not in have:
-        conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {coltype}")
+    """Add missing columns with a single PRAGMA table_info round-trip."""
+    have = {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+    for col, coltype in wanted.items():
+        if col not in have:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {coltype}")
 
 
 def init_db(db_path: Path) -> None:
+    """Create/migrate the schema; a no-op for a DB already initialized here."""
     with connect(db_path) as conn:
+        if _LOCAL.inited.get(id(conn)) is conn:
+            return
+        have = {
+            r[0]
+            for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+                " AND name IN ('mu_edge', 'view_deps')"
+            )
+        }
         conn.executescript(SCHEMA_SQL)
-        # lightweight migrations (non-destructive)
-        _ensure_column(conn, "mu", "supersedes_json", "TEXT")
-        _ensure_column(conn, "mu", "duplicate_of_json", "TEXT")
+        _ensure_columns(conn, "mu", MU_MIGRATION_COLUMNS)
+        _ensure_columns(conn, "view_cache", VIEW_CACHE_MIGRATION_COLUMNS)
+        if "mu_edge" not in have:
+            # DBs created before mu_edge: derive it from the existing rows
+            conn.executescript(MU_EDGE_BACKFILL_SQL)
+        if "view_deps" not in have:
+            # DBs created before view_deps: derive it from the cached views
+            conn.execute(
+                "INSERT OR IGNORE INTO view_deps (view_id, mu_id) "
+                "SELECT v.view_id, d.value FROM view_cache AS v, "
+                "json_each(v.source_mu_ids_json) AS d"
+            )
+        _LOCAL.inited[id(conn)] = conn
 
 
 def reset_db(db_path: Path) -> None:
     # Drop tables/virtual tables and rebuild.
     with connect(db_path) as conn:
+        _LOCAL.inited.pop(id(conn), None)
         conn.executescript(
             """
             DROP TABLE IF EXISTS mu_tag;
@@ -124,6 +334,7 @@ def reset_db(db_path: Path) -> None:
             DROP TABLE IF EXISTS mu;
             -- note: schema migrations are handled in init_db (ALTER TABLE ADD COLUMN)
             DROP TABLE IF EXISTS mu_fts;
+            DROP TABLE IF EXISTS mu_edge;
             """
         )
     init_db(db_path)
@@ -18,33 +18,51 @@ Rules:
 
 from __future__ import annotations
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from tools.schema_cache import validator_for
 
-def load_config(path: str | Path) -> dict[str, Any]:
-    p = Path(path)
-    obj = json.loads(p.read_text(encoding="utf-8"))
-    if not isinstance(obj, dict):
-        raise TypeError("config must be a JSON object")
+_SCHEMA_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "docs"
+    / "contracts"
+    / "ms_config_v0_1.schema.json"
+)
 
-    # validate best-effort
+
+@lru_cache(maxsize=1)
+def _jsonschema() -> Any:
+    """Import jsonschema once on first use (None when the dev dep is missing)."""
     try:
         import jsonschema
+    except ImportError:
+        return None
+    return jsonschema
+
 
-        schema_path = (
-            Path(__file__).resolve().parents[1]
-            / "docs"
-            / "contracts"
-            / "ms_config_v0_1.schema.json"
-        )
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
-        jsonschema.Draft202012Validator(schema).validate(obj)
+def _validate(obj: dict[str, Any]) -> None:
+    # validate best-effort
+    if _jsonschema() is None:
+        return
+    try:
+        validator_for(_SCHEMA_PATH).validate(obj)
     except Exception:
         # dev dep may be missing; keep permissive
         pass
 
+
+@lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    obj = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(obj, dict):
+        raise TypeError("config must be a JSON object")
+
+    _validate(obj)
+
     vault_roots = obj.get("vault_roots")
     if not isinstance(vault_roots, dict) or not all(
         isinstance(k, str) and isinstance(v, str) for k, v in vault_roots.items()
@@ -67,6 +85,13 @@ def load_config(path: str | Path) -> dict[str, Any]:
     return obj
 
 
+def load_config(path: str | Path) -> dict[str, Any]:
+    """Load + validate a config file (cached by path/mtime/size; returns a copy)."""
+    p = Path(path).resolve()
+    st = p.stat()
+    return copy.deepcopy(_load_cached(str(p), st.st_mtime_ns, st.st_size))
+
+
 def main(argv: list[str] | None = None) -> int:
     import argparse
 
@@ -79,11 +79,12 @@ def main(argv: list[str] | None = None) -> int:
         ok = not errs
 
         base = f"manifest:{manifest}:{schema}".encode("utf-8")
-        task_id = "doctor_" + hashlib.sha256(base).hexdigest()[:16] + "_" + ts
+        digest = hashlib.sha256(base).hexdigest()
+        task_id = "doctor_" + digest[:16] + "_" + ts
         spec = {
             "task_id": task_id,
             "type": "MS_DOCTOR_MANIFEST",
-            "idempotency_key": "doctor:" + hashlib.sha256(base).hexdigest(),
+            "idempotency_key": "doctor:" + digest,
             "params": {"manifest": str(manifest), "schema": str(schema)},
         }
         result = {
@@ -124,11 +125,12 @@ def main(argv: list[str] | None = None) -> int:
         ok = not errs
 
         base = f"verify:{manifest}:{sorted(vault_roots.items())}".encode("utf-8")
-        task_id = "doctor_" + hashlib.sha256(base).hexdigest()[:16] + "_" + ts
+        digest = hashlib.sha256(base).hexdigest()
+        task_id = "doctor_" + digest[:16] + "_" + ts
         spec = {
             "task_id": task_id,
             "type": "MS_VERIFY_MANIFEST",
-            "idempotency_key": "verify:" + hashlib.sha256(base).hexdigest(),
+            "idempotency_key": "verify:" + digest,
             "params": {"manifest": str(manifest), "vault_roots": vault_roots},
         }
         result = {
@@ -160,11 +162,12 @@ def main(argv: list[str] | None = None) -> int:
         ok = uri is not None
 
         base = f"repair:{manifest}:{ns.sha256}".encode("utf-8")
-        task_id = "doctor_" + hashlib.sha256(base).hexdigest()[:16] + "_" + ts
+        digest = hashlib.sha256(base).hexdigest()
+        task_id = "doctor_" + digest[:16] + "_" + ts
         spec = {
             "task_id": task_id,
             "type": "MS_REPAIR_SUGGEST",
-            "idempotency_key": "repair:" + hashlib.sha256(base).hexdigest(),
+            "idempotency_key": "repair:" + digest,
             "params": {"manifest": str(manifest), "sha256": ns.sha256},
         }
         result = {
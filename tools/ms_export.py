@@ -65,16 +65,17 @@ def main(argv: list[str] | None = None) -> int:
         from datetime import datetime, timezone
 
         base = f"{kind}:{in_path}:{ns.out}:{ns.target_level}".encode("utf-8")
+        digest = hashlib.sha256(base).hexdigest()
         task_id = (
             "export_"
-            + hashlib.sha256(base).hexdigest()[:16]
+            + digest[:16]
             + "_"
             + datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
         )
         spec = {
             "task_id": task_id,
             "type": "MS_EXPORT",
-            "idempotency_key": "export:" + hashlib.sha256(base).hexdigest(),
+            "idempotency_key": "export:" + digest,
             "params": {
                 "kind": kind,
                 "in": str(in_path),
@@ -0,0 +1,128 @@
+"""Superseding MU rewrites (shared by pointer migration and repair auto-fix).
+
+Append-only rule:
+- The source MU is never modified.
+- A new MU (new mu_id, links.supersedes += old id) is written under out_dir.
+
+YAML goes through libyaml (CSafeLoader/CSafeDumper) when available.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import secrets
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# libyaml-backed loader/dumper when available (same safe semantics, much faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _utc_now_compact() -> str:
+    return datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+
+
+def new_mu_id() -> str:
+    # Not ULID, but time-sortable and unique enough for local migration.
+    return f"mu_migr_{_utc_now_compact()}_{secrets.token_hex(5)}"
+
+
+def yaml_load(stream: bytes | mmap.mmap) -> Any:
+    # yaml.load() minus the wrapper; a loader is bound to its stream, so it is
+    # constructed per document and disposed right away. libyaml decodes the
+    # UTF-8 bytes itself (and reads an mmap through its read()).
+    loader = _YAML_LOADER(stream)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def dump_mu(obj: dict[str, Any]) -> str:
+    # yaml.dump() minus the dump_all wrapper; keep YAML stable-ish
+    stream = io.StringIO()
+    dumper = _YAML_DUMPER(stream, sort_keys=False, allow_unicode=True)
+    try:
+        dumper.open()
+        dumper.represent(obj)
+        dumper.close()
+    finally:
+        dumper.dispose()
+    return stream.getvalue()
+
+
+def write_superseding_mu(
+    mu: dict[str, Any],
+    *,
+    supersedes_id: str,
+    pointers: list[Any],
+    out_dir: str | Path,
+) -> tuple[str, Path]:
+    """Write a copy of mu with new pointers, a new mu_id and supersedes_id linked.
+
+    Returns (new_mu_id, new_mu_path).
+    """
+    new_mu = dict(mu)
+    mu_id = new_mu_id()
+    new_mu["mu_id"] = mu_id
+    new_mu["pointer"] = pointers
+
+    # Ensure links.supersedes includes the superseded mu_id
+    links = new_mu.get("links")
+    if not isinstance(links, dict):
+        links = {}
+    supersedes = links.get("supersedes")
+    if supersedes is None:
+        supersedes = []
+    if not isinstance(supersedes, list):
+        supersedes = [supersedes]
+    if supersedes_id not in supersedes:
+        supersedes.append(supersedes_id)
+    links["supersedes"] = supersedes
+    new_mu["links"] = links
+
+    out_dir_p = out_dir if isinstance(out_dir, Path) else Path(out_dir)
+    out_dir_p.mkdir(parents=True, exist_ok=True)
+    new_path = out_dir_p / f"{mu_id}.mimo"
+    new_path.write_text(dump_mu(new_mu), encoding="utf-8")
+    return mu_id, new_path
+
+
+def rewrite_mu_pointer(
+    mu_path: str | Path,
+    *,
+    sha256: str,
+    new_uri: str,
+    supersedes_id: str,
+    out_dir: str | Path,
+) -> tuple[str, Path, int] | None:
+    """Point every pointer with this sha256 at new_uri in a superseding MU.
+
+    Returns (new_mu_id, new_mu_path, changed_pointers), or None when the file is
+    not an MU mapping with a pointer list.
+    """
+    mu = yaml_load(Path(mu_path).read_bytes())
+    if not isinstance(mu, dict):
+        return None
+    pointers = mu.get("pointer")
+    if not isinstance(pointers, list):
+        return None
+
+    new_pointers: list[Any] = []
+    changed = 0
+    for p in pointers:
+        if isinstance(p, dict) and p.get("sha256") == sha256:
+            new_pointers.append({**p, "uri": new_uri})
+            changed += 1
+        else:
+            new_pointers.append(p)
+
+    mu_id, new_path = write_superseding_mu(
+        mu, supersedes_id=supersedes_id, pointers=new_pointers, out_dir=out_dir
+    )
+    return mu_id, new_path, changed
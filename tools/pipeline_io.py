@@ -0,0 +1,71 @@
+"""Run dir I/O shared by the pipeline scripts (run_*_pipeline, run_manifest_sync).
+
+- write_json / write_jsonl: write an output and return its "sha256:<hex>",
+  hashed from the bytes written (no re-read).
+- input_sha256s / input_sha256s_async: fingerprints of the input files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from pathlib import Path
+
+from tools.json_io import dumps_bytes, stream_jsonl
+from tools.vault_ops import sha256_file
+
+
+def sha256_bytes(b: bytes) -> str:
+    h = hashlib.sha256()
+    h.update(b)
+    return "sha256:" + h.hexdigest()
+
+
+def write_json(path: Path, obj: dict) -> str:
+    data = dumps_bytes(obj, indent=True)
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:  # parent missing; outputs normally land in run_dir
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return sha256_bytes(data)
+
+
+def write_jsonl(path: Path, objs: list[dict]) -> str:
+    # open() fails before any record is written, so retrying is safe
+    try:
+        return stream_jsonl(path, objs)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return stream_jsonl(path, objs)
+
+
+def _sha256_file_or_none(p: str) -> str | None:
+    try:
+        return sha256_file(Path(p))
+    except FileNotFoundError:
+        return None
+
+
+def input_sha256s(*paths: str) -> dict[str, str | None]:
+    """sha256 per distinct input path (None if missing); each file is read once."""
+    out: dict[str, str | None] = {}
+    for p in paths:
+        if p not in out:
+            out[p] = _sha256_file_or_none(p)
+    return out
+
+
+def input_sha256s_async(*paths: str) -> Callable[[], dict[str, str | None]]:
+    """Start hashing each distinct input path on its own thread.
+
+    Returns a callable that waits for and returns what input_sha256s() would.
+    Only valid while the run does not modify the inputs.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    distinct = list(dict.fromkeys(paths))
+    pool = ThreadPoolExecutor(max_workers=max(1, len(distinct)))
+    futs = {p: pool.submit(_sha256_file_or_none, p) for p in distinct}
+    pool.shutdown(wait=False)  # submitted hashes still run to completion
+    return lambda: {p: f.result() for p, f in futs.items()}
@@ -20,49 +20,96 @@ we leave the pointer unchanged.
 
 from __future__ import annotations
 
-import hashlib
 import json
+import mmap
+import os
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any
 
 import yaml
 
-from tools.manifest_io import iter_jsonl
+from tools.manifest_io import index_vault_uri_by_sha256
+from tools.mu_rewrite import write_superseding_mu, yaml_load
+from tools.vault_uri import VAULT_URI_PREFIX
 
+try:  # optional speedup for large migration reports
+    from orjson import OPT_INDENT_2, OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
 
-def _utc_now_compact() -> str:
-    return datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    def _report_bytes(obj: Any) -> bytes:
+        return _orjson_dumps(obj, option=OPT_INDENT_2 | OPT_NON_STR_KEYS)
 
+except ImportError:  # pragma: no cover
 
-def _new_mu_id() -> str:
-    # Not ULID, but time-sortable and unique enough for local migration.
-    seed = f"{_utc_now_compact()}:{Path.cwd()}".encode("utf-8")
-    rnd = hashlib.sha256(seed).hexdigest()[:10]
-    return f"mu_migr_{_utc_now_compact()}_{rnd}"
+    def _report_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 
-def _load_mu(path: Path) -> dict[str, Any]:
-    obj = yaml.safe_load(path.read_text(encoding="utf-8"))
+def _parse_mu(data: bytes | mmap.mmap, path: Path) -> dict[str, Any]:
+    obj = yaml_load(data)
     if not isinstance(obj, dict):
         raise ValueError(f"MU is not a mapping: {path}")
     return obj
 
 
-def _dump_mu(obj: dict[str, Any]) -> str:
-    # Keep YAML stable-ish
-    return yaml.safe_dump(obj, sort_keys=False, allow_unicode=True)
+# Any `uri:` whose value is not a vault:// uri (quoted keys/values, flow style
+# and next-line values included). False positives only cost a parse.
+_LEGACY_URI_RE = re.compile(rb"""uri['"]?\s*:\s*(?!['"]?vault://)\S""")
+
+# Column-0 lines delimit top-level blocks of a block-style YAML mapping.
+_COL0_LINE_RE = re.compile(rb"^[^ \t#\r\n].*", re.MULTILINE)
+_TOP_KEY_RE = re.compile(rb"([A-Za-z_][\w-]*):(?:[ \t\r]|$)")
+
+# Keys migrate_mu_pointers needs to decide whether an MU must be rewritten.
+_PROBE_KEYS = frozenset({b"mu_id", b"pointer"})
+
+# MU files at least this large are mapped instead of read into memory.
+_MMAP_MIN_BYTES = 1024 * 1024
+
+
+def _parse_mu_keys(
+    data: bytes | mmap.mmap, keys: frozenset[bytes]
+) -> dict[str, Any] | None:
+    """Parse only the given top-level blocks of an MU (mu_id must be present).
+
+    Returns None whenever the layout is not a plain block mapping (document
+    markers, directives, flow style, quoted/complex keys, unresolvable aliases)
+    so the caller falls back to a full parse.
+    """
+    starts: list[tuple[bytes, int]] = []
+    for m in _COL0_LINE_RE.finditer(data):
+        line = m.group()
+        if line[:1] == b"-":
+            if line.startswith(b"---"):
+                return None
+            continue  # top-level sequence item of the current key
+        km = _TOP_KEY_RE.match(line)
+        if km is None:
+            return None
+        starts.append((km.group(1), m.start()))
+    if not any(key == b"mu_id" for key, _ in starts):
+        return None
+
+    pieces: list[bytes] = []
+    for i, (key, pos) in enumerate(starts):
+        if key in keys:
+            end = starts[i + 1][1] if i + 1 < len(starts) else len(data)
+            pieces.append(data[pos:end])
 
+    try:
+        obj = yaml_load(b"".join(pieces))
+    except yaml.YAMLError:
+        return None
+    return obj if isinstance(obj, dict) else None
 
-def _index_manifest_by_sha256(manifest_path: Path) -> dict[str, str]:
-    idx: dict[str, str] = {}
-    for rec in iter_jsonl(manifest_path):
-        s = rec.get("sha256")
-        u = rec.get("uri")
-        if isinstance(s, str) and isinstance(u, str) and s not in idx:
-            idx[s] = u
-    return idx
+
+def _index_manifest_by_sha256(manifest_path: str | Path) -> Mapping[str, str]:
+    # sha256 -> vault:// uri only; non-vault targets are filtered once per manifest
+    return index_vault_uri_by_sha256(manifest_path)
 
 
 @dataclass(frozen=True)
@@ -81,17 +128,64 @@ class MigrationResult:
     changed_pointers: list[PointerMigration]
 
 
-def migrate_mu_pointers(
-    mu_path: str | Path,
+def _migrate_pointer_list(
+    pointers: list[Any], idx: Mapping[str, str]
+) -> tuple[list[Any], list[PointerMigration]]:
+    changed: list[PointerMigration] = []
+    new_pointers: list[Any] = []
+
+    append = new_pointers.append
+    for p in pointers:
+        if not isinstance(p, dict):
+            append(p)
+            continue
+        uri = p.get("uri")
+        sha = p.get("sha256")
+        if (
+            not isinstance(uri, str)
+            or not uri
+            or not isinstance(sha, str)
+            or uri.startswith(VAULT_URI_PREFIX)
+        ):
+            append(p)
+            continue
+        # idx holds vault:// targets only, so a hit always differs from uri
+        new_uri = idx.get(sha)
+        if new_uri is None:
+            append(p)
+            continue
+        append({**p, "uri": new_uri})
+        changed.append(PointerMigration(old_uri=uri, new_uri=new_uri, sha256=sha))
+
+    return new_pointers, changed
+
+
+@contextmanager
+def _open_mu_bytes(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """MU file contents as bytes, or as a read-only mmap for large files."""
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _load_for_migration(
+    data: bytes | mmap.mmap,
+    mu_p: Path,
     *,
     raw_manifest_path: str | Path,
-    out_dir: str | Path,
-) -> MigrationResult | None:
-    mu_p = Path(mu_path)
-    out_dir_p = Path(out_dir)
-    out_dir_p.mkdir(parents=True, exist_ok=True)
+    index: Mapping[str, str] | None,
+) -> tuple[dict[str, Any], str, list[Any], list[PointerMigration]] | None:
+    # Already-migrated MUs (only vault:// uris) are skipped without any parse.
+    if _LEGACY_URI_RE.search(data) is None:
+        return None
 
-    mu = _load_mu(mu_p)
+    # Most MUs need no rewrite; decide from the mu_id/pointer blocks alone and
+    # only parse the whole document (long body/snapshot) when one is needed.
+    probe = _parse_mu_keys(data, _PROBE_KEYS)
+    mu = probe if probe is not None else _parse_mu(data, mu_p)
     old_mu_id = mu.get("mu_id")
     if not isinstance(old_mu_id, str) or not old_mu_id:
         raise ValueError(f"missing mu_id in {mu_p}")
@@ -102,63 +196,49 @@ def migrate_mu_pointers(
     if not isinstance(pointers, list):
         raise ValueError(f"pointer must be a list in {mu_p}")
 
-    idx = _index_manifest_by_sha256(Path(raw_manifest_path))
+    if index is None:
+        index = _index_manifest_by_sha256(raw_manifest_path)
 
-    changed: list[PointerMigration] = []
-    new_pointers: list[dict[str, Any]] = []
+    new_pointers, changed = _migrate_pointer_list(pointers, index)
+    if not changed:
+        return None
 
-    for p in pointers:
-        if not isinstance(p, dict):
-            new_pointers.append(p)
-            continue
-        uri = p.get("uri")
-        sha = p.get("sha256")
-        if (
-            isinstance(uri, str)
-            and isinstance(sha, str)
-            and uri
-            and not uri.startswith("vault://")
-        ):
-            new_uri = idx.get(sha)
-            if (
-                isinstance(new_uri, str)
-                and new_uri.startswith("vault://")
-                and new_uri != uri
-            ):
-                p2 = dict(p)
-                p2["uri"] = new_uri
-                new_pointers.append(p2)
-                changed.append(
-                    PointerMigration(old_uri=uri, new_uri=new_uri, sha256=sha)
-                )
-                continue
-        new_pointers.append(p)
+    if mu is probe:
+        mu = _parse_mu(data, mu_p)
+        pointers = mu.get("pointer")
+        if not isinstance(pointers, list):
+            raise ValueError(f"pointer must be a list in {mu_p}")
+        new_pointers, changed = _migrate_pointer_list(pointers, index)
+        if not changed:
+            return None
 
-    if not changed:
+    return mu, old_mu_id, new_pointers, changed
+
+
+def migrate_mu_pointers(
+    mu_path: str | Path,
+    *,
+    raw_manifest_path: str | Path,
+    out_dir: str | Path,
+    manifest_index: Mapping[str, str] | None = None,
+) -> MigrationResult | None:
+    """Write a superseding MU with legacy pointer uris migrated; None if unchanged.
+
+    `manifest_index` (sha256 -> vault:// uri, as from index_vault_uri_by_sha256)
+    skips the manifest lookup when the caller already holds it.
+    """
+    mu_p = Path(mu_path)
+    with _open_mu_bytes(mu_p) as data:
+        loaded = _load_for_migration(
+            data, mu_p, raw_manifest_path=raw_manifest_path, index=manifest_index
+        )
+    if loaded is None:
         return None
+    mu, old_mu_id, new_pointers, changed = loaded
 
-    new_mu = dict(mu)
-    new_mu_id = _new_mu_id()
-    new_mu["mu_id"] = new_mu_id
-    new_mu["pointer"] = new_pointers
-
-    # Ensure links.supersedes includes old mu_id
-    links = new_mu.get("links")
-    if not isinstance(links, dict):
-        links = {}
-    supersedes = links.get("supersedes")
-    if supersedes is None:
-        supersedes = []
-    if not isinstance(supersedes, list):
-        supersedes = [supersedes]
-    if old_mu_id not in supersedes:
-        supersedes.append(old_mu_id)
-    links["supersedes"] = supersedes
-    new_mu["links"] = links
-
-    # Write new MU next to out_dir using new id
-    new_path = out_dir_p / f"{new_mu_id}.mimo"
-    new_path.write_text(_dump_mu(new_mu), encoding="utf-8")
+    new_mu_id, new_path = write_superseding_mu(
+        mu, supersedes_id=old_mu_id, pointers=new_pointers, out_dir=out_dir
+    )
 
     return MigrationResult(
         source_mu_path=mu_p,
@@ -169,6 +249,67 @@ def migrate_mu_pointers(
     )
 
 
+# Per-process state for parallel migration (set once by the pool initializer).
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(
+    manifest_index: dict[str, str], raw_manifest_path: Path, out_dir: Path
+) -> None:
+    _WORKER.update(
+        manifest_index=manifest_index,
+        raw_manifest_path=raw_manifest_path,
+        out_dir=out_dir,
+    )
+
+
+def _migrate_in_worker(mu_path: Path) -> MigrationResult | None:
+    return migrate_mu_pointers(
+        mu_path,
+        raw_manifest_path=_WORKER["raw_manifest_path"],
+        out_dir=_WORKER["out_dir"],
+        manifest_index=_WORKER["manifest_index"],
+    )
+
+
+def migrate_many(
+    mu_paths: list[Path],
+    *,
+    raw_manifest_path: str | Path,
+    out_dir: str | Path,
+    workers: int = 1,
+) -> list[MigrationResult | None]:
+    """Migrate MU files in input order; workers > 1 uses a process pool.
+
+    The manifest index is built once in the parent and shipped to each worker.
+    """
+    # normalize once; every per-MU call below reuses these objects
+    raw_manifest_path = Path(raw_manifest_path)
+    out_dir = Path(out_dir)
+    idx = _index_manifest_by_sha256(raw_manifest_path)
+    if workers <= 1 or len(mu_paths) <= 1:
+        return [
+            migrate_mu_pointers(
+                p,
+                raw_manifest_path=raw_manifest_path,
+                out_dir=out_dir,
+                manifest_index=idx,
+            )
+            for p in mu_paths
+        ]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(dict(idx), raw_manifest_path, out_dir),
+    ) as ex:
+        # map() keeps results in input order (deterministic report)
+        chunk = max(1, len(mu_paths) // (workers * 4))
+        return list(ex.map(_migrate_in_worker, mu_paths, chunksize=chunk))
+
+
 def iter_mu_files(inp: Path) -> Iterable[Path]:
     if inp.is_file():
         yield inp
@@ -190,6 +331,12 @@ def main(argv: list[str] | None = None) -> int:
         "--out-dir", required=True, help="Output directory for migrated MU files"
     )
     ap.add_argument("--report", default=None, help="Optional json report output")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parallel worker processes (default: 1; 0 = cpu count)",
+    )
     ns = ap.parse_args(argv)
 
     mu_in = Path(ns.mu)
@@ -202,13 +349,16 @@ def main(argv: list[str] | None = None) -> int:
 
     results: list[dict[str, Any]] = []
     migrated = 0
-    touched = 0
 
-    for mu_path in iter_mu_files(mu_in):
-        touched += 1
-        res = migrate_mu_pointers(
-            mu_path, raw_manifest_path=raw_manifest, out_dir=ns.out_dir
-        )
+    mu_paths = list(iter_mu_files(mu_in))
+    touched = len(mu_paths)
+    workers = ns.workers if ns.workers > 0 else (os.cpu_count() or 1)
+    for res in migrate_many(
+        mu_paths,
+        raw_manifest_path=raw_manifest,
+        out_dir=Path(ns.out_dir),
+        workers=workers,
+    ):
         if res is None:
             continue
         migrated += 1
@@ -227,9 +377,7 @@ def main(argv: list[str] | None = None) -> int:
 
     report = {"touched": touched, "migrated": migrated, "results": results}
     if ns.report:
-        Path(ns.report).write_text(
-            json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        Path(ns.report).write_bytes(_report_bytes(report))
 
     print(json.dumps({"touched": touched, "migrated": migrated}, ensure_ascii=False))
     return 0
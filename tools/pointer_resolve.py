@@ -14,12 +14,16 @@ This module is designed to be reusable by build_bundle/view/orchestrator later.
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import chain, islice
 from pathlib import Path
 from typing import Any
 
-from tools.manifest_io import iter_jsonl
+from tools.manifest_io import index_uri_by_sha256
 from tools.vault_ops import resolve_vault_uri_to_path, sha256_file
 
 
@@ -34,22 +38,55 @@ class ResolveOutcome:
     diagnostics: dict[str, Any]
 
 
-def _index_raw_manifest_by_sha256(raw_manifest_path: Path) -> dict[str, str]:
-    idx: dict[str, str] = {}
-    for rec in iter_jsonl(raw_manifest_path):
-        s = rec.get("sha256")
-        u = rec.get("uri")
-        if isinstance(s, str) and isinstance(u, str) and s not in idx:
-            idx[s] = u
-    return idx
+_HASH_CHUNK = 1024 * 1024
 
+# Verified digests keyed by (path, mtime_ns, size); any change to the file
+# produces a new key, so stale entries are simply never hit again.
+_SHA256_CACHE: dict[tuple[str, int, int], str] = {}
+_SHA256_CACHE_MAX = 1024
 
-def _read_line_range(p: Path, *, start: int, end: int) -> str:
+
+def _remember_sha256(key: tuple[str, int, int], digest: str) -> None:
+    if len(_SHA256_CACHE) >= _SHA256_CACHE_MAX:
+        del _SHA256_CACHE[next(iter(_SHA256_CACHE))]
+    _SHA256_CACHE[key] = digest
+
+
+def _check_line_range(start: int, end: int) -> None:
     if start < 1 or end < start:
         raise ValueError(f"invalid line_range: start={start} end={end}")
-    lines = p.read_text(encoding="utf-8", errors="replace").splitlines()
-    # 1-indexed inclusive
-    return "\n".join(lines[start - 1 : end])
+
+
+def _split_lines(f: Iterable[str]) -> Iterator[str]:
+    # str.splitlines() boundaries over a universal-newline text stream: each
+    # "\n"-terminated line is split again at \v \f \x1c-\x1e \x85 \u2028 \u2029.
+    return chain.from_iterable(line.splitlines() for line in f)
+
+
+def _read_line_range(p: Path, *, start: int, end: int) -> str:
+    _check_line_range(start, end)
+    # 1-indexed inclusive; stream so only lines up to `end` are read/decoded
+    with p.open("r", encoding="utf-8", errors="replace") as f:
+        return "\n".join(islice(_split_lines(f), start - 1, end))
+
+
+def _hash_and_read_line_range(p: Path, *, start: int, end: int) -> tuple[str, str]:
+    """Return ("sha256:<hex>", line_range snippet) from a single read of p."""
+    _check_line_range(start, end)
+    h = hashlib.sha256()
+    head: list[bytes] = []
+    newlines = 0
+    with p.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            h.update(chunk)
+            # keep bytes until line `end` is complete (lone-CR lines and the
+            # other splitlines() boundaries only make this keep more)
+            if newlines < end:
+                head.append(chunk)
+                newlines += chunk.count(b"\n")
+    text = io.StringIO(b"".join(head).decode("utf-8", errors="replace"), newline=None)
+    lines = islice(_split_lines(text), start - 1, end)
+    return "sha256:" + h.hexdigest(), "\n".join(lines)
 
 
 def resolve_pointer(
@@ -91,8 +128,7 @@ def resolve_pointer(
                 snippet=None,
                 diagnostics={"error": "legacy uri without manifest lookup"},
             )
-        idx = _index_raw_manifest_by_sha256(Path(raw_manifest_path))
-        new_uri = idx.get(sha)
+        new_uri = index_uri_by_sha256(raw_manifest_path).get(sha)
         if not new_uri:
             return ResolveOutcome(
                 ok=False,
@@ -121,7 +157,9 @@ def resolve_pointer(
             diagnostics={"error": f"resolve_vault_uri_to_path failed: {e}", **diag},
         )
 
-    if not p.exists():
+    try:
+        st = p.stat()
+    except OSError:
         return ResolveOutcome(
             ok=False,
             uri=chosen_uri,
@@ -132,8 +170,38 @@ def resolve_pointer(
             diagnostics={"error": "missing file", **diag},
         )
 
-    actual = sha256_file(p)
     expected = sha if isinstance(sha, str) else None
+
+    # Check the locator first so hashing and snippet extraction share one read.
+    line_range: tuple[int, int] | None = None
+    snippet_warning: str | None = None
+    if locator is None:
+        snippet_warning = "missing locator; no snippet extracted"
+    elif not isinstance(locator, dict):
+        snippet_warning = "invalid locator; no snippet extracted"
+    else:
+        kind = locator.get("kind")
+        if kind == "line_range":
+            try:
+                line_range = (int(locator.get("start")), int(locator.get("end")))
+                _check_line_range(*line_range)
+            except (TypeError, ValueError) as e:
+                line_range = None
+                snippet_warning = f"snippet extraction failed: {e}"
+        else:
+            snippet_warning = f"unsupported locator kind: {kind!r}"
+
+    snippet: str | None = None
+    sha_key = (str(p), st.st_mtime_ns, st.st_size)
+    actual = _SHA256_CACHE.get(sha_key)
+    if actual is None:
+        if line_range is not None:
+            actual, snippet = _hash_and_read_line_range(
+                p, start=line_range[0], end=line_range[1]
+            )
+        else:
+            actual = sha256_file(p)
+        _remember_sha256(sha_key, actual)
     if expected and actual != expected:
         return ResolveOutcome(
             ok=False,
@@ -144,24 +212,14 @@ def resolve_pointer(
             snippet=None,
             diagnostics={"error": "sha256 mismatch", **diag},
         )
-
-    # Extract snippet.
-    snippet: str | None = None
-    if locator is None:
-        diag["warning"] = "missing locator; no snippet extracted"
-    elif not isinstance(locator, dict):
-        diag["warning"] = "invalid locator; no snippet extracted"
-    else:
-        kind = locator.get("kind")
-        if kind == "line_range":
-            try:
-                snippet = _read_line_range(
-                    p, start=int(locator.get("start")), end=int(locator.get("end"))
-                )
-            except Exception as e:
-                diag["warning"] = f"snippet extraction failed: {e}"
-        else:
-            diag["warning"] = f"unsupported locator kind: {kind!r}"
+    if line_range is not None and snippet is None:
+        # digest came from the cache; only the snippet lines need reading
+        try:
+            snippet = _read_line_range(p, start=line_range[0], end=line_range[1])
+        except OSError as e:
+            snippet_warning = f"snippet extraction failed: {e}"
+    if snippet_warning is not None:
+        diag["warning"] = snippet_warning
 
     return ResolveOutcome(
         ok=True,
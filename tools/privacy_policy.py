@@ -15,10 +15,9 @@ that other tools (export, bundle builder, etc.) can reuse.
 
 from __future__ import annotations
 
-import json
+import copy
 from typing import Any
 
-
 DEFAULT_PRIVACY = {
     "level": "private",
     "redact": "none",
@@ -28,7 +27,10 @@ DEFAULT_PRIVACY = {
 
 
 def _deepcopy(obj: Any) -> Any:
-    return json.loads(json.dumps(obj))
+    # Callers (export redaction) mutate nested pointer/snapshot data, so this
+    # stays a full copy rather than a structural one. copy.deepcopy keeps YAML
+    # values (datetimes, big ints) as they are, independent of optional deps.
+    return copy.deepcopy(obj)
 
 
 def ensure_privacy_defaults(mu: dict) -> dict:
@@ -46,7 +48,8 @@ def ensure_privacy_defaults(mu: dict) -> dict:
     # defaults
     for k, v in DEFAULT_PRIVACY.items():
         if k not in privacy:
-            privacy[k] = _deepcopy(v)
+            # defaults are flat str/empty containers; a shallow copy suffices
+            privacy[k] = v.copy() if isinstance(v, (dict, list)) else v
 
     # normalize share_policy
     sp = privacy.get("share_policy")
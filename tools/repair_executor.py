@@ -19,6 +19,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from tools.mu_rewrite import rewrite_mu_pointer
 from tools.vault_doctor import repair_suggest_by_sha256
 
 
@@ -118,78 +119,34 @@ def exec_repair_pointer(task: dict, ctx: ExecContext) -> dict:
         # Optional auto-fix: write a superseding MU with updated pointer uri.
         if ctx.out_mu_dir and isinstance(mu_path, str) and mu_path:
             try:
-                import yaml
-
-                # local minimal dump/id helpers (avoid importing private helpers)
-                import hashlib
-                from datetime import datetime, timezone
-
-                def _new_mu_id() -> str:
-                    seed = f"{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}:{mu_path}".encode(
-                        "utf-8"
+                rewritten = rewrite_mu_pointer(
+                    mu_path,
+                    sha256=sha256,
+                    new_uri=suggested_uri,
+                    supersedes_id=mu_id,
+                    out_dir=ctx.out_mu_dir,
+                )
+                if rewritten is not None:
+                    new_id, fixed_mu_path, changed = rewritten
+                    outputs.append(
+                        {
+                            "kind": "MU",
+                            "id": new_id,
+                            "uri": str(fixed_mu_path),
+                            "meta": {
+                                "supersedes": mu_id,
+                                "changed_pointers": changed,
+                            },
+                        }
+                    )
+                    diags.append(
+                        {
+                            "code": "AUTO_FIXED",
+                            "msg": "wrote superseding MU with migrated pointer",
+                            "new_mu_id": new_id,
+                            "new_mu_path": str(fixed_mu_path),
+                        }
                     )
-                    rnd = hashlib.sha256(seed).hexdigest()[:10]
-                    return f"mu_migr_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}_{rnd}"
-
-                def _dump_mu(obj: dict) -> str:
-                    return yaml.safe_dump(obj, sort_keys=False, allow_unicode=True)
-
-                mu_obj = yaml.safe_load(Path(mu_path).read_text(encoding="utf-8"))
-                if isinstance(mu_obj, dict):
-                    pointers = mu_obj.get("pointer")
-                    if isinstance(pointers, list):
-                        new_pointers = []
-                        changed = 0
-                        for p in pointers:
-                            if isinstance(p, dict) and p.get("sha256") == sha256:
-                                p2 = dict(p)
-                                p2["uri"] = suggested_uri
-                                new_pointers.append(p2)
-                                changed += 1
-                            else:
-                                new_pointers.append(p)
-                        mu_obj["pointer"] = new_pointers
-
-                        # supersedes
-                        links = mu_obj.get("links")
-                        if not isinstance(links, dict):
-                            links = {}
-                        supersedes = links.get("supersedes")
-                        if supersedes is None:
-                            supersedes = []
-                        if not isinstance(supersedes, list):
-                            supersedes = [supersedes]
-                        if mu_id not in supersedes:
-                            supersedes.append(mu_id)
-                        links["supersedes"] = supersedes
-                        mu_obj["links"] = links
-
-                        new_id = _new_mu_id()
-                        mu_obj["mu_id"] = new_id
-                        out_dir = Path(ctx.out_mu_dir)
-                        out_dir.mkdir(parents=True, exist_ok=True)
-                        fixed_mu_path = out_dir / f"{new_id}.mimo"
-                        fixed_mu_path.write_text(_dump_mu(mu_obj), encoding="utf-8")
-
-                        outputs.append(
-                            {
-                                "kind": "MU",
-                                "id": new_id,
-                                "uri": str(fixed_mu_path),
-                                "meta": {
-                                    "supersedes": mu_id,
-                                    "changed_pointers": changed,
-                                },
-                            }
-                        )
-                        diags.append(
-                            {
-                                "code": "AUTO_FIXED",
-                                "msg": "wrote superseding MU with migrated pointer",
-                                "new_mu_id": new_id,
-                                "new_mu_path": str(fixed_mu_path),
-                            }
-                        )
             except Exception as e:
                 diags.append({"code": "AUTO_FIX_FAILED", "msg": str(e)})
 
@@ -23,7 +23,13 @@ from __future__ import annotations
 
 import argparse
 import subprocess
+import sys
+from pathlib import Path
 
+# Allow running as a script: ensure repo root is importable.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
 TRIGGERS = {
     "tools/manifest_sync.py",
@@ -57,13 +63,22 @@ def main() -> int:
     ap.add_argument("--head", default="HEAD")
     ns = ap.parse_args()
 
-    try:
-        run_git(["rev-parse", "--show-toplevel"])
-    except Exception as e:
-        print(f"ERROR: not a git repo or git unavailable: {e}")
-        return 3
-
-    files = changed_files(ns.base, ns.head)
+    from tools.git_changes import changed_files_pygit2
+
+    files = changed_files_pygit2(ns.base, ns.head)
+    if files is None:
+        # One `git diff` both validates the repo and lists changes.
+        try:
+            files = changed_files(ns.base, ns.head)
+        except Exception as e:
+            # outside a repo git falls back to --no-index and prints usage;
+            # the first stderr line carries the reason
+            msg = (str(e).splitlines() or [""])[0]
+            if isinstance(e, OSError) or "not a git repository" in msg.lower():
+                print(f"ERROR: not a git repo or git unavailable: {msg}")
+            else:
+                print(f"ERROR: cannot diff {ns.base}..{ns.head}: {msg}")
+            return 3
     if not files:
         print("OK: no changes detected")
         return 0
@@ -73,9 +88,7 @@ def main() -> int:
         print("OK: no example gate triggers")
         return 0
 
-    has_example_change = any(
-        any(f.startswith(pfx) for pfx in EXAMPLE_PREFIXES) for f in files
-    )
+    has_example_change = any(f.startswith(EXAMPLE_PREFIXES) for f in files)
     if has_example_change:
         print("OK: examples updated")
         return 0
@@ -24,7 +24,13 @@ from __future__ import annotations
 
 import argparse
 import subprocess
+import sys
+from pathlib import Path
 
+# Allow running as a script: ensure repo root is importable.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
 REPO_LOG_PATHS = {
     "docs/LOG.md",
@@ -39,6 +45,10 @@ TRIGGER_PREFIXES = (
     "docs/contracts/",
     "docs/adr/",
 )
+# Split once: single-segment prefixes ("src/") are a set lookup on the first
+# path component; only the nested ones need startswith.
+_TRIGGER_TOP_DIRS = frozenset(p[:-1] for p in TRIGGER_PREFIXES if p.count("/") == 1)
+_TRIGGER_NESTED = tuple(p for p in TRIGGER_PREFIXES if p.count("/") > 1)
 
 
 def run_git(args: list[str]) -> str:
@@ -64,14 +74,22 @@ def main() -> int:
     parser.add_argument("--head", default="HEAD")
     ns = parser.parse_args()
 
-    # Ensure we're in a git repo
-    try:
-        run_git(["rev-parse", "--show-toplevel"])
-    except Exception as e:
-        print(f"ERROR: not a git repo or git unavailable: {e}")
-        return 3
-
-    files = changed_files(ns.base, ns.head)
+    from tools.git_changes import changed_files_pygit2
+
+    files = changed_files_pygit2(ns.base, ns.head)
+    if files is None:
+        # One `git diff` both validates the repo and lists changes.
+        try:
+            files = changed_files(ns.base, ns.head)
+        except Exception as e:
+            # outside a repo git falls back to --no-index and prints usage;
+            # the first stderr line carries the reason
+            msg = (str(e).splitlines() or [""])[0]
+            if isinstance(e, OSError) or "not a git repository" in msg.lower():
+                print(f"ERROR: not a git repo or git unavailable: {msg}")
+            else:
+                print(f"ERROR: cannot diff {ns.base}..{ns.head}: {msg}")
+            return 3
     if not files:
         print("OK: no changes detected")
         return 0
@@ -83,7 +101,8 @@ def main() -> int:
     for f in files:
         if f in REPO_LOG_PATHS:
             continue
-        if f.startswith(TRIGGER_PREFIXES):
+        top, sep, _ = f.partition("/")
+        if (sep and top in _TRIGGER_TOP_DIRS) or f.startswith(_TRIGGER_NESTED):
             triggered = True
             break
 
@@ -15,47 +15,45 @@ v0.1 scope:
 
 from __future__ import annotations
 
-import hashlib
-import json
+import contextlib
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
-from tools.repair_executor import ExecContext, exec_task
+from tools import run_meta
+from tools.fs_walk import sorted_files
+from tools.json_io import loads_bytes
+from tools.pipeline_io import write_json, write_jsonl
 
 # No hardcoded runs root; pass --runs-root or provide --config.
 
 
-def now_run_id() -> str:
-    return datetime.now(timezone.utc).strftime("RUN-%Y%m%d-%H%M%S")
-
-
-def sha256_bytes(b: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(b)
-    return "sha256:" + h.hexdigest()
-
-
-def write_json(path: Path, obj: dict) -> str:
-    data = (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(data)
-    return sha256_bytes(data)
-
-
-def write_jsonl(path: Path, objs: list[dict]) -> str:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    data = "".join(json.dumps(o, ensure_ascii=False) + "\n" for o in objs).encode(
-        "utf-8"
-    )
-    path.write_bytes(data)
-    return sha256_bytes(data)
+def _read_small_file(path: str) -> bytes:
+    # Raw fd reads: no FileIO/buffer object and no fstat for sizing; ~2x faster
+    # than Path.read_bytes() for the few-KiB task specs.
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        while chunk := os.read(fd, 64 * 1024):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
 
 
 def iter_task_specs(tasks_dir: Path) -> list[dict]:
+    # scandir + suffix test instead of Path.glob (no fnmatch, no Path per entry)
+    with os.scandir(tasks_dir) as it:
+        names = sorted(
+            e.name for e in it if e.name.endswith(".task_spec.json") and e.is_file()
+        )
     out: list[dict] = []
-    for p in sorted(tasks_dir.glob("*.task_spec.json")):
+    for name in names:
         try:
-            obj = json.loads(p.read_text(encoding="utf-8"))
+            data = _read_small_file(os.path.join(tasks_dir, name))
+            if len(data) < 2:  # empty/truncated: cannot hold "{}", skip the parse
+                continue
+            obj = loads_bytes(data)
             if isinstance(obj, dict):
                 out.append(obj)
         except Exception:
@@ -101,8 +99,24 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="If set with --index-db, reset db before indexing",
     )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Threads executing tasks (0 = min(32, tasks)); results keep task order",
+    )
+    ap.add_argument(
+        "--ingest-workers",
+        type=int,
+        default=1,
+        help="Processes parsing fixed MU before vault ingest (0 = cpu count)",
+    )
     ns = ap.parse_args(argv)
 
+    # Heavy modules load after argparse so --help / usage errors stay fast.
+    from tools.repair_executor import ExecContext, exec_task
+    from tools.task_pool import exec_in_order
+
     vault_roots: dict[str, str] = {}
     raw_manifest = ns.raw_manifest
     runs_root: str | None = ns.runs_root
@@ -122,7 +136,10 @@ def main(argv: list[str] | None = None) -> int:
             "missing runs root: pass --runs-root or provide --config with runs_root_repair"
         )
 
-    run_id = now_run_id()
+    # one clock read: run_id and run_manifest.created_at name the same instant
+    now = datetime.now(timezone.utc)
+    run_id = now.strftime("RUN-%Y%m%d-%H%M%S")
+    created_at = now.isoformat()
     run_dir = Path(runs_root) / run_id
     run_dir.mkdir(parents=True, exist_ok=True)
 
@@ -178,18 +195,26 @@ def main(argv: list[str] | None = None) -> int:
         "run_dir": str(run_dir),
     }
     try:
-        from tools.task_journal import append_task
+        from tools.task_journal import JournalBuffer
+
+        journal = JournalBuffer(journal_db, context=journal_ctx)
     except Exception:
-        append_task = None  # type: ignore
+        journal = None  # type: ignore
 
-    for t in tasks:
-        r = exec_task(t, ctx)
-        results.append(r)
-        if append_task is not None:
-            try:
-                append_task(journal_db, t, r, context=journal_ctx)
-            except Exception:
-                pass
+    workers = ns.workers if ns.workers > 0 else min(32, len(tasks))
+    try:
+        for t, r in exec_in_order(tasks, lambda t: exec_task(t, ctx), workers=workers):
+            results.append(r)
+            if journal is not None:
+                try:
+                    journal.add(t, r)
+                except Exception:
+                    pass
+    finally:
+        if journal is not None:
+            # journal failure should not break execution
+            with contextlib.suppress(Exception):
+                journal.flush()
 
     results_sha = write_jsonl(run_dir / "task_results.jsonl", results)
 
@@ -197,12 +222,18 @@ def main(argv: list[str] | None = None) -> int:
     mu_manifest_path = None
     if vault_roots.get("default") and fixed_mu_dir.exists():
         try:
-            from tools.vault_ingest_mu import ingest_mu_file
-
-            for mu_file in sorted(fixed_mu_dir.rglob("*.mimo")):
-                ingest_mu_file(
-                    mu_file, vault_root=vault_roots["default"], vault_id="default"
-                )
+            from tools.vault_ingest_mu import ingest_mu_files
+
+            ingest_mu_files(
+                sorted_files(fixed_mu_dir, ".mimo"),
+                vault_root=vault_roots["default"],
+                vault_id="default",
+                workers=(
+                    ns.ingest_workers
+                    if ns.ingest_workers > 0
+                    else (os.cpu_count() or 1)
+                ),
+            )
             mu_manifest_path = str(
                 Path(vault_roots["default"]) / "manifests" / "mu_manifest.jsonl"
             )
@@ -223,24 +254,11 @@ def main(argv: list[str] | None = None) -> int:
             index_out = None
 
     # 6) run manifest
-    git_head = None
-    try:
-        import subprocess
-
-        git_head = (
-            subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
-                cwd=str(Path(__file__).resolve().parents[1]),
-            )
-            .decode("utf-8")
-            .strip()
-        )
-    except Exception:
-        git_head = None
+    git_head = run_meta.git_head()
 
     run_manifest = {
         "run_id": run_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": created_at,
         "tool": "bundle_repair_pipeline",
         "tooling": {"repo": "mimobrain_memory_system", "git_head": git_head},
         "inputs": {
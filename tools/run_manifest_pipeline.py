@@ -25,52 +25,21 @@ Options:
 
 from __future__ import annotations
 
-import hashlib
-import json
+import contextlib
 from datetime import datetime, timezone
 from pathlib import Path
 
-from tools.manifest_executor import ExecContext, exec_task
-from tools.manifest_sync import analyze_sync
-from tools.manifest_sync_tasks import tasks_from_report
-
+from tools import run_meta
+from tools.pipeline_io import (
+    input_sha256s,
+    input_sha256s_async,
+    write_json,
+    write_jsonl,
+)
 
 # No hardcoded runs root; pass --runs-root or provide --config.
 
 
-def now_run_id() -> str:
-    return datetime.now(timezone.utc).strftime("RUN-%Y%m%d-%H%M%S")
-
-
-def sha256_bytes(b: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(b)
-    return "sha256:" + h.hexdigest()
-
-
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return "sha256:" + h.hexdigest()
-
-
-def write_json(path: Path, obj: dict) -> str:
-    data = (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
-    path.write_bytes(data)
-    return sha256_bytes(data)
-
-
-def write_jsonl(path: Path, objs: list[dict]) -> str:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    data = "".join(json.dumps(o, ensure_ascii=False) + "\n" for o in objs).encode(
-        "utf-8"
-    )
-    path.write_bytes(data)
-    return sha256_bytes(data)
-
-
 def main(argv: list[str] | None = None) -> int:
     import argparse
 
@@ -95,8 +64,20 @@ def main(argv: list[str] | None = None) -> int:
         help="Authoritative runs root. If omitted, tries to use config.runs_root_sync.",
     )
     p.add_argument("--apply", action="store_true")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Threads executing tasks (0 = min(32, tasks)); results keep task order",
+    )
     ns = p.parse_args(argv)
 
+    # Heavy modules load after argparse so --help / usage errors stay fast.
+    from tools.manifest_executor import ExecContext, exec_task
+    from tools.manifest_sync import analyze_sync
+    from tools.manifest_sync_tasks import tasks_from_report
+    from tools.task_pool import exec_in_order
+
     runs_root: str | None = ns.runs_root
 
     vault_roots: dict[str, str] = {}
@@ -114,7 +95,14 @@ def main(argv: list[str] | None = None) -> int:
             "missing runs root: pass --runs-root or provide --config with runs_root_sync"
         )
 
-    run_id = now_run_id()
+    # Hash inputs while the pipeline runs; with --apply the base manifest may be
+    # appended to, so it is hashed after execution as before.
+    collect_input_shas = None if ns.apply else input_sha256s_async(ns.base, ns.incoming)
+
+    # one clock read: run_id and run_manifest.created_at name the same instant
+    now = datetime.now(timezone.utc)
+    run_id = now.strftime("RUN-%Y%m%d-%H%M%S")
+    created_at = now.isoformat()
     run_dir = Path(runs_root) / run_id
     run_dir.mkdir(parents=True, exist_ok=True)
 
@@ -133,19 +121,18 @@ def main(argv: list[str] | None = None) -> int:
     tasks = tasks_from_report(report)
     patch_plans_dir = run_dir / "patch_plans"
     patch_plans_dir.mkdir(parents=True, exist_ok=True)
-    if not ns.apply:
-        for t in tasks:
-            if isinstance(t, dict) and t.get("type") == "SYNC_MANIFEST_APPLY":
-                params = t.get("params")
-                if isinstance(params, dict):
-                    params["dry_run"] = True
-                    params["out_dir"] = str(patch_plans_dir)
-    else:
-        for t in tasks:
-            if isinstance(t, dict) and t.get("type") == "SYNC_MANIFEST_APPLY":
-                params = t.get("params")
-                if isinstance(params, dict):
-                    params["out_dir"] = str(patch_plans_dir)
+    out_dir = str(patch_plans_dir)
+    apply_tasks = [
+        t
+        for t in tasks
+        if isinstance(t, dict) and t.get("type") == "SYNC_MANIFEST_APPLY"
+    ]
+    for t in apply_tasks:
+        params = t.get("params")
+        if isinstance(params, dict):
+            if not ns.apply:
+                params["dry_run"] = True
+            params["out_dir"] = out_dir
     tasks_path = run_dir / f"tasks.{ns.kind}.jsonl"
     tasks_sha = write_jsonl(tasks_path, tasks)
 
@@ -161,9 +148,11 @@ def main(argv: list[str] | None = None) -> int:
         "run_dir": str(run_dir),
     }
     try:
-        from tools.task_journal import append_task
+        from tools.task_journal import JournalBuffer
+
+        journal = JournalBuffer(journal_db, context=journal_ctx)
     except Exception:
-        append_task = None  # type: ignore
+        journal = None  # type: ignore
 
     # structured logs
     try:
@@ -181,64 +170,66 @@ def main(argv: list[str] | None = None) -> int:
         log_event = None  # type: ignore
         run_log = None  # type: ignore
 
-    for t in tasks:
-        if not isinstance(t, dict):
-            continue
-        r = exec_task(t, ctx)
-        results.append(r)
-
-        if append_task is not None:
-            try:
-                append_task(journal_db, t, r, context=journal_ctx)
-            except Exception:
-                # journal failure should not break execution
-                pass
-
-        if log_event is not None:
-            try:
-                log_event(
-                    event="TASK_EXEC",
-                    log_path=run_log,
-                    run_id=run_id,
-                    run_dir=str(run_dir),
-                    task_id=r.get("task_id"),
-                    inputs=[
-                        {
-                            "kind": "TASK",
-                            "type": t.get("type"),
-                            "idempotency_key": t.get("idempotency_key"),
-                        }
-                    ],
-                    outputs=r.get("outputs"),
-                    stats={"elapsed_ms": r.get("elapsed_ms")},
-                    diagnostics={"status": r.get("status")},
-                )
-            except Exception:
-                pass
+    runnable = [t for t in tasks if isinstance(t, dict)]
+    workers = ns.workers if ns.workers > 0 else min(32, len(runnable))
+    try:
+        for t, r in exec_in_order(
+            runnable,
+            lambda t: exec_task(t, ctx),
+            workers=workers,
+            # apply may append to the base manifest that earlier VERIFY tasks read
+            serial=lambda t: t.get("type") == "SYNC_MANIFEST_APPLY",
+        ):
+            results.append(r)
+
+            if journal is not None:
+                try:
+                    journal.add(t, r)
+                except Exception:
+                    # journal failure should not break execution
+                    pass
+
+            if log_event is not None:
+                try:
+                    log_event(
+                        event="TASK_EXEC",
+                        log_path=run_log,
+                        run_id=run_id,
+                        run_dir=str(run_dir),
+                        task_id=r.get("task_id"),
+                        inputs=[
+                            {
+                                "kind": "TASK",
+                                "type": t.get("type"),
+                                "idempotency_key": t.get("idempotency_key"),
+                            }
+                        ],
+                        outputs=r.get("outputs"),
+                        stats={"elapsed_ms": r.get("elapsed_ms")},
+                        diagnostics={"status": r.get("status")},
+                    )
+                except Exception:
+                    pass
+    finally:
+        if journal is not None:
+            # journal failure should not break execution
+            with contextlib.suppress(Exception):
+                journal.flush()
 
     results_path = run_dir / f"task_results.{ns.kind}.jsonl"
     results_sha = write_jsonl(results_path, results)
 
     # 4) run manifest
-    # best-effort git head
-    git_head = None
-    try:
-        import subprocess
-
-        git_head = (
-            subprocess.check_output(
-                ["git", "rev-parse", "HEAD"],
-                cwd=str(Path(__file__).resolve().parents[1]),
-            )
-            .decode("utf-8")
-            .strip()
-        )
-    except Exception:
-        git_head = None
+    git_head = run_meta.git_head()  # best-effort
 
+    input_shas = (
+        collect_input_shas()
+        if collect_input_shas is not None
+        else input_sha256s(ns.base, ns.incoming)
+    )
     run_manifest = {
         "run_id": run_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": created_at,
         "tool": "manifest_pipeline",
         "kind": ns.kind,
         "tooling": {
@@ -248,12 +239,8 @@ def main(argv: list[str] | None = None) -> int:
         "inputs": {
             "base_path": ns.base,
             "incoming_path": ns.incoming,
-            "base_sha256": sha256_file(Path(ns.base))
-            if Path(ns.base).exists()
-            else None,
-            "incoming_sha256": sha256_file(Path(ns.incoming))
-            if Path(ns.incoming).exists()
-            else None,
+            "base_sha256": input_shas[ns.base],
+            "incoming_sha256": input_shas[ns.incoming],
             "vault_roots": vault_roots,
         },
         "outputs": {
@@ -21,8 +21,6 @@ from __future__ import annotations
 
 # ruff: noqa: E402  # This file intentionally edits sys.path for script execution.
 
-import hashlib
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -32,38 +30,14 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from tools.manifest_sync import analyze_sync
-from tools.manifest_sync_tasks import tasks_from_report
+from tools.json_io import stream_jsonl
+from tools.pipeline_io import input_sha256s_async, write_json
 
 
 # No hardcoded runs root; pass --runs-root or provide --config.
 DEFAULT_RUNS_ROOT = None
 
 
-def now_run_id() -> str:
-    return datetime.now(timezone.utc).strftime("RUN-%Y%m%d-%H%M%S")
-
-
-def sha256_bytes(b: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(b)
-    return "sha256:" + h.hexdigest()
-
-
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return "sha256:" + h.hexdigest()
-
-
-def write_json(path: Path, obj: dict) -> str:
-    data = (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
-    path.write_bytes(data)
-    return sha256_bytes(data)
-
-
 def main(argv: list[str] | None = None) -> int:
     import argparse
 
@@ -83,6 +57,10 @@ def main(argv: list[str] | None = None) -> int:
     )
     ns = p.parse_args(argv)
 
+    # Heavy modules load after argparse so --help / usage errors stay fast.
+    from tools.manifest_sync import analyze_sync
+    from tools.manifest_sync_tasks import iter_tasks_from_report
+
     runs_root: str | None = ns.runs_root
     if ns.config:
         from tools.ms_config import load_config
@@ -95,7 +73,14 @@ def main(argv: list[str] | None = None) -> int:
             "missing runs root: pass --runs-root or provide --config with runs_root_sync"
         )
 
-    run_id = now_run_id()
+    # sync only reads base/incoming, so hash them on background threads
+    # (hashlib releases the GIL) while analyze_sync runs
+    collect_input_shas = input_sha256s_async(ns.base, ns.incoming)
+
+    # one clock read: run_id and run_manifest.created_at name the same instant
+    now = datetime.now(timezone.utc)
+    run_id = now.strftime("RUN-%Y%m%d-%H%M%S")
+    created_at = now.isoformat()
     run_dir = Path(runs_root) / run_id
     run_dir.mkdir(parents=True, exist_ok=True)
 
@@ -103,27 +88,21 @@ def main(argv: list[str] | None = None) -> int:
     report_path = run_dir / f"sync_report.{ns.kind}.json"
     report_sha = write_json(report_path, report)
 
-    tasks = tasks_from_report(report)
     tasks_path = run_dir / f"tasks.{ns.kind}.jsonl"
-    with tasks_path.open("w", encoding="utf-8") as f:
-        for t in tasks:
-            f.write(json.dumps(t, ensure_ascii=False) + "\n")
-    tasks_sha = sha256_file(tasks_path)
+    # tasks are generated, encoded and hashed as they are written (no list)
+    tasks_sha = stream_jsonl(tasks_path, iter_tasks_from_report(report))
 
+    input_shas = collect_input_shas()
     run_manifest = {
         "run_id": run_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": created_at,
         "tool": "manifest_sync",
         "kind": ns.kind,
         "inputs": {
             "base_path": ns.base,
             "incoming_path": ns.incoming,
-            "base_sha256": sha256_file(Path(ns.base))
-            if Path(ns.base).exists()
-            else None,
-            "incoming_sha256": sha256_file(Path(ns.incoming))
-            if Path(ns.incoming).exists()
-            else None,
+            "base_sha256": input_shas[ns.base],
+            "incoming_sha256": input_shas[ns.incoming],
         },
         "outputs": {
             "report_path": str(report_path),
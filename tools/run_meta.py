@@ -0,0 +1,68 @@
+"""Run metadata shared by the pipelines (best-effort git head).
+
+git_head() reads .git/HEAD and the ref it names (loose ref or packed-refs)
+directly, so a run manifest costs two small file reads instead of spawning
+`git rev-parse HEAD`. Anything unusual (worktree/submodule .git files,
+unborn branches, symbolic ref chains) falls back to the subprocess.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+
+def _read_ref(git_dir: Path, ref: str) -> str | None:
+    try:
+        sha = (git_dir / ref).read_text(encoding="utf-8").strip()
+    except OSError:
+        sha = None
+    if sha is not None:
+        return sha if _SHA_RE.fullmatch(sha) else None
+
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except OSError:
+        return None
+    for line in packed.splitlines():
+        # "<sha> <ref>"; comments start with '#', peeled tags with '^'
+        sha, _, name = line.partition(" ")
+        if name == ref and _SHA_RE.fullmatch(sha):
+            return sha
+    return None
+
+
+def _git_head_from_files(repo_root: Path) -> str | None:
+    git_dir = repo_root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:  # no repo, or .git is a file (worktree/submodule)
+        return None
+    if head.startswith("ref: "):
+        return _read_ref(git_dir, head[5:].strip())
+    return head if _SHA_RE.fullmatch(head) else None
+
+
+def git_head(repo_root: Path = REPO_ROOT) -> str | None:
+    """Commit checked out in repo_root, or None when unavailable."""
+    sha = _git_head_from_files(repo_root)
+    if sha is not None:
+        return sha
+    import subprocess  # only needed on the fallback path
+
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"],
+                cwd=str(repo_root),
+                stderr=subprocess.DEVNULL,
+            )
+            .decode("utf-8")
+            .strip()
+        )
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
@@ -0,0 +1,29 @@
+"""Compiled JSON Schema validators, cached per schema file.
+
+A validator is built once per (absolute path, mtime_ns): repeated validations
+in one process (doctor over many manifests, a bundle per task) skip reading,
+parsing and compiling the schema, while edits to the schema are picked up.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from tools.json_io import loads_bytes
+
+
+def validator_for(schema_path: str | Path) -> Any:
+    """Draft 2020-12 validator for the schema file (requires jsonschema)."""
+    key = os.path.abspath(schema_path)
+    return _validator(key, os.stat(key).st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _validator(path: str, mtime_ns: int) -> Any:
+    from jsonschema import Draft202012Validator  # dev dep; imported on first use
+
+    with open(path, "rb") as f:
+        return Draft202012Validator(loads_bytes(f.read()))
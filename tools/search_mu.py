@@ -8,18 +8,27 @@ Usage:
 Output: JSON with results (mu_id + reason + summary preview).
 
 Notes:
-- Uses FTS5 over mu_fts.summary.
+- Uses FTS5 over mu_fts.summary; queries with punctuation are matched as one
+  quoted phrase. Non-ASCII queries (CJK, kana, Hangul are not segmented by
+  the default tokenizer) use LIKE.
 - Time filtering is string-based; expects ISO timestamps where lexical order matches time.
 """
 
 from __future__ import annotations
 
 import json
+import re
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+from tools.json_io import dumps_bytes
 from tools.meta_db import connect, init_db
 
+# Membership fences up to this size drive non-FTS searches (see _build_sql).
+ALLOW_DRIVE_MAX_IDS = 128
+
 
 @dataclass
 class SearchResult:
@@ -37,8 +46,13 @@ def _rank_privacy(level: str | None) -> int:
 
 
 def _make_snippet(
-    summary: str | None, query: str | None, *, max_chars: int = 220
+    summary: str | None,
+    query: str | None,
+    *,
+    max_chars: int = 220,
+    q_lower: str | None = None,
 ) -> str | None:
+    # q_lower: query.strip().lower(), precomputed once by callers looping rows
     if not summary:
         return None
     s = summary.strip()
@@ -46,7 +60,7 @@ def _make_snippet(
         return s
     if query and query.strip():
         q = query.strip()
-        i = s.lower().find(q.lower())
+        i = s.lower().find(q.lower() if q_lower is None else q_lower)
         if i >= 0:
             start = max(0, i - 60)
             end = min(len(s), i + len(q) + 120)
@@ -59,27 +73,103 @@ def _make_snippet(
     return s[: max_chars - 1] + "…"
 
 
-def _looks_like_cjk(s: str) -> bool:
-    # Very small heuristic: if the query contains any CJK Unified Ideographs,
-    # FTS5 default tokenizer may not segment it well. Fall back to LIKE.
-    return any("\u4e00" <= ch <= "\u9fff" for ch in s)
+# anything but ASCII letters/digits, '_' and ' '
+_UNSAFE_FTS_RE = re.compile("[^A-Za-z0-9_ ]")
+
+
+def _looks_unsegmented(s: str) -> bool:
+    # unicode61 does not segment CJK, kana, Hangul, Thai, ...; a phrase of such
+    # text matches nothing unless it is a whole token. Any non-ASCII query
+    # falls back to LIKE.
+    return not s.isascii()
 
 
 def _looks_like_unsafe_fts(s: str) -> bool:
     # FTS5 MATCH has its own query syntax and is easy to break with punctuation,
-    # leading dashes, operators, etc. We prefer LIKE unless the query is simple.
-    s = s.strip()
-    if not s:
-        return False
-    allowed = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _")
-    for ch in s:
-        if ch in allowed:
-            continue
-        # allow basic CJK too (handled by _looks_like_cjk)
-        if "\u4e00" <= ch <= "\u9fff":
-            continue
-        return True
-    return False
+    # leading dashes, operators, etc. Such queries are matched as one quoted
+    # phrase (_fts_phrase) instead of being passed through as syntax.
+    return _UNSAFE_FTS_RE.search(s.strip()) is not None
+
+
+def _fts_phrase(s: str) -> str:
+    # A double-quoted FTS5 string is a phrase: punctuation inside it only splits
+    # tokens, never acts as an operator. '"' is escaped by doubling.
+    return '"' + s.replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=64)
+def _build_sql(
+    fts: bool,
+    like: bool,
+    has_since: bool,
+    has_until: bool,
+    has_privacy: bool,
+    target_rank: int,
+    has_tag: bool,
+    has_allow: bool,
+    allow_drives: bool = False,
+) -> str:
+    """SQL text for one filter shape.
+
+    Values are always bound as named parameters, so a given shape yields the
+    same text every call and sqlite3's statement cache reuses the prepared plan.
+    """
+    where = []
+    joins = []
+
+    # FTS queries drive from mu_fts and reach mu by rowid (content_rowid), so
+    # the MATCH uses the FTS index and no per-row mu_fts.mu_id lookup is needed.
+    from_sql = "FROM mu"
+    score_expr = "NULL"  # LIKE fallback / plain listing: no bm25 score
+    if fts:
+        from_sql = "FROM mu_fts JOIN mu ON mu.rowid = mu_fts.rowid"
+        where.append("mu_fts MATCH :q")
+        score_expr = "bm25(mu_fts)"
+    elif like:
+        where.append("mu.summary LIKE :q_like")
+    if allow_drives:
+        # Small fence, no FTS: look the allowed ids up by primary key. Without
+        # table stats the planner would otherwise scan a time/privacy index and
+        # probe the list per row (CROSS JOIN pins the join order).
+        from_sql = (
+            "FROM json_each(:allow_ids) AS allow_ids "
+            "CROSS JOIN mu ON mu.mu_id = allow_ids.value"
+        )
+
+    if has_since:
+        where.append("mu.time >= :since")
+    if has_until:
+        where.append("mu.time <= :until")
+    if has_privacy:
+        where.append("mu.privacy_level = :privacy")
+
+    # Target-level visibility in SQL (same ranks as _rank_privacy; NULL/unknown
+    # levels rank as private), so LIMIT counts only rows the caller may see.
+    if target_rank < _rank_privacy("private"):
+        visible = [
+            lvl for lvl in ("public", "org") if _rank_privacy(lvl) <= target_rank
+        ]
+        where.append(
+            "mu.privacy_level IN (" + ",".join(f"'{lvl}'" for lvl in visible) + ")"
+        )
+
+    if has_tag:
+        joins.append("JOIN mu_tag ON mu_tag.mu_id = mu.mu_id")
+        where.append("mu_tag.tag = :tag")
+    if has_allow and not allow_drives:
+        where.append("mu.mu_id IN (SELECT value FROM json_each(:allow_ids))")
+
+    q = (
+        f"SELECT mu.mu_id, mu.summary, mu.privacy_level, mu.path, {score_expr} as score {from_sql} "
+        + " ".join(joins)
+    )
+    if where:
+        q += " WHERE " + " AND ".join(where)
+    if fts:
+        q += " ORDER BY score ASC"
+    else:
+        q += " ORDER BY mu.time DESC NULLS LAST"
+    return q + " LIMIT :limit"
 
 
 def search_mu(
@@ -97,90 +187,62 @@ def search_mu(
 ) -> list[SearchResult]:
     init_db(db_path)
 
-    params: dict[str, object] = {"limit": int(limit)}
-    where = []
-    joins = []
-
-    # base select
-    use_like = bool(
-        query
-        and query.strip()
-        and (_looks_like_cjk(query.strip()) or _looks_like_unsafe_fts(query.strip()))
-    )
+    has_q = bool(query and query.strip())
+    fts_q = query
+    use_like = False
+    if has_q:
+        qs = query.strip()
+        if _looks_unsegmented(qs) or not any(ch.isalnum() for ch in qs):
+            use_like = True  # no tokens FTS5 could match
+        elif _looks_like_unsafe_fts(qs):
+            fts_q = _fts_phrase(qs)  # stays on the FTS index, keeps bm25
+    target_rank = _rank_privacy(target_level)
 
-    if query and query.strip() and not use_like:
-        joins.append("JOIN mu_fts ON mu_fts.mu_id = mu.mu_id")
-        where.append("mu_fts MATCH :q")
-        params["q"] = query
-        score_expr = "bm25(mu_fts)"
-    elif query and query.strip() and use_like:
-        # LIKE fallback (no bm25 score)
-        where.append("mu.summary LIKE :q_like")
+    params: dict[str, object] = {"limit": int(limit)}
+    if has_q and not use_like:
+        params["q"] = fts_q
+    elif has_q:
         params["q_like"] = f"%{query.strip()}%"
-        score_expr = "NULL"
-    else:
-        score_expr = "NULL"
-
     if since:
-        where.append("mu.time >= :since")
         params["since"] = since
     if until:
-        where.append("mu.time <= :until")
         params["until"] = until
-
     if privacy:
-        where.append("mu.privacy_level = :privacy")
         params["privacy"] = privacy
-
     if tag:
-        joins.append("JOIN mu_tag ON mu_tag.mu_id = mu.mu_id")
-        where.append("mu_tag.tag = :tag")
         params["tag"] = tag
-
     if allow_mu_ids is not None:
         # Apply membership fence at the SQL level.
         if not allow_mu_ids:
             return []
-        # Use named params to avoid mixing positional + named bindings.
-        ids = sorted(allow_mu_ids)
-        ph = []
-        for i, mid in enumerate(ids):
-            k = f"allow_id_{i}"
-            ph.append(f":{k}")
-            params[k] = mid
-        where.append("mu.mu_id IN (" + ",".join(ph) + ")")
-
-    q = (
-        f"SELECT mu.mu_id, mu.summary, mu.privacy_level, mu.path, {score_expr} as score FROM mu "
-        + " ".join(joins)
+        # One JSON array parameter: binding thousands of named parameters is
+        # quadratic in the sqlite3 module and can exceed SQLITE_MAX_VARIABLE_NUMBER.
+        # (deduplicated: when the list drives the join, repeats would repeat rows)
+        params["allow_ids"] = json.dumps(list(set(allow_mu_ids)), ensure_ascii=False)
+
+    q = _build_sql(
+        has_q and not use_like,
+        has_q and use_like,
+        bool(since),
+        bool(until),
+        bool(privacy),
+        target_rank,
+        bool(tag),
+        allow_mu_ids is not None,
+        allow_mu_ids is not None
+        and len(allow_mu_ids) <= ALLOW_DRIVE_MAX_IDS
+        and not (has_q and not use_like),
     )
-    if where:
-        q += " WHERE " + " AND ".join(where)
-
-    if query and query.strip() and not use_like:
-        q += " ORDER BY score ASC"
-    else:
-        q += " ORDER BY mu.time DESC NULLS LAST"
-
-    q += " LIMIT :limit"
 
+    snippet_q = query.strip().lower() if include_snippet and has_q else None
     out: list[SearchResult] = []
     with connect(db_path) as conn:
-        rows = conn.execute(q, params).fetchall()
-
-    for r in rows:
-        mu_id = r[0]
-        summary = r[1]
-        privacy_level = r[2]
-        path = r[3]
-        score = r[4]
-
-        # Enforce target-level visibility
-        if _rank_privacy(
-            str(privacy_level) if privacy_level is not None else None
-        ) > _rank_privacy(target_level):
-            continue
+        # plain tuples (the cached connection defaults to sqlite3.Row)
+        cur = conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(q, params).fetchall()
 
+    for mu_id, summary, privacy_level, path, score in rows:
         reason: dict = {"filters": {}}
         if query and query.strip():
             reason["fts"] = {"query": query, "bm25": score}
@@ -193,7 +255,7 @@ def search_mu(
 
         if include_snippet:
             reason["snippet"] = {"max_chars": 220}
-            snippet = _make_snippet(summary, query)
+            snippet = _make_snippet(summary, query, q_lower=snippet_q)
         else:
             snippet = None
 
@@ -302,7 +364,8 @@ def main(argv: list[str] | None = None) -> int:
             for r in res
         ],
     }
-    print(json.dumps(obj, ensure_ascii=False, indent=2))
+    # orjson-encoded, same text as json.dumps(indent=2) + print's newline
+    sys.stdout.write(dumps_bytes(obj, indent=True).decode("utf-8"))
     return 0
 
 
@@ -22,10 +22,13 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from tools.json_io import dumps_sorted, loads_bytes
+
 
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -53,6 +56,10 @@ def connect(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
+    # WAL + NORMAL: a commit appends to the WAL without an fsync per transaction
+    # (the journal can lose the last commits on power loss, never corrupt).
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
     return conn
 
 
@@ -62,19 +69,27 @@ def init_db(db_path: Path) -> None:
 
 
 def _json_dumps(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, sort_keys=True)
+    # compact + sorted keys; orjson when installed (rows are hot in pipelines)
+    return dumps_sorted(obj)
 
 
-def append_task(
-    db_path: Path, spec: dict, result: dict, *, context: dict | None = None
-) -> None:
-    init_db(db_path)
+# Pipelines flush accumulated journal rows in batches of this size.
+APPEND_BATCH_SIZE = 256
+
+_INSERT_SQL = """
+INSERT OR REPLACE INTO tasks
+  (task_id, idempotency_key, type, status, created_at, elapsed_ms, spec_json, result_json, context_json)
+VALUES
+  (:task_id, :idempotency_key, :type, :status, :created_at, :elapsed_ms, :spec_json, :result_json, :context_json)
+"""
+
 
+def task_row(spec: dict, result: dict, *, context: dict | None = None) -> dict:
     task_id = result.get("task_id") or spec.get("task_id") or spec.get("id")
     if not task_id:
         raise ValueError("missing task_id")
 
-    row = {
+    return {
         "task_id": task_id,
         "idempotency_key": spec.get("idempotency_key"),
         "type": spec.get("type"),
@@ -86,19 +101,59 @@ def append_task(
         "context_json": _json_dumps(context) if context is not None else None,
     }
 
+
+def append_task_rows(db_path: Path, rows: list[dict]) -> None:
+    """Insert rows built by task_row() in a single transaction."""
+    if not rows:
+        return
     with connect(db_path) as conn:
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO tasks
-              (task_id, idempotency_key, type, status, created_at, elapsed_ms, spec_json, result_json, context_json)
-            VALUES
-              (:task_id, :idempotency_key, :type, :status, :created_at, :elapsed_ms, :spec_json, :result_json, :context_json)
-            """,
-            row,
-        )
+        conn.executescript(SCHEMA_SQL)
+        conn.executemany(_INSERT_SQL, rows)
         conn.commit()
 
 
+def append_tasks(
+    db_path: Path, items: Iterable[tuple[dict, dict, dict | None]]
+) -> None:
+    """Append (spec, result, context) triples in a single transaction."""
+    append_task_rows(db_path, [task_row(s, r, context=c) for s, r, c in items])
+
+
+def append_task(
+    db_path: Path, spec: dict, result: dict, *, context: dict | None = None
+) -> None:
+    append_tasks(db_path, [(spec, result, context)])
+
+
+class JournalBuffer:
+    """Collects task rows and appends them APPEND_BATCH_SIZE at a time.
+
+    One transaction per batch instead of one per task; call flush() at the end
+    (also on error) to write the remainder.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        context: dict | None = None,
+        batch_size: int = APPEND_BATCH_SIZE,
+    ) -> None:
+        self.db_path = db_path
+        self.context = context
+        self.batch_size = batch_size
+        self.rows: list[dict] = []
+
+    def add(self, spec: dict, result: dict) -> None:
+        self.rows.append(task_row(spec, result, context=self.context))
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        rows, self.rows = self.rows, []
+        append_task_rows(self.db_path, rows)
+
+
 def query_tasks(
     db_path: Path,
     *,
@@ -135,8 +190,8 @@ def load_task(db_path: Path, task_id: str) -> tuple[dict, dict, dict | None]:
         ).fetchone()
     if not row:
         raise KeyError(task_id)
-    ctx = json.loads(row["context_json"]) if row["context_json"] else None
-    return json.loads(row["spec_json"]), json.loads(row["result_json"]), ctx
+    ctx = loads_bytes(row["context_json"]) if row["context_json"] else None
+    return loads_bytes(row["spec_json"]), loads_bytes(row["result_json"]), ctx
 
 
 def replay_task(db_path: Path, task_id: str) -> dict:
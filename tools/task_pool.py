@@ -0,0 +1,40 @@
+"""Run pipeline tasks on a thread pool while keeping input order.
+
+Task executors are I/O-bound (manifest/MU reads, small file writes), so
+threads overlap that I/O. Results are yielded in input order, so callers can
+journal/log from the calling thread exactly as in a serial loop.
+
+Tasks for which `serial(task)` is true act as barriers: they start only after
+every earlier task has finished and run alone (e.g. a manifest apply that
+mutates files read by earlier VERIFY tasks).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+
+def exec_in_order(
+    tasks: list[dict],
+    run: Callable[[dict], dict],
+    *,
+    workers: int = 1,
+    serial: Callable[[dict], bool] | None = None,
+) -> Iterator[tuple[dict, dict]]:
+    """Yield (task, result) for each task, in input order."""
+    if workers <= 1 or len(tasks) <= 1:
+        for t in tasks:
+            yield t, run(t)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(tasks))) as ex:
+        segment: list[dict] = []
+        for t in tasks:
+            if serial is not None and serial(t):
+                yield from zip(segment, ex.map(run, segment))
+                segment = []
+                yield t, run(t)
+            else:
+                segment.append(t)
+        yield from zip(segment, ex.map(run, segment))
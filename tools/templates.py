@@ -8,12 +8,18 @@ This module is intentionally small: load, validate, return dicts.
 
 from __future__ import annotations
 
-import json
+import copy
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 from jsonschema import Draft202012Validator
 
+from tools.schema_cache import validator_for
+
+# libyaml-backed loader when available (same safe semantics, much faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def repo_root() -> Path:
     return Path(__file__).resolve().parent.parent
@@ -27,26 +33,59 @@ def template_schema_path() -> Path:
     return repo_root() / "docs" / "contracts" / "template_v0_1.schema.json"
 
 
-def load_template(name: str) -> dict:
-    path = templates_dir() / f"{name}.yaml"
-    if not path.exists():
-        raise FileNotFoundError(f"missing template: {name} ({path})")
-    obj = yaml.safe_load(path.read_text(encoding="utf-8"))
+def _template_path(name: str) -> Path:
+    return templates_dir() / f"{name}.yaml"
+
+
+def _mtime_ns(path: Path, what: str) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"missing {what} ({path})") from None
+
+
+def _parse_template(path: Path) -> dict:
+    obj = yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
     if not isinstance(obj, dict):
         raise TypeError(f"template must be a mapping: {path}")
     return obj
 
 
-def validate_template(obj: dict, schema: dict) -> list[str]:
-    v = Draft202012Validator(schema)
+def load_template(name: str) -> dict:
+    path = _template_path(name)
+    if not path.exists():
+        raise FileNotFoundError(f"missing template: {name} ({path})")
+    return _parse_template(path)
+
+
+def _format_errors(v: Draft202012Validator, obj: dict) -> list[str]:
     errors = sorted(v.iter_errors(obj), key=lambda e: (list(e.path), e.message))
     return [f"{list(e.path)}: {e.message}" for e in errors]
 
 
-def load_and_validate_template(name: str) -> dict:
-    obj = load_template(name)
-    schema = json.loads(template_schema_path().read_text(encoding="utf-8"))
-    errs = validate_template(obj, schema)
+def validate_template(obj: dict, schema: dict) -> list[str]:
+    return _format_errors(Draft202012Validator(schema), obj)
+
+
+# Parsed schema/template and validation results are cached per file mtime, so
+# repeated calls in one process (e.g. a bundle per task) skip disk + validation
+# while edits to the files are still picked up.
+@lru_cache(maxsize=64)
+def _validated_template(
+    name: str, path: Path, mtime_ns: int, schema_path: Path, schema_mtime_ns: int
+) -> dict:
+    obj = _parse_template(path)
+    errs = _format_errors(validator_for(schema_path), obj)
     if errs:
         raise ValueError(f"invalid template {name}: {errs[:5]}")
     return obj
+
+
+def load_and_validate_template(name: str) -> dict:
+    path = _template_path(name)
+    mtime_ns = _mtime_ns(path, f"template: {name}")
+    schema_path = template_schema_path()
+    obj = _validated_template(
+        name, path, mtime_ns, schema_path, _mtime_ns(schema_path, "template schema")
+    )
+    return copy.deepcopy(obj)  # callers get their own dict, not the cached one
@@ -13,6 +13,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from tools.json_io import loads_bytes
+
 
 def load_schema(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
@@ -20,29 +22,28 @@ def load_schema(path: Path) -> dict:
 
 def doctor_manifest(manifest_path: Path, schema_path: Path) -> list[str]:
     """Return a list of error messages."""
-    import jsonschema  # dev dep
+    from tools.schema_cache import validator_for  # jsonschema is a dev dep
 
     errors: list[str] = []
-    schema = load_schema(schema_path)
-    validator = jsonschema.Draft202012Validator(schema)
+    validator = validator_for(schema_path)
 
     if not manifest_path.exists():
         return [f"missing manifest: {manifest_path}"]
 
-    for i, line in enumerate(
-        manifest_path.read_text(encoding="utf-8").splitlines(), start=1
-    ):
-        if not line.strip():
-            continue
-        try:
-            obj = json.loads(line)
-        except Exception as e:
-            errors.append(f"line {i}: invalid json: {e}")
-            continue
-        try:
-            validator.validate(obj)
-        except Exception as e:
-            errors.append(f"line {i}: schema error: {e}")
+    # streamed as raw bytes: memory stays O(longest line) and loads_bytes decodes
+    with manifest_path.open("rb") as f:
+        for i, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                obj = loads_bytes(line)
+            except Exception as e:
+                errors.append(f"line {i}: invalid json: {e}")
+                continue
+            try:
+                validator.validate(obj)
+            except Exception as e:
+                errors.append(f"line {i}: schema error: {e}")
 
     return errors
 
@@ -59,10 +60,14 @@ def verify_manifest(manifest_path: Path, *, vault_roots: dict[str, str]) -> list
 
 
 def repair_suggest_by_sha256(manifest_path: Path, *, sha256: str) -> str | None:
-    """Suggest a URI for a sha256 by searching the manifest."""
-    from .manifest_io import iter_jsonl
+    """Suggest a URI for a sha256 by searching the manifest.
+
+    Uses the manifest's sha256 index (built once per manifest mtime/size), so
+    repeated suggestions against an unchanged manifest are dict lookups.
+    """
+    from .manifest_io import index_uri_by_sha256
     from .vault_ops import repair_uri_by_sha256
 
     return repair_uri_by_sha256(
-        sha256=sha256, manifest_records=iter_jsonl(manifest_path)
+        sha256=sha256, manifest_records=index_uri_by_sha256(manifest_path)
     )
@@ -14,14 +14,16 @@ Notes:
 from __future__ import annotations
 
 import mimetypes
-import shutil
+import os
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
-from tools.manifest_io import append_jsonl
-from tools.vault_ops import sha256_file
+from tools.fs_walk import sorted_files
+from tools.manifest_io import ManifestWriter, append_jsonl
+from tools.vault_ops import copy_file, sha256_file
 
 
 @dataclass(frozen=True)
@@ -33,21 +35,12 @@ class IngestResult:
 
 
 def _utc_now_iso() -> str:
-    return (
-        datetime.now(timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
+    return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def _mtime_iso(p: Path) -> str | None:
-    try:
-        ts = p.stat().st_mtime
-    except Exception:
-        return None
+def _mtime_iso(ts: float) -> str:
     return (
-        datetime.fromtimestamp(ts, timezone.utc)
+        datetime.fromtimestamp(ts, UTC)
         .replace(microsecond=0)
         .isoformat()
         .replace("+00:00", "Z")
@@ -55,16 +48,32 @@ def _mtime_iso(p: Path) -> str | None:
 
 
 def _guess_mime(p: Path) -> str:
-    mt, _ = mimetypes.guess_type(str(p))
+    # Vault paths are "<sha256 hex><last suffix, lowercased>", so the suffix alone
+    # decides the type; memoized since batches repeat a handful of suffixes.
+    return _mime_for_suffix(p.suffix)
+
+
+@lru_cache(maxsize=256)
+def _mime_for_suffix(suffix: str) -> str:
+    mt, _ = mimetypes.guess_type("x" + suffix)
     return mt or "application/octet-stream"
 
 
-def _dest_relpath_for_raw(*, raw_hex: str, src: Path) -> Path:
+def _dest_relpath_for_raw(
+    *, raw_hex: str, src: Path, now: datetime | None = None
+) -> Path:
     # v0.1: year/month + full sha256 hex + original suffix (if any)
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(UTC)
     suffix = src.suffix.lower()
     # normalize very long suffix chains (".tar.gz")? keep last suffix only for v0.1
-    return Path(f"{now.year:04d}") / f"{now.month:02d}" / f"{raw_hex}{suffix}"
+    return Path(f"{now.year:04d}/{now.month:02d}/{raw_hex}{suffix}")
+
+
+def _manifest_path(vault_root: Path, manifest_path: str | Path | None) -> Path:
+    if manifest_path is None:
+        return vault_root / "manifests" / "raw_manifest.jsonl"
+    return Path(manifest_path)
 
 
 def ingest_file(
@@ -74,32 +83,44 @@ def ingest_file(
     vault_id: str = "default",
     copy_mode: str = "copy2",
     manifest_path: str | Path | None = None,
+    sha256: str | None = None,
+    manifest_writer: ManifestWriter | None = None,
+    now: datetime | None = None,
 ) -> IngestResult:
+    """Copy src into the vault and append its raw manifest line.
+
+    sha256: precomputed sha256_file(src), if the caller already has it.
+    manifest_writer: open writer for the manifest (batch callers); else the
+    line is appended with append_jsonl.
+    now: UTC time picking the yyyy/mm destination dir (batch callers pass one
+    for the whole batch); defaults to the current time.
+    """
     src_p = Path(src)
-    if not src_p.exists() or not src_p.is_file():
+    if not src_p.is_file():  # one stat; False for a missing path too
         raise FileNotFoundError(src_p)
 
     vault_root_p = Path(vault_root)
-    if manifest_path is None:
-        manifest_path_p = vault_root_p / "manifests" / "raw_manifest.jsonl"
-    else:
-        manifest_path_p = Path(manifest_path)
+    manifest_path_p = _manifest_path(vault_root_p, manifest_path)
 
-    sha = sha256_file(src_p)
+    sha = sha256 if sha256 is not None else sha256_file(src_p)
     raw_id = sha
     raw_hex = sha.split(":", 1)[1]
 
-    rel = _dest_relpath_for_raw(raw_hex=raw_hex, src=src_p)
+    rel = _dest_relpath_for_raw(raw_hex=raw_hex, src=src_p, now=now)
     dest_path = vault_root_p / "raw" / rel
     dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if not dest_path.exists():
+    # one stat of the destination serves the dedup check and the manifest fields
+    try:
+        st = dest_path.stat()
+    except FileNotFoundError:
         if copy_mode == "copy2":
-            shutil.copy2(src_p, dest_path)
+            copy_file(src_p, dest_path)
         elif copy_mode == "copy":
-            shutil.copy(src_p, dest_path)
+            copy_file(src_p, dest_path, copy_stat=False)
         else:
             raise ValueError(f"unknown copy_mode: {copy_mode}")
+        st = dest_path.stat()
 
     uri = f"vault://{vault_id}/raw/{rel.as_posix()}"
 
@@ -107,25 +128,73 @@ def ingest_file(
         "raw_id": raw_id,
         "uri": uri,
         "sha256": sha,
-        "size_bytes": int(dest_path.stat().st_size),
-        "mtime": _mtime_iso(dest_path),
+        "size_bytes": int(st.st_size),
+        "mtime": _mtime_iso(st.st_mtime),
         "mime": _guess_mime(dest_path),
         "ingested_at": _utc_now_iso(),
     }
-    append_jsonl(manifest_path_p, rec)
+    if manifest_writer is not None:
+        manifest_writer.write(rec)
+    else:
+        append_jsonl(manifest_path_p, rec)
 
     return IngestResult(
         raw_id=raw_id, uri=uri, dest_path=dest_path, manifest_path=manifest_path_p
     )
 
 
+def ingest_files(
+    srcs: list[str | Path],
+    *,
+    vault_root: str | Path,
+    vault_id: str = "default",
+    copy_mode: str = "copy2",
+    manifest_path: str | Path | None = None,
+    workers: int = 1,
+) -> list[IngestResult]:
+    """Ingest files in input order; workers > 1 hashes them on a thread pool.
+
+    Manifest lines go through one ManifestWriter for the whole batch. The
+    yyyy/mm destination dir is taken once for the batch; ingested_at stays a
+    per-file timestamp.
+
+    sha256 runs with the GIL released, so threads hash files in parallel. Copies
+    and manifest appends stay in this thread, in input order, so raw_manifest.jsonl
+    has a single writer and the same lines as a serial run (and files with equal
+    content never race for the same destination).
+    """
+    manifest_path_p = _manifest_path(Path(vault_root), manifest_path)
+    with ManifestWriter(manifest_path_p) as w:
+        kw: dict[str, Any] = {
+            "vault_root": vault_root,
+            "vault_id": vault_id,
+            "copy_mode": copy_mode,
+            "manifest_path": manifest_path_p,
+            "manifest_writer": w,
+            "now": datetime.now(UTC),
+        }
+        if workers <= 1 or len(srcs) <= 1:
+            return [ingest_file(s, **kw) for s in srcs]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _sha_or_none(s: str | Path) -> str | None:
+            try:
+                return sha256_file(Path(s))
+            except OSError:  # ingest_file reports it (same error as a serial run)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(srcs))) as ex:
+            shas = ex.map(_sha_or_none, srcs)
+            return [ingest_file(s, sha256=sha, **kw) for s, sha in zip(srcs, shas)]
+
+
 def iter_files(inp: Path) -> Iterable[Path]:
     if inp.is_file():
         yield inp
         return
-    for p in sorted(inp.rglob("*")):
-        if p.is_file():
-            yield p
+    for p in sorted_files(inp):
+        yield Path(p)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -145,24 +214,28 @@ def main(argv: list[str] | None = None) -> int:
         help="raw_manifest.jsonl path (default: <vault-root>/manifests/raw_manifest.jsonl)",
     )
     ap.add_argument("--copy-mode", choices=["copy2", "copy"], default="copy2")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Threads hashing input files (0 = cpu count); manifest keeps input order",
+    )
     ns = ap.parse_args(argv)
 
     inp = Path(ns.inp)
     if not inp.exists():
         raise SystemExit(f"missing input: {inp}")
 
-    count = 0
-    for p in iter_files(inp):
-        ingest_file(
-            p,
-            vault_root=ns.vault_root,
-            vault_id=ns.vault_id,
-            copy_mode=ns.copy_mode,
-            manifest_path=ns.manifest,
-        )
-        count += 1
-
-    print(f"ingested_files={count}")
+    res = ingest_files(
+        list(iter_files(inp)),
+        vault_root=ns.vault_root,
+        vault_id=ns.vault_id,
+        copy_mode=ns.copy_mode,
+        manifest_path=ns.manifest,
+        workers=ns.workers if ns.workers > 0 else (os.cpu_count() or 1),
+    )
+
+    print(f"ingested_files={len(res)}")
     return 0
 
 
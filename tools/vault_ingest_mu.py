@@ -21,33 +21,35 @@ Notes:
 
 from __future__ import annotations
 
-import shutil
+import os
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from tools.manifest_io import append_jsonl
+from tools.manifest_io import ManifestWriter, append_jsonl
+from tools.vault_ops import copy_file
+
+# libyaml-backed loader when available (same safe semantics, much faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def _utc_now_iso() -> str:
-    return (
-        datetime.now(timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
+    return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def _dest_relpath_for_mu(*, mu_id: str) -> Path:
-    now = datetime.now(timezone.utc)
-    return Path(f"{now.year:04d}") / f"{now.month:02d}" / f"{mu_id}.mimo"
+def _dest_relpath_for_mu(*, mu_id: str, now: datetime | None = None) -> Path:
+    if now is None:
+        now = datetime.now(UTC)
+    return Path(f"{now.year:04d}/{now.month:02d}/{mu_id}.mimo")
 
 
 def _load_mu(path: Path) -> dict[str, Any]:
-    obj = yaml.safe_load(path.read_text(encoding="utf-8", errors="replace"))
+    obj = yaml.load(
+        path.read_text(encoding="utf-8", errors="replace"), Loader=_YAML_LOADER
+    )
     if not isinstance(obj, dict):
         raise ValueError(f"MU is not a mapping: {path}")
     return obj
@@ -61,25 +63,12 @@ class IngestMuResult:
     manifest_path: Path
 
 
-def ingest_mu_file(
-    src: str | Path,
-    *,
-    vault_root: str | Path,
-    vault_id: str = "default",
-    copy_mode: str = "copy2",
-    manifest_path: str | Path | None = None,
-) -> IngestMuResult:
-    src_p = Path(src)
-    if not src_p.exists() or not src_p.is_file():
-        raise FileNotFoundError(src_p)
-
-    vault_root_p = Path(vault_root)
-    if manifest_path is None:
-        manifest_path_p = vault_root_p / "manifests" / "mu_manifest.jsonl"
-    else:
-        manifest_path_p = Path(manifest_path)
+def read_mu_fields(src: str | Path) -> dict[str, Any]:
+    """Parse an MU and return the validated fields its manifest line needs.
 
-    mu = _load_mu(src_p)
+    Pure (no vault writes), so it can run in worker processes.
+    """
+    mu = _load_mu(Path(src))
     mu_id = mu.get("mu_id") or mu.get("id")
     schema_version = mu.get("schema_version")
     content_hash = mu.get("content_hash")
@@ -107,15 +96,59 @@ def ingest_mu_file(
     # stable unique
     source_raw_ids = sorted(set(source_raw_ids))
 
-    rel = _dest_relpath_for_mu(mu_id=mu_id)
+    return {
+        "mu_id": mu_id,
+        "schema_version": schema_version,
+        "source_raw_ids": source_raw_ids,
+        "mu_key": mu_key,
+        "content_hash": content_hash,
+    }
+
+
+def _manifest_path(vault_root: Path, manifest_path: str | Path | None) -> Path:
+    if manifest_path is None:
+        return vault_root / "manifests" / "mu_manifest.jsonl"
+    return Path(manifest_path)
+
+
+def ingest_mu_file(
+    src: str | Path,
+    *,
+    vault_root: str | Path,
+    vault_id: str = "default",
+    copy_mode: str = "copy2",
+    manifest_path: str | Path | None = None,
+    mu_fields: dict[str, Any] | None = None,
+    manifest_writer: ManifestWriter | None = None,
+    now: datetime | None = None,
+) -> IngestMuResult:
+    """Copy an MU into the vault and append its mu_manifest line.
+
+    mu_fields: precomputed read_mu_fields(src), if the caller already has it.
+    manifest_writer: open writer for the manifest (batch callers); else the
+    line is appended with append_jsonl.
+    now: UTC time picking the yyyy/mm destination dir (batch callers pass one
+    for the whole batch); defaults to the current time.
+    """
+    src_p = Path(src)
+    if not src_p.is_file():  # one stat; False for a missing path too
+        raise FileNotFoundError(src_p)
+
+    vault_root_p = Path(vault_root)
+    manifest_path_p = _manifest_path(vault_root_p, manifest_path)
+
+    fields = mu_fields if mu_fields is not None else read_mu_fields(src_p)
+    mu_id = fields["mu_id"]
+
+    rel = _dest_relpath_for_mu(mu_id=mu_id, now=now)
     dest_path = vault_root_p / "mu" / rel
     dest_path.parent.mkdir(parents=True, exist_ok=True)
 
     if not dest_path.exists():
         if copy_mode == "copy2":
-            shutil.copy2(src_p, dest_path)
+            copy_file(src_p, dest_path)
         elif copy_mode == "copy":
-            shutil.copy(src_p, dest_path)
+            copy_file(src_p, dest_path, copy_stat=False)
         else:
             raise ValueError(f"unknown copy_mode: {copy_mode}")
 
@@ -123,20 +156,65 @@ def ingest_mu_file(
 
     rec = {
         "mu_id": mu_id,
-        "schema_version": schema_version,
+        "schema_version": fields["schema_version"],
         "uri": uri,
-        "source_raw_ids": source_raw_ids,
-        "mu_key": mu_key,
-        "content_hash": content_hash,
+        "source_raw_ids": fields["source_raw_ids"],
+        "mu_key": fields["mu_key"],
+        "content_hash": fields["content_hash"],
         "created_at": _utc_now_iso(),
     }
-    append_jsonl(manifest_path_p, rec)
+    if manifest_writer is not None:
+        manifest_writer.write(rec)
+    else:
+        append_jsonl(manifest_path_p, rec)
 
     return IngestMuResult(
         mu_id=mu_id, uri=uri, dest_path=dest_path, manifest_path=manifest_path_p
     )
 
 
+def ingest_mu_files(
+    srcs: list[str | Path],
+    *,
+    vault_root: str | Path,
+    vault_id: str = "default",
+    copy_mode: str = "copy2",
+    manifest_path: str | Path | None = None,
+    workers: int = 1,
+) -> list[IngestMuResult]:
+    """Ingest MU files in input order; workers > 1 parses them in a process pool.
+
+    Only the YAML parse runs in workers. Copies and manifest appends stay in
+    this process, in input order, so mu_manifest.jsonl has a single writer and
+    the same content as a serial run (including stopping at the first error).
+    Manifest lines go through one ManifestWriter for the whole batch. The
+    yyyy/mm destination dir is taken once for the batch; created_at stays a
+    per-file timestamp.
+    """
+    manifest_path_p = _manifest_path(Path(vault_root), manifest_path)
+    with ManifestWriter(manifest_path_p) as w:
+        kw: dict[str, Any] = {
+            "vault_root": vault_root,
+            "vault_id": vault_id,
+            "copy_mode": copy_mode,
+            "manifest_path": manifest_path_p,
+            "manifest_writer": w,
+            "now": datetime.now(UTC),
+        }
+        if workers <= 1 or len(srcs) <= 1:
+            return [ingest_mu_file(s, **kw) for s in srcs]
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        out: list[IngestMuResult] = []
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            chunk = max(1, len(srcs) // (workers * 4))
+            fields_it = ex.map(read_mu_fields, srcs, chunksize=chunk)
+            for src, fields in zip(srcs, fields_it):
+                out.append(ingest_mu_file(src, mu_fields=fields, **kw))
+        return out
+
+
 def main(argv: list[str] | None = None) -> int:
     import argparse
 
@@ -148,32 +226,30 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--vault-id", default="default")
     ap.add_argument("--manifest", default=None)
     ap.add_argument("--copy-mode", choices=["copy2", "copy"], default="copy2")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes parsing MU files (0 = cpu count); manifest keeps input order",
+    )
     ns = ap.parse_args(argv)
 
     inp = Path(ns.inp)
     if not inp.exists():
         raise SystemExit(f"missing input: {inp}")
 
-    def iter_files(p: Path):
-        if p.is_file():
-            yield p
-        else:
-            for q in sorted(p.rglob("*.mimo")):
-                if q.is_file():
-                    yield q
-
-    count = 0
-    for f in iter_files(inp):
-        ingest_mu_file(
-            f,
-            vault_root=ns.vault_root,
-            vault_id=ns.vault_id,
-            copy_mode=ns.copy_mode,
-            manifest_path=ns.manifest,
-        )
-        count += 1
-
-    print(f"ingested_mu_files={count}")
+    from tools.fs_walk import sorted_files
+
+    res = ingest_mu_files(
+        [inp] if inp.is_file() else sorted_files(inp, ".mimo"),
+        vault_root=ns.vault_root,
+        vault_id=ns.vault_id,
+        copy_mode=ns.copy_mode,
+        manifest_path=ns.manifest,
+        workers=ns.workers if ns.workers > 0 else (os.cpu_count() or 1),
+    )
+
+    print(f"ingested_mu_files={len(res)}")
     return 0
 
 
@@ -14,21 +14,89 @@ Design notes:
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
+import shutil
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
 
 from .vault_uri import parse_vault_uri
 
+# Files up to this size are hashed from an mmap in a single update() call
+# (no per-chunk Python loop; OpenSSL streams the mapping with the GIL released).
+# Larger or unmappable files are read into one reused buffer.
+_MMAP_HASH_MAX_BYTES = 1024 * 1024 * 1024
+# Below this, one read() is cheaper than setting up a mapping (typical MU files).
+_READ_HASH_MAX_BYTES = 64 * 1024
+_HASH_BUF_BYTES = 1024 * 1024
+_MADV_SEQUENTIAL = getattr(mmap, "MADV_SEQUENTIAL", None)
+# Linux-only; absent elsewhere (copies then go through shutil.copyfile).
+_COPY_FILE_RANGE = getattr(os, "copy_file_range", None)
+
 
 def sha256_file(path: Path) -> str:
     h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+        size = os.fstat(f.fileno()).st_size
+        if 0 < size <= _READ_HASH_MAX_BYTES:
+            h.update(f.read())
+            return "sha256:" + h.hexdigest()
+        if 0 < size <= _MMAP_HASH_MAX_BYTES:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if _MADV_SEQUENTIAL is not None:  # read-ahead; not on Windows
+                        mm.madvise(_MADV_SEQUENTIAL)
+                    h.update(mm)
+                return "sha256:" + h.hexdigest()
+            except (OSError, ValueError):  # not mappable (e.g. special file)
+                pass
+        buf = bytearray(_HASH_BUF_BYTES)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
     return "sha256:" + h.hexdigest()
 
 
+def copy_file(src: Path, dst: Path, *, copy_stat: bool = True) -> None:
+    """shutil.copy2 (copy_stat=True) or shutil.copy (False) for file -> file.
+
+    The data goes through copy_file_range() when possible: the kernel copies it
+    without a userspace round trip and clones extents on reflink filesystems
+    (btrfs, xfs). Otherwise shutil.copyfile (sendfile on Linux) does the copy.
+    """
+    if not _copy_file_range(src, dst):
+        shutil.copyfile(src, dst)
+    if copy_stat:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copymode(src, dst)
+
+
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """Copy via copy_file_range(); False if unsupported (nothing copied yet)."""
+    if _COPY_FILE_RANGE is None:
+        return False
+    with open(src, "rb") as fsrc:
+        size = os.fstat(fsrc.fileno()).st_size
+        if size == 0:  # empty, or a special file reporting 0 (e.g. procfs)
+            return False
+        blocksize = min(max(size, 8 * 1024 * 1024), 1024 * 1024 * 1024)
+        with open(dst, "wb") as fdst:
+            copied = 0
+            while True:
+                try:
+                    n = _COPY_FILE_RANGE(fsrc.fileno(), fdst.fileno(), blocksize)
+                except OSError:
+                    if copied == 0:  # EXDEV/ENOSYS/EINVAL...: copyfile truncates dst
+                        return False
+                    raise
+                if n == 0:
+                    # some filesystems report 0 rather than an error
+                    return copied > 0
+                copied += n
+
+
 def resolve_vault_uri_to_path(uri: str, *, vault_roots: dict[str, str]) -> Path:
     vu = parse_vault_uri(uri)
     root = vault_roots.get(vu.vault_id)
@@ -87,14 +155,31 @@ def verify_manifest_records(
     return errors
 
 
+def build_sha256_index(manifest_records: Iterable[dict]) -> dict[str, str]:
+    """Map sha256 -> uri over manifest records (first record with a uri wins)."""
+    index: dict[str, str] = {}
+    for rec in manifest_records:
+        s = rec.get("sha256")
+        u = rec.get("uri")
+        if isinstance(s, str) and isinstance(u, str) and s not in index:
+            index[s] = u
+    return index
+
+
 def repair_uri_by_sha256(
     *,
     sha256: str,
-    manifest_records: Iterable[dict],
+    manifest_records: Iterable[dict] | Mapping[str, str],
 ) -> str | None:
-    """Return a suggested URI for a given sha256 by searching manifest records."""
+    """Return a suggested URI for a given sha256.
+
+    `manifest_records` is either an iterable of manifest records (scanned) or a
+    prebuilt sha256 -> uri index (see build_sha256_index), looked up directly.
+    """
     if not isinstance(sha256, str):
         return None
+    if isinstance(manifest_records, Mapping):
+        return manifest_records.get(sha256)
     for rec in manifest_records:
         if rec.get("sha256") == sha256:
             uri = rec.get("uri")
@@ -112,13 +197,7 @@ def repair_suggestions_for_missing(
     """For records whose uri cannot be resolved to an existing local file, suggest a new uri by sha256 lookup."""
     suggestions: list[RepairSuggestion] = []
 
-    # Pre-index manifest by sha256
-    index: dict[str, str] = {}
-    for rec in manifest_records:
-        s = rec.get("sha256")
-        u = rec.get("uri")
-        if isinstance(s, str) and isinstance(u, str) and s not in index:
-            index[s] = u
+    index = build_sha256_index(manifest_records)
 
     for rec in records:
         uri = rec.get("uri")
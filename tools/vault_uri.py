@@ -17,6 +17,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
+VAULT_URI_PREFIX = "vault://"
+
 ALLOWED_KINDS = {"raw", "mu", "assets", "manifests", "logs", "derived"}
 
 
@@ -31,6 +33,18 @@ class VaultUri:
 
 
 def parse_vault_uri(uri: str) -> VaultUri:
+    # Canonical form (no empty segments, no trailing slash): a single bounded
+    # split, no filter/join. Anything else takes the general parser below.
+    if (
+        isinstance(uri, str)
+        and uri.startswith(VAULT_URI_PREFIX)
+        and "//" not in uri[8:]
+        and not uri.endswith("/")
+    ):
+        parts = uri[8:].split("/", 2)
+        if len(parts) == 3 and parts[0] and parts[1] in ALLOWED_KINDS:
+            return VaultUri(vault_id=parts[0], kind=parts[1], path=parts[2])
+
     if not isinstance(uri, str) or not uri.startswith("vault://"):
         raise ValueError(f"not a vault uri: {uri!r}")
 
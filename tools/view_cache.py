@@ -3,11 +3,11 @@
 A view is a cached, reusable rendering of some scope/template over a set of MU ids.
 
 Key idea: avoid stale/hallucinated cache by recording dependencies:
-- source_mu_ids
+- source_mu_ids (also kept in view_deps, indexed by mu_id)
 - optional source_mu_hash (future)
 
 We implement minimal operations:
-- put_view
+- put_view / put_views (batch, one transaction)
 - get_view
 - invalidate_by_mu_ids
 
@@ -17,12 +17,19 @@ from __future__ import annotations
 
 import hashlib
 import json
+import zlib
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from tools.json_io import dumps_text, loads_bytes
 from tools.meta_db import connect, init_db
 
+# Content JSON at least this large is stored zlib-compressed in content_blob
+# (codec "zlib+json"); smaller content stays inline in content_json.
+COMPRESS_MIN_BYTES = 4096
+
 
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -45,8 +52,7 @@ class ViewRecord:
     content: dict
 
 
-def put_view(
-    db_path: Path,
+def _view_row(
     *,
     view_id: str,
     template: str,
@@ -54,14 +60,22 @@ def put_view(
     source_mu_ids: list[str],
     content: dict,
     expires_at: str | None = None,
-) -> None:
-    init_db(db_path)
-
+) -> dict:
+    # stdlib layout kept: source_mu_hash is derived from this exact text
     scope_json = json.dumps(scope, ensure_ascii=False, sort_keys=True)
     src_json = json.dumps(sorted(source_mu_ids), ensure_ascii=False)
     source_mu_hash = sha256_text(scope_json + "|" + src_json)
 
-    row = {
+    content_json = dumps_text(content)
+    content_blob = None
+    content_codec = None
+    raw = content_json.encode("utf-8")  # threshold is in bytes, not characters
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        content_blob = zlib.compress(raw)
+        content_codec = "zlib+json"
+        content_json = ""
+
+    return {
         "view_id": view_id,
         "template": template,
         "scope_json": scope_json,
@@ -70,27 +84,72 @@ def put_view(
         "created_at": utc_now(),
         "expires_at": expires_at,
         "stale": 0,
-        "content_json": json.dumps(content, ensure_ascii=False),
+        "content_json": content_json,
+        "content_blob": content_blob,
+        "content_codec": content_codec,
     }
 
+
+def put_views(db_path: Path, views: Iterable[dict]) -> None:
+    """put_view for many views (each a dict of put_view's keyword args).
+
+    All rows and their view_deps go in one transaction (one WAL commit).
+    """
+    init_db(db_path)
+    views = list(views)
+    rows = [_view_row(**v) for v in views]
+    # a view_id repeated in the batch keeps its last deps, as with put_view calls
+    deps_by_view = {v["view_id"]: set(v["source_mu_ids"]) for v in views}
     with connect(db_path) as conn:
-        conn.execute(
+        conn.executemany(
             """
             INSERT OR REPLACE INTO view_cache
-              (view_id, template, scope_json, source_mu_ids_json, source_mu_hash, created_at, expires_at, stale, content_json)
+              (view_id, template, scope_json, source_mu_ids_json, source_mu_hash, created_at, expires_at, stale, content_json, content_blob, content_codec)
             VALUES
-              (:view_id, :template, :scope_json, :source_mu_ids_json, :source_mu_hash, :created_at, :expires_at, :stale, :content_json)
+              (:view_id, :template, :scope_json, :source_mu_ids_json, :source_mu_hash, :created_at, :expires_at, :stale, :content_json, :content_blob, :content_codec)
             """,
-            row,
+            rows,
+        )
+        conn.executemany(
+            "DELETE FROM view_deps WHERE view_id=?", [(vid,) for vid in deps_by_view]
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO view_deps (view_id, mu_id) VALUES (?, ?)",
+            [(vid, m) for vid, mus in deps_by_view.items() for m in mus],
         )
         conn.commit()
 
 
+def put_view(
+    db_path: Path,
+    *,
+    view_id: str,
+    template: str,
+    scope: dict,
+    source_mu_ids: list[str],
+    content: dict,
+    expires_at: str | None = None,
+) -> None:
+    put_views(
+        db_path,
+        [
+            {
+                "view_id": view_id,
+                "template": template,
+                "scope": scope,
+                "source_mu_ids": source_mu_ids,
+                "content": content,
+                "expires_at": expires_at,
+            }
+        ],
+    )
+
+
 def get_view(db_path: Path, view_id: str) -> ViewRecord | None:
     init_db(db_path)
     with connect(db_path) as conn:
         r = conn.execute(
-            "SELECT view_id, template, scope_json, source_mu_ids_json, created_at, expires_at, stale, content_json FROM view_cache WHERE view_id=?",
+            "SELECT view_id, template, scope_json, source_mu_ids_json, created_at, expires_at, stale, content_json, content_blob, content_codec FROM view_cache WHERE view_id=?",
             (view_id,),
         ).fetchone()
     if not r:
@@ -98,19 +157,28 @@ def get_view(db_path: Path, view_id: str) -> ViewRecord | None:
     return ViewRecord(
         view_id=r[0],
         template=r[1],
-        scope=json.loads(r[2]),
-        source_mu_ids=json.loads(r[3]),
+        scope=loads_bytes(r[2]),
+        source_mu_ids=loads_bytes(r[3]),
         created_at=r[4],
         expires_at=r[5],
         stale=bool(r[6]),
-        content=json.loads(r[7]),
+        content=_load_content(r[7], r[8], r[9]),
     )
 
 
+def _load_content(content_json: str, blob: bytes | None, codec: str | None) -> dict:
+    if codec is None:
+        return loads_bytes(content_json)
+    if codec == "zlib+json":
+        return loads_bytes(zlib.decompress(blob))
+    raise ValueError(f"unknown view content codec: {codec}")
+
+
 def invalidate_by_mu_ids(db_path: Path, changed_mu_ids: list[str]) -> int:
     """Mark views stale if their dependency set intersects changed_mu_ids.
 
-    v0.1 implementation: brute-force scan.
+    One UPDATE probing view_deps by mu_id; the changed ids are bound as a
+    single JSON array, so there is no per-id placeholder limit.
     """
 
     init_db(db_path)
@@ -118,22 +186,20 @@ def invalidate_by_mu_ids(db_path: Path, changed_mu_ids: list[str]) -> int:
     if not changed:
         return 0
 
-    to_stale: list[str] = []
     with connect(db_path) as conn:
-        rows = conn.execute(
-            "SELECT view_id, source_mu_ids_json FROM view_cache WHERE stale=0"
-        ).fetchall()
-        for r in rows:
-            view_id = r[0]
-            deps = set(json.loads(r[1]))
-            if deps & changed:
-                to_stale.append(view_id)
-
-        for vid in to_stale:
-            conn.execute("UPDATE view_cache SET stale=1 WHERE view_id=?", (vid,))
+        cur = conn.execute(
+            """
+            UPDATE view_cache SET stale=1
+            WHERE stale=0 AND view_id IN (
+              SELECT view_id FROM view_deps
+              WHERE mu_id IN (SELECT value FROM json_each(?))
+            )
+            """,
+            (json.dumps(list(changed), ensure_ascii=False),),
+        )
         conn.commit()
 
-    return len(to_stale)
+    return cur.rowcount
 
 
 def main(argv: list[str] | None = None) -> int: